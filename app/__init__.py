@@ -1,28 +1,29 @@
 """
 SEI Agent Application
 
-This module initializes all components of the SEI Agent application.
+Importing the package is cheap: components are loaded on first attribute
+access and logging is configured by ``create_app``, not at import time.
 """
 
-from .config.settings import settings
-from .utils.logging import setup_logging
-from .utils.exceptions import AppException
-from .middleware.base import BaseMiddleware
-from .middleware.security import SecurityMiddleware
-from .services.twitter import TwitterService
-from .services.blockchain import BlockchainService
+import importlib
 
 __version__ = "1.0.0"
 
-# Initialize logging
-setup_logging()
+# Export commonly used components, resolved lazily
+_EXPORTS = {
+    "settings": ".config.settings",
+    "AppException": ".utils.exceptions",
+    "BaseMiddleware": ".middleware.base",
+    "SecurityMiddleware": ".middleware.security",
+    "TwitterService": ".services.twitter",
+    "BlockchainService": ".services.blockchain",
+}
 
-# Export commonly used components
-__all__ = [
-    "settings",
-    "AppException",
-    "BaseMiddleware",
-    "SecurityMiddleware",
-    "TwitterService",
-    "BlockchainService",
-] 
\ No newline at end of file
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,14 +1,20 @@
-import requests
-from typing import Dict, List
+from typing import Dict, List, Optional
+import asyncio
 import logging
-from bs4 import BeautifulSoup
-import json
+from utils.docs_index import DocsIndex, corpus_fingerprint, load_markdown_corpus
 
 class SEIKnowledgeBase:
-    def __init__(self):
+    def __init__(
+        self,
+        docs_index_path: str = "data/docs_index",
+        docs_corpus_path: str = "data/sei_docs"
+    ):
         self.logger = logging.getLogger(__name__)
-        # Cache for documentation
-        self.doc_cache = {}
+        # Local full-text index over the docs snapshot (scripts/build_docs_index.py)
+        self.docs_index_path = docs_index_path
+        self.docs_corpus_path = docs_corpus_path
+        self.docs_index: Optional[DocsIndex] = None
+        self._docs_index_lock = asyncio.Lock()
         
         # Eliza-inspired response patterns
         self.conversation_patterns = {
@@ -94,30 +100,54 @@ class SEIKnowledgeBase:
         }
 
     async def fetch_sei_docs(self, topic: str) -> str:
-        """Fetch and cache SEI documentation"""
-        if topic in self.doc_cache:
-            return self.doc_cache[topic]
-
+        """Search the local SEI documentation index"""
         try:
-            # Base URL for SEI docs
-            base_url = "https://docs.sei.io"
-            
-            # Example of fetching and parsing documentation
-            response = requests.get(f"{base_url}/api/search?query={topic}")
-            if response.status_code == 200:
-                content = response.json()
-                
-                # Process and cache the content
-                processed_content = self._process_doc_content(content)
-                self.doc_cache[topic] = processed_content
-                return processed_content
-            
+            index = await self._get_docs_index()
+            hits = index.search(topic)
+            if hits:
+                return self._process_doc_content({'hits': hits})
+
             return "I couldn't find specific documentation for that topic."
-            
+
         except Exception as e:
-            self.logger.error(f"Error fetching docs: {e}")
+            self.logger.error(f"Error searching docs: {e}")
             return "Sorry, I'm having trouble accessing the documentation right now."
 
+    async def _get_docs_index(self) -> DocsIndex:
+        """Open the docs index once, building it from the corpus if missing"""
+        if self.docs_index is None:
+            async with self._docs_index_lock:
+                if self.docs_index is None:
+                    self.docs_index = await asyncio.to_thread(self._load_docs_index)
+        return self.docs_index
+
+    def _load_docs_index(self) -> DocsIndex:
+        fingerprint = corpus_fingerprint(self.docs_corpus_path)
+        try:
+            index = DocsIndex.open(self.docs_index_path)
+        except FileNotFoundError:
+            self.logger.info(f"No docs index at {self.docs_index_path}; building from {self.docs_corpus_path}")
+            index = self._build_docs_index(fingerprint)
+        except ValueError as e:
+            self.logger.warning(f"{e}; rebuilding from {self.docs_corpus_path}")
+            index = self._build_docs_index(fingerprint)
+        else:
+            # Without a local corpus the shipped index is all there is
+            if fingerprint is not None and index.corpus_fingerprint != fingerprint:
+                self.logger.info(f"Docs corpus at {self.docs_corpus_path} changed; rebuilding index")
+                index.close()
+                index = self._build_docs_index(fingerprint)
+        self.logger.info(f"Opened docs index with {len(index)} passages")
+        return index
+
+    def _build_docs_index(self, fingerprint: Optional[str]) -> DocsIndex:
+        passages = load_markdown_corpus(self.docs_corpus_path)
+        if not passages:
+            # Saving an empty index would stop it from ever being rebuilt
+            raise FileNotFoundError(f"No Markdown documents found under {self.docs_corpus_path}")
+        DocsIndex.build(passages).save(self.docs_index_path, corpus_fingerprint=fingerprint)
+        return DocsIndex.open(self.docs_index_path)
+
     async def get_protocol_info(self, protocol_name: str) -> Dict:
         """Get detailed protocol information and live metrics"""
         try:
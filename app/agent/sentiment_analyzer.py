@@ -1,21 +1,100 @@
 from transformers import pipeline
-from typing import Dict, List
+from typing import Dict, List, Optional
+from pathlib import Path
 import logging
+import os
+import shutil
+from utils.sentiment_cache import SentimentCache
+
+MODEL_ID = "ProsusAI/finbert"
+BACKENDS = ("pytorch", "int8", "onnx")
 
 class SentimentAnalyzer:
-    def __init__(self):
+    """
+    FinBERT sentiment scorer with a selectable CPU inference backend.
+
+    Backends:
+        pytorch: full-precision model through transformers (reference)
+        int8: the same model with dynamically int8-quantized Linear layers
+        onnx: ONNX Runtime session (requires ``optimum[onnxruntime]``). The
+            model is exported to ``onnx_dir`` on first use and loaded from
+            there afterwards.
+    """
+
+    def __init__(
+        self,
+        backend: str = "pytorch",
+        cache: Optional[SentimentCache] = None,
+        onnx_dir: str = "data/sentiment_onnx"
+    ):
         self.logger = logging.getLogger(__name__)
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown sentiment backend '{backend}', expected one of {BACKENDS}")
+        self.backend = backend
+        self.onnx_dir = Path(onnx_dir)
+        # Repeated texts (retweets, overlapping searches) are served from here.
+        # Backends can disagree slightly, so each one gets its own entries.
+        self.cache = cache or SentimentCache(f"{MODEL_ID}:{backend}")
         try:
             # Using FinBERT, which is specifically trained for financial text
-            self.analyzer = pipeline(
-                "sentiment-analysis",
-                model="ProsusAI/finbert",
-                max_length=512
-            )
+            self.analyzer = self._load_pipeline(backend)
         except Exception as e:
             self.logger.error(f"Error initializing sentiment analyzer: {str(e)}")
             raise
 
+    def _load_pipeline(self, backend: str):
+        if backend == "pytorch":
+            return pipeline(
+                "sentiment-analysis",
+                model=MODEL_ID,
+                max_length=512
+            )
+
+        from transformers import AutoTokenizer
+        tokenizer = AutoTokenizer.from_pretrained(MODEL_ID)
+
+        if backend == "int8":
+            import torch
+            from transformers import AutoModelForSequenceClassification
+            model = AutoModelForSequenceClassification.from_pretrained(MODEL_ID)
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        else:
+            model = self._load_onnx_model()
+
+        return pipeline(
+            "sentiment-analysis",
+            model=model,
+            tokenizer=tokenizer,
+            max_length=512
+        )
+
+    def _load_onnx_model(self):
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+        except ImportError as e:
+            raise ImportError(
+                "The onnx sentiment backend requires optimum[onnxruntime]"
+            ) from e
+
+        if (self.onnx_dir / "model.onnx").exists():
+            return ORTModelForSequenceClassification.from_pretrained(self.onnx_dir)
+
+        # Export once; later starts load the saved session. Writing to a
+        # scratch directory first keeps a half-written export from being loaded.
+        self.logger.info(f"Exporting {MODEL_ID} to ONNX in {self.onnx_dir}")
+        model = ORTModelForSequenceClassification.from_pretrained(MODEL_ID, export=True)
+        scratch = self.onnx_dir.with_name(f"{self.onnx_dir.name}.tmp-{os.getpid()}")
+        try:
+            model.save_pretrained(scratch)
+            self.onnx_dir.parent.mkdir(parents=True, exist_ok=True)
+            os.rename(scratch, self.onnx_dir)
+        except OSError as e:
+            # Another process finished its export first; theirs is as good
+            self.logger.warning(f"Could not save ONNX export to {self.onnx_dir}: {str(e)}")
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+        return model
+
     def analyze_text(self, text: str) -> Dict:
         """
         Analyze the sentiment of a given text
@@ -27,11 +106,7 @@ class SentimentAnalyzer:
             Dict: Sentiment analysis result
         """
         try:
-            result = self.analyzer(text)[0]
-            return {
-                'label': result['label'],
-                'score': result['score']
-            }
+            return self.cache.score(text, self._score_text)
         except Exception as e:
             self.logger.error(f"Error analyzing sentiment: {str(e)}")
             return {'label': 'neutral', 'score': 0.0}
@@ -47,8 +122,19 @@ class SentimentAnalyzer:
             List[Dict]: List of sentiment analysis results
         """
         try:
-            results = self.analyzer(texts)
-            return [{'label': r['label'], 'score': r['score']} for r in results]
+            return self.cache.score_many(texts, self._score_batch)
         except Exception as e:
             self.logger.error(f"Error analyzing batch sentiment: {str(e)}")
-            return [{'label': 'neutral', 'score': 0.0} for _ in texts] 
\ No newline at end of file
+            return [{'label': 'neutral', 'score': 0.0} for _ in texts]
+
+    def _score_text(self, text: str) -> Dict:
+        result = self.analyzer(text)[0]
+        return {
+            'label': result['label'],
+            'score': result['score']
+        }
+
+    def _score_batch(self, texts: List[str]) -> List[Dict]:
+        # One padded forward pass per batch instead of one per text
+        results = self.analyzer(texts, batch_size=len(texts) or 1, truncation=True)
+        return [{'label': r['label'], 'score': r['score']} for r in results]
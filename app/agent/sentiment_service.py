@@ -0,0 +1,187 @@
+import asyncio
+import logging
+import os
+from concurrent.futures import BrokenExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .sentiment_analyzer import SentimentAnalyzer
+
+
+class SentimentService:
+    """
+    Async front end for SentimentAnalyzer that micro-batches requests.
+
+    Concurrent callers enqueue texts and get futures back. A collector task
+    groups queued texts into batches of up to ``max_batch_size``, waiting at
+    most ``max_wait_ms`` after the first text for more to arrive, and runs
+    each batch on a single dedicated inference thread. While one batch is
+    being scored the next one fills up, so batch size grows with load and
+    the event loop never blocks on the model.
+
+    A batch that fails fails its callers' futures. If the model failed to
+    load, the inference thread is replaced so the next batch retries it.
+    """
+
+    def __init__(
+        self,
+        analyzer_factory: Optional[Callable[[], "SentimentAnalyzer"]] = None,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 10.0,
+        max_queue_size: int = 1024,
+        torch_threads: Optional[int] = None
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.analyzer_factory = analyzer_factory
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_queue_size = max_queue_size
+        self.torch_threads = torch_threads or os.cpu_count() or 1
+
+        self.analyzer: Optional["SentimentAnalyzer"] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.batches = 0
+        self.texts = 0
+
+    async def start(self):
+        """Start the inference thread and the batch collector"""
+        if self._collector and not self._collector.done():
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._executor = self._new_executor()
+        self._collector = asyncio.create_task(self._collect())
+
+    async def warm_up(self):
+        """Start the service and load the model on the inference thread"""
+        await self.start()
+        # The first task submitted to the executor runs _init_worker
+        await self._run_in_executor(lambda: None)
+
+    async def stop(self):
+        """Stop collecting, fail queued requests and release the inference thread"""
+        if self._collector:
+            self._collector.cancel()
+            try:
+                await self._collector
+            except asyncio.CancelledError:
+                pass
+            self._collector = None
+
+        while self._queue and not self._queue.empty():
+            self._fail([self._queue.get_nowait()])
+
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def submit(self, text: str) -> asyncio.Future:
+        """Queue a text for scoring and return a future for its result"""
+        if self._collector is None:
+            await self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return future
+
+    async def analyze(self, text: str) -> Dict:
+        """Score a single text"""
+        return await (await self.submit(text))
+
+    async def analyze_batch(self, texts: List[str]) -> List[Dict]:
+        """Score several texts; they may be batched with other callers' texts"""
+        futures = [await self.submit(text) for text in texts]
+        return list(await asyncio.gather(*futures))
+
+    def get_stats(self) -> Dict:
+        return {
+            'batches': self.batches,
+            'texts': self.texts,
+            'avg_batch_size': round(self.texts / self.batches, 2) if self.batches else 0.0,
+            'queued': self._queue.qsize() if self._queue else 0
+        }
+
+    def _init_worker(self):
+        """Runs once on the inference thread: tune torch and load the model"""
+        try:
+            import torch
+            torch.set_num_threads(self.torch_threads)
+        except ImportError:
+            pass
+        if self.analyzer_factory is None:
+            # Imported here so transformers is only loaded on the inference thread
+            from .sentiment_analyzer import SentimentAnalyzer
+            self.analyzer_factory = SentimentAnalyzer
+        self.analyzer = self.analyzer_factory()
+
+    def _run_batch(self, texts: List[str]) -> List[Dict]:
+        return self.analyzer.analyze_batch(texts)
+
+    def _new_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="sentiment-inference",
+            initializer=self._init_worker
+        )
+
+    async def _run_in_executor(self, func: Callable, *args):
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        except BrokenExecutor:
+            # _init_worker failed and the pool refuses all work; a new
+            # thread loads the model again on its first task
+            self._executor.shutdown(wait=False)
+            self._executor = self._new_executor()
+            raise
+
+    @staticmethod
+    def _fail(requests: List[Tuple[str, asyncio.Future]]):
+        for _, future in requests:
+            if not future.done():
+                future.set_exception(RuntimeError("Sentiment service stopped"))
+
+    async def _next_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        """Wait for one request, then gather more into ``batch`` until it is full or max_wait passes"""
+        loop = asyncio.get_running_loop()
+        batch.append(await self._queue.get())
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+    async def _collect(self):
+        batch: List[Tuple[str, asyncio.Future]] = []
+        try:
+            while True:
+                batch = []
+                await self._next_batch(batch)
+                # Skip requests whose callers have already given up
+                batch = [(text, future) for text, future in batch if not future.cancelled()]
+                if not batch:
+                    continue
+
+                texts = [text for text, _ in batch]
+                try:
+                    results = await self._run_in_executor(self._run_batch, texts)
+                except Exception as e:
+                    self.logger.error(f"Error running sentiment batch: {str(e)}")
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                self.batches += 1
+                self.texts += len(texts)
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+        except asyncio.CancelledError:
+            # Requests already taken off the queue are not drained by stop()
+            self._fail(batch)
+            raise
@@ -1,16 +1,22 @@
-import snscrape.modules.twitter as sntwitter
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+import json
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from utils.mention_store import MentionIngestor, MentionStore
+from utils.trend_window import TrendAggregator
 
 class SEITrendAnalyzer:
-    def __init__(self):
-        # SEI-specific keywords
-        self.tracked_keywords = [
+    def __init__(self, mention_store: Optional[MentionStore] = None):
+        # SEI-specific keywords; the default set when a request names none.
+        # A tuple so callers cannot change what other requests analyze
+        self.tracked_keywords = (
             "SEI", "SEI Network", "SEINetwork",
             "SEI NFT", "SEI DeFi", "$SEI",
             "SEI Protocol", "SEI Ecosystem"
-        ]
+        )
+        # Caller-supplied keywords each cost a scrape and trend windows
+        self.max_keywords = 10
+        self.max_keyword_length = 64
         
         # SEI-specific NFT collections on Magic Eden
         self.sei_collections = [
@@ -26,6 +32,17 @@ class SEITrendAnalyzer:
         ]
         
         self.logger = logging.getLogger(__name__)
+        
+        # Local mention store fed incrementally per keyword; new mentions
+        # also stream into bucketed trend windows
+        self.mention_store = mention_store or MentionStore()
+        self.trend_aggregator = TrendAggregator()
+        self.mention_ingestor = MentionIngestor(
+            self.mention_store,
+            self._search_keyword,
+            source="snscrape",
+            on_new=self._aggregate_mentions
+        )
 
     def analyze_sei_trends(self, hours_back: int = 24) -> Dict:
         """Analyze SEI-specific trends"""
@@ -74,74 +91,103 @@ class SEITrendAnalyzer:
             self.logger.error(f"Error generating tweet: {str(e)}")
             return "🔥 SEI Network is buzzing! Check out the latest updates. #SEI #Crypto"
 
-    def analyze_social_trends(self, hours_back: int = 24) -> Dict:
+    def normalize_keywords(self, keywords: Optional[Iterable[str]] = None) -> Tuple[str, ...]:
+        """
+        Canonical, sorted keyword set for a request.
+
+        Whitespace is collapsed and case is folded, so spellings of one
+        keyword share mention cursors and trend windows; a keyword matching
+        a tracked one is spelled like the tracked one.
+
+        Raises:
+            ValueError: If there are more than ``max_keywords`` keywords or
+                one is longer than ``max_keyword_length``
+        """
+        if not keywords:
+            return tuple(sorted(self.tracked_keywords, key=str.casefold))
+
+        tracked = {keyword.casefold(): keyword for keyword in self.tracked_keywords}
+        normalized = {}
+        for keyword in keywords:
+            keyword = " ".join(keyword.split())
+            if len(keyword) > self.max_keyword_length:
+                raise ValueError(f"Keywords are limited to {self.max_keyword_length} characters")
+            if keyword:
+                folded = keyword.casefold()
+                normalized[folded] = tracked.get(folded, folded)
+        if len(normalized) > self.max_keywords:
+            raise ValueError(f"At most {self.max_keywords} keywords can be analyzed at once")
+        return tuple(normalized[folded] for folded in sorted(normalized))
+
+    @staticmethod
+    def cache_key(hours_back: int, keywords: Tuple[str, ...]) -> str:
+        """Cache key for a request's window and normalized keywords"""
+        # JSON keeps keywords containing separators from colliding
+        return f"{hours_back}:{json.dumps(keywords)}"
+
+    def analyze_social_trends(self, hours_back: int = 24, keywords: Optional[Iterable[str]] = None) -> Dict:
         """
         Analyze recent social media trends for crypto-related topics
         
         Args:
             hours_back (int): Hours of historical data to analyze
+            keywords (Iterable[str]): Keywords to analyze; defaults to the tracked keywords
             
         Returns:
             Dict: Analyzed trends for each keyword
         """
         try:
-            trends = {}
-            since_time = datetime.now() - timedelta(hours=hours_back)
+            keywords = self.normalize_keywords(keywords)
+            self._load_aggregates(keywords)
             
-            for keyword in self.tracked_keywords:
-                query = f"{keyword} since:{since_time.strftime('%Y-%m-%d')}"
-                tweets = sntwitter.TwitterSearchScraper(query).get_items()
-                
-                mentions = self._collect_mentions(tweets)
-                trends[keyword] = self._process_mentions(mentions)
-                
-            return trends
+            # Only tweets newer than each keyword's cursor are scraped
+            self.mention_ingestor.ingest(keywords, window=timedelta(hours=hours_back))
+            
+            return {
+                keyword: self.trend_aggregator.query(keyword, hours_back * 3600)
+                for keyword in keywords
+            }
             
         except Exception as e:
             self.logger.error(f"Error analyzing trends: {str(e)}")
             return {}
     
-    def _collect_mentions(self, tweets) -> List[Dict]:
-        """Collect and structure tweet data"""
-        mentions = []
-        try:
-            for tweet in list(tweets)[:100]:
-                mentions.append({
-                    'text': tweet.content,
-                    'date': tweet.date,
-                    'engagement': tweet.likeCount + tweet.retweetCount,
-                    'sentiment': None  # Will be filled by sentiment analyzer
-                })
-        except Exception as e:
-            self.logger.error(f"Error collecting mentions: {str(e)}")
+    def _search_keyword(self, keyword: str, since_id: Optional[int], since: datetime) -> List[Dict]:
+        """Scrape tweets newer than since_id, or created after since on the first run"""
+        import snscrape.modules.twitter as sntwitter
+        if since_id is not None:
+            query = f"{keyword} since_id:{since_id}"
+        else:
+            query = f"{keyword} since:{since.strftime('%Y-%m-%d')}"
+        tweets = sntwitter.TwitterSearchScraper(query).get_items()
         
+        # Drained in full: the cursor moves to the newest tweet, so stopping
+        # early would skip the older new ones for good
+        mentions = []
+        for tweet in tweets:
+            if since_id is None and tweet.date < since:
+                # Results are newest first; since: only filters by day
+                break
+            mentions.append({
+                'id': tweet.id,
+                'text': tweet.content,
+                'user': tweet.user.username,
+                'created_at': tweet.date,
+                'retweets': tweet.retweetCount,
+                'likes': tweet.likeCount
+            })
         return mentions
     
-    def _process_mentions(self, mentions: List[Dict]) -> Optional[Dict]:
-        """Process collected mentions to identify trends"""
-        if not mentions:
-            return None
-            
-        try:
-            total_engagement = sum(mention['engagement'] for mention in mentions)
-            avg_engagement = total_engagement / len(mentions)
-            
-            # Calculate hourly mention velocity
-            mention_times = [mention['date'] for mention in mentions]
-            time_range = max(mention_times) - min(mention_times)
-            mentions_per_hour = len(mentions) / (time_range.total_seconds() / 3600)
-            
-            return {
-                'mention_count': len(mentions),
-                'avg_engagement': avg_engagement,
-                'mentions_per_hour': mentions_per_hour,
-                'sentiment_distribution': {
-                    'positive': 0,  # Will be updated by sentiment analyzer
-                    'neutral': 0,
-                    'negative': 0
-                }
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error processing mentions: {str(e)}")
-            return None 
\ No newline at end of file
+    def _load_aggregates(self, keywords: Iterable[str]):
+        """Seed trend windows from the store for keywords that have none (new or evicted)"""
+        since = datetime.now(timezone.utc) - timedelta(days=7)
+        for keyword in keywords:
+            self.trend_aggregator.track(
+                keyword,
+                lambda keyword=keyword: self.mention_store.query(since=since, keywords=[keyword])
+            )
+
+    def _aggregate_mentions(self, keyword: str, mentions: List[Dict]):
+        # New mentions are stored before this runs, so an evicted keyword's
+        # are counted when it is next seeded rather than starting empty windows
+        self.trend_aggregator.add_many(keyword, mentions, create=False)
@@ -1,12 +1,17 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import List
+from typing import AsyncIterator, List
 import logging
+from utils.sse import Event, sse_response
 from ..agent.knowledge_base import SEIKnowledgeBase
+from ..config.settings import settings
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
-knowledge_base = SEIKnowledgeBase()
+knowledge_base = SEIKnowledgeBase(
+    docs_index_path=settings.DOCS_INDEX_PATH,
+    docs_corpus_path=settings.DOCS_CORPUS_PATH
+)
 
 class ChatMessage(BaseModel):
     user_message: str
@@ -39,6 +44,30 @@ async def chat_with_agent(message: ChatMessage):
         logger.error(f"Chat error: {str(e)}")
         raise HTTPException(status_code=500, detail="Error processing chat request")
 
+@router.post("/chat/stream")
+async def stream_chat_with_agent(message: ChatMessage):
+    """
+    Stream the chat reply as Server-Sent Events.
+
+    The pattern-matched reply is sent first, then suggested actions, then
+    documentation once it has been fetched, then ``done``.
+    """
+    return sse_response(_chat_events(message.user_message))
+
+async def _chat_events(user_message: str) -> AsyncIterator[Event]:
+    context_response = knowledge_base.get_contextual_response(user_message)
+    yield "response", {
+        "response": context_response['message'],
+        "response_type": context_response['response_type']
+    }
+    yield "suggested_actions", {
+        "suggested_actions": _generate_suggested_actions(context_response['response_type'])
+    }
+    if context_response['should_fetch_docs']:
+        yield "documentation", {
+            "documentation": await knowledge_base.fetch_sei_docs(user_message)
+        }
+
 def _generate_suggested_actions(context_type: str) -> List[str]:
     """Generate context-appropriate suggested actions"""
     actions = {
@@ -1,9 +1,12 @@
-from fastapi import FastAPI, HTTPException, Depends
+import asyncio
+from fastapi import FastAPI, HTTPException, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import List, Dict
-from ..agent.trend_analyzer import TrendAnalyzer
-from ..agent.sentiment_analyzer import SentimentAnalyzer
+from typing import List, Dict, Optional
+from utils.component_registry import ComponentRegistry
+from utils.materialized_view import MaterializedView
+from ..cache.protocol_cache import ProtocolCache
+from ..config.settings import settings
 
 app = FastAPI(title="Crypto Trend AI Agent")
 
@@ -16,39 +19,125 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize analyzers
-trend_analyzer = TrendAnalyzer()
-sentiment_analyzer = SentimentAnalyzer()
+# Analyzers are built on first use (or by the startup warm-up), not at import
+components = ComponentRegistry()
+
+def _build_trend_analyzer():
+    from ..agent.trend_analyzer import SEITrendAnalyzer
+    return SEITrendAnalyzer()
+
+def _build_sentiment_service():
+    from ..agent.sentiment_analyzer import SentimentAnalyzer
+    from ..agent.sentiment_service import SentimentService
+    return SentimentService(
+        analyzer_factory=lambda: SentimentAnalyzer(
+            backend=settings.SENTIMENT_BACKEND,
+            onnx_dir=settings.SENTIMENT_ONNX_DIR
+        )
+    )
+
+async def _build_trending_topics() -> Dict:
+    # Incremental: only tweets newer than each keyword's cursor are scraped
+    trends = await asyncio.to_thread(components.get("trend_analyzer").analyze_social_trends)
+    # Sort topics by mention count
+    sorted_trends = sorted(
+        trends.items(),
+        key=lambda x: x[1]['mention_count'] if x[1] else 0,
+        reverse=True
+    )
+    return {"trending_topics": sorted_trends[:5]}
+
+components.register("trend_analyzer", _build_trend_analyzer)
+# Trend results keyed by normalized keyword set and window; concurrent
+# identical requests share one computation
+components.register(
+    "trend_cache",
+    ProtocolCache,
+    warmup=lambda cache: cache.start_sweeper(),
+    shutdown=lambda cache: cache.stop_sweeper()
+)
+components.register(
+    "trending_view",
+    lambda: MaterializedView("trending_topics", _build_trending_topics),
+    warmup=lambda view: view.start(settings.TRENDING_REFRESH_INTERVAL),
+    shutdown=lambda view: view.stop()
+)
+components.register(
+    "sentiment_service",
+    _build_sentiment_service,
+    warmup=lambda service: service.warm_up(),
+    shutdown=lambda service: service.stop()
+)
 
 class TrendRequest(BaseModel):
     hours_back: int = 24
     keywords: List[str] = None
 
+class SentimentRequest(BaseModel):
+    texts: List[str]
+
+@app.on_event("startup")
+async def warm_up_components():
+    # Serve /health right away; models load in the background
+    app.state.warmup_task = asyncio.create_task(components.warm_up())
+
+@app.on_event("shutdown")
+async def shutdown_components():
+    task = getattr(app.state, "warmup_task", None)
+    if task:
+        task.cancel()
+    await components.shutdown()
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/ready")
+async def readiness_check():
+    task = getattr(app.state, "warmup_task", None)
+    ready = task is not None and task.done() and not task.cancelled() and task.exception() is None
+    if not ready:
+        raise HTTPException(status_code=503, detail={"status": "warming_up", "components": components.get_stats()})
+    return {"status": "ready", "components": components.get_stats()}
+
 @app.post("/analyze/trends")
 async def analyze_trends(request: TrendRequest):
     try:
-        if request.keywords:
-            trend_analyzer.tracked_keywords = request.keywords
-        
-        trends = trend_analyzer.analyze_social_trends(hours_back=request.hours_back)
-        return {"trends": trends}
+        trend_analyzer = components.get("trend_analyzer")
+        keywords = trend_analyzer.normalize_keywords(request.keywords)
+        cache_key = trend_analyzer.cache_key(request.hours_back, keywords)
+
+        async def load():
+            # Scraping is blocking; keep it off the event loop
+            trends = await asyncio.to_thread(
+                trend_analyzer.analyze_social_trends,
+                hours_back=request.hours_back,
+                keywords=keywords
+            )
+            # An empty result means the analysis failed; don't cache it
+            return trends or None
+
+        trends = await components.get("trend_cache").get_or_load("social_trends", cache_key, load)
+        return {"trends": trends or {}}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/trending/topics")
-async def get_trending_topics():
+async def get_trending_topics(if_none_match: Optional[str] = Header(None)):
+    """Serve the precomputed trending topics; rebuilt in the background"""
     try:
-        trends = trend_analyzer.analyze_social_trends()
-        # Sort topics by mention count
-        sorted_trends = sorted(
-            trends.items(),
-            key=lambda x: x[1]['mention_count'] if x[1] else 0,
-            reverse=True
-        )
-        return {"trending_topics": sorted_trends[:5]}
+        view = components.get("trending_view")
+        await view.get()
+        return view.respond(if_none_match)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/analyze/sentiment")
+async def analyze_sentiment(request: SentimentRequest):
+    try:
+        results = await components.get("sentiment_service").analyze_batch(request.texts)
+        return {"results": results}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
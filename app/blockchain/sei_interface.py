@@ -19,9 +19,9 @@ Future Capabilities:
 
 from typing import Dict, Optional, List
 import logging
-import aiohttp
 import json
 from datetime import datetime
+from utils.http_client import HTTPClient
 
 class SEIBlockchainInterface:
     """
@@ -33,24 +33,27 @@ class SEIBlockchainInterface:
     Attributes:
         rpc_url (str): URL for the SEI RPC node
         logger: Configured logging instance
-        session: Async HTTP session for RPC calls
+        http_client: Shared pooled HTTP client for RPC calls
     """
     
-    def __init__(self, rpc_url: str = "https://sei-rpc.polkachu.com"):
+    def __init__(self, rpc_url: str = "https://sei-rpc.polkachu.com", http_client: Optional[HTTPClient] = None):
         self.rpc_url = rpc_url
         self.logger = logging.getLogger(__name__)
-        self.session = None
+        self.http_client = http_client
+        self._owns_client = False
 
     async def initialize(self):
-        """Initialize async HTTP session."""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        """Create a private HTTP client if no shared one was injected."""
+        if not self.http_client:
+            self.http_client = HTTPClient()
+            self._owns_client = True
 
     async def close(self):
         """Clean up resources."""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        if self.http_client and self._owns_client:
+            await self.http_client.close()
+            self.http_client = None
+            self._owns_client = False
 
     async def get_protocol_metrics(self, protocol_address: str) -> Dict:
         """
@@ -87,11 +90,8 @@ class SEIBlockchainInterface:
             Dict containing query results
         """
         try:
-            async with self.session.post(
-                f"{self.rpc_url}",
-                json=query
-            ) as response:
-                return await response.json()
+            response = await self.http_client.post(self.rpc_url, json=query)
+            return response.json()
         except Exception as e:
             self.logger.error(f"Chain query error: {e}")
             return {}
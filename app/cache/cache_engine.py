@@ -0,0 +1,256 @@
+"""
+Bounded Cache Engine
+
+Size-aware LRU cache with per-entry TTL used as the storage engine behind
+ProtocolCache. Each instance caps both the number of entries and their
+approximate memory footprint, so a long-running process keeps a flat memory
+profile no matter how many distinct keys are requested.
+
+Features:
+- LRU eviction once entry or byte limits are reached
+- Lazy expiration on access
+- Optional stale grace period for stale-while-revalidate reads
+- Hashed timer wheel for cheap periodic expiry sweeps
+- Hit/miss/eviction/expiration counters
+"""
+
+from typing import Any, Dict, List, Optional, Set
+from collections import OrderedDict
+import sys
+import threading
+import time
+
+
+def estimate_size(obj: Any, _seen: Optional[Set[int]] = None) -> int:
+    """
+    Approximate the memory footprint of a cached value in bytes.
+
+    Walks dicts, lists, tuples and sets recursively so nested API payloads
+    are accounted for, not just the outer container.
+    """
+    if _seen is None:
+        _seen = set()
+    obj_id = id(obj)
+    if obj_id in _seen:
+        return 0
+    _seen.add(obj_id)
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(
+            estimate_size(k, _seen) + estimate_size(v, _seen)
+            for k, v in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _seen) for item in obj)
+    return size
+
+
+class _CacheEntry:
+    """Single cached value with its expiry and accounted size."""
+
+    __slots__ = ('data', 'timestamp', 'expires_at', 'size')
+
+    def __init__(self, data: Any, timestamp: float, expires_at: float, size: int):
+        self.data = data
+        self.timestamp = timestamp
+        self.expires_at = expires_at
+        self.size = size
+
+
+class BoundedCache:
+    """
+    LRU cache bounded by entry count and total bytes, with TTL expiry.
+
+    Entries live in an OrderedDict ordered from least to most recently used.
+    Expiry is tracked twice: every read checks the entry's deadline (lazy
+    expiry), and a hashed timer wheel groups keys by expiry tick so
+    ``sweep()`` only inspects buckets whose tick has passed instead of
+    scanning the whole cache.
+
+    With ``stale_ttl`` set, an expired entry is kept for that many extra
+    seconds. Normal reads treat it as a miss, but ``get_entry(...,
+    allow_expired=True)`` still returns it so callers can serve stale data
+    while a refresh runs.
+
+    Attributes:
+        ttl (float): Seconds an entry stays valid
+        stale_ttl (float): Extra seconds an expired entry is retained
+        max_entries (int): Maximum number of entries kept
+        max_bytes (int): Maximum approximate size of all entries
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int = 1024,
+        max_bytes: int = 8 * 1024 * 1024,
+        stale_ttl: float = 0.0,
+        wheel_resolution: float = 1.0,
+        wheel_slots: int = 512
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_ttl = stale_ttl
+        self.current_bytes = 0
+
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        # Timer wheel: slot index -> keys expiring during that tick
+        self._resolution = wheel_resolution
+        self._wheel: List[Set[str]] = [set() for _ in range(wheel_slots)]
+        self._last_tick = self._tick(time.time())
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self.get_entry(key)
+        return entry.data if entry else None
+
+    def get_entry(self, key: str, allow_expired: bool = False) -> Optional[_CacheEntry]:
+        """
+        Return the raw cache entry for a key.
+
+        Args:
+            key: Identifier for the cached entry
+            allow_expired: Return an expired entry still inside its stale
+                grace period instead of treating it as a miss
+
+        Returns:
+            The entry, or None if missing (or expired and not allowed)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            now = time.time()
+            if entry.expires_at <= now:
+                self.misses += 1
+                if self._purge_at(entry) <= now:
+                    self._remove(key)
+                    self.expirations += 1
+                    return None
+                return entry if allow_expired else None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key: str, data: Any, ttl: Optional[float] = None):
+        """
+        Store a value, evicting least recently used entries if needed.
+
+        Values larger than ``max_bytes`` on their own are not cached.
+        """
+        now = time.time()
+        size = estimate_size(data)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            expires_at = now + (self.ttl if ttl is None else ttl)
+            self._entries[key] = _CacheEntry(data, now, expires_at, size)
+            self.current_bytes += size
+            self._wheel[self._slot(expires_at + self.stale_ttl)].add(key)
+
+            while (
+                len(self._entries) > self.max_entries
+                or self.current_bytes > self.max_bytes
+            ):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        """Remove a key from the cache. Returns True if it was present."""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self):
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
+            for bucket in self._wheel:
+                bucket.clear()
+            self.current_bytes = 0
+
+    def sweep(self) -> int:
+        """
+        Purge entries whose timer wheel tick has passed.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        current_tick = self._tick(now)
+        removed = 0
+
+        with self._lock:
+            # Never walk more than one full rotation of the wheel
+            start_tick = max(self._last_tick, current_tick - len(self._wheel) + 1)
+            for tick in range(start_tick, current_tick + 1):
+                bucket = self._wheel[tick % len(self._wheel)]
+                # Keys scheduled a rotation (or more) ahead stay in the bucket
+                expired = [
+                    key for key in bucket
+                    if self._purge_at(self._entries[key]) <= now
+                ]
+                for key in expired:
+                    self._remove(key)
+                    self.expirations += 1
+                removed += len(expired)
+            self._last_tick = current_tick
+
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return counters and current usage for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str):
+        """Drop an entry and its wheel slot. Caller must hold the lock."""
+        entry = self._entries.pop(key)
+        self.current_bytes -= entry.size
+        self._wheel[self._slot(self._purge_at(entry))].discard(key)
+
+    def _purge_at(self, entry: _CacheEntry) -> float:
+        """Time after which an entry can no longer be served, even stale."""
+        return entry.expires_at + self.stale_ttl
+
+    def _tick(self, timestamp: float) -> int:
+        return int(timestamp / self._resolution)
+
+    def _slot(self, timestamp: float) -> int:
+        return self._tick(timestamp) % len(self._wheel)
@@ -1,99 +1,300 @@
-from typing import Dict, Any
-import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import asyncio
 import logging
-from datetime import datetime
+from .cache_engine import BoundedCache
+from .redis_tier import RedisCacheTier
 
 logger = logging.getLogger(__name__)
 
 class ProtocolCache:
     """
     Cache system for protocol and NFT data to reduce API calls and server load.
-    
+
     This cache implements a time-based invalidation strategy to ensure data freshness
     while minimizing external API calls. Different data types have different cache
-    durations based on their update frequency needs.
-    
+    durations based on their update frequency needs. Each data type is backed by a
+    BoundedCache, so entries are capped by count and size and evicted LRU-first.
+
+    When a shared tier (RedisCacheTier) is attached, the bounded caches act as an
+    in-process L1 in front of it: the async fetch/store methods read through to
+    Redis on an L1 miss and publish writes so other workers drop stale copies.
+
+    ``get_or_load`` adds single-flight loading on top: concurrent misses for the
+    same key share one upstream call, and recently expired entries are served
+    stale while a background refresh replaces them.
+
     Attributes:
-        nft_cache (Dict): Stores NFT collection data
-        protocol_cache (Dict): Stores DeFi protocol metrics
+        nft_cache (BoundedCache): Stores NFT collection data
+        protocol_cache (BoundedCache): Stores DeFi protocol metrics
+        market_cache (BoundedCache): Stores market data
+        trends_cache (BoundedCache): Stores social trend analyses per keyword set
         cache_durations (Dict): Defines how long each data type stays valid
+        stale_durations (Dict): How long expired data may still be served while refreshing
+        cache_limits (Dict): Maximum entries and bytes kept per data type
+        shared_tier (RedisCacheTier): Optional L2 shared across worker processes
     """
-    
-    def __init__(self):
-        self.nft_cache: Dict[str, Dict[str, Any]] = {}
-        self.protocol_cache: Dict[str, Dict[str, Any]] = {}
+
+    def __init__(self, cache_limits: Optional[Dict[str, Dict[str, int]]] = None):
         self.cache_durations = {
             'nft_stats': 300,  # 5 minutes for NFT stats
             'protocol_metrics': 60,  # 1 minute for protocol metrics
             'market_data': 120,  # 2 minutes for market data
+            'social_trends': 60,  # 1 minute, the mention ingestion interval
+        }
+        self.stale_durations = {
+            'nft_stats': 300,
+            'protocol_metrics': 60,
+            'market_data': 120,
+            'social_trends': 60,
         }
+        self.cache_limits = {
+            'nft_stats': {'max_entries': 1000, 'max_bytes': 4 * 1024 * 1024},
+            'protocol_metrics': {'max_entries': 500, 'max_bytes': 2 * 1024 * 1024},
+            'market_data': {'max_entries': 500, 'max_bytes': 4 * 1024 * 1024},
+            'social_trends': {'max_entries': 200, 'max_bytes': 2 * 1024 * 1024},
+        }
+        if cache_limits:
+            for cache_type, limits in cache_limits.items():
+                self.cache_limits.setdefault(cache_type, {}).update(limits)
+
+        self.nft_cache = self._build_cache('nft_stats')
+        self.protocol_cache = self._build_cache('protocol_metrics')
+        self.market_cache = self._build_cache('market_data')
+        self.trends_cache = self._build_cache('social_trends')
         self.logger = logging.getLogger(__name__)
+        self.shared_tier: Optional[RedisCacheTier] = None
+        self._sweeper_task: Optional[asyncio.Task] = None
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
 
     def get_cached_data(self, cache_type: str, key: str) -> Dict[str, Any]:
         """
         Retrieve cached data if it exists and is still valid.
-        
+
         Args:
             cache_type: Type of cached data ('nft_stats', 'protocol_metrics', etc.)
             key: Identifier for the specific data entry
-            
+
         Returns:
             Dict containing cached data or None if invalid/missing
         """
         cache = self._get_cache_for_type(cache_type)
-        if not cache or key not in cache:
+        if cache is None:
             return None
-            
-        cached_item = cache[key]
-        if self._is_cache_valid(cached_item, cache_type):
+
+        data = cache.get(key)
+        if data is not None:
             self.logger.debug(f"Cache hit for {cache_type}:{key}")
-            return cached_item['data']
-            
-        self.logger.debug(f"Cache expired for {cache_type}:{key}")
-        return None
+        else:
+            self.logger.debug(f"Cache miss for {cache_type}:{key}")
+        return data
 
     def set_cached_data(self, cache_type: str, key: str, data: Dict[str, Any]):
         """
         Store new data in the cache with current timestamp.
-        
+
+        Args:
+            cache_type: Type of data being cached
+            key: Identifier for the data entry
+            data: The data to cache
+        """
+        cache = self._get_cache_for_type(cache_type)
+        if cache is None:
+            self.logger.warning(f"Unknown cache type {cache_type}, not caching {key}")
+            return
+
+        cache.set(key, data)
+        self.logger.debug(f"Updated cache for {cache_type}:{key}")
+
+    async def fetch_cached_data(self, cache_type: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve cached data from L1, falling back to the shared tier.
+
+        An L2 hit is copied into L1 with the remaining Redis TTL, so both
+        tiers expire the entry at the same moment. A key without a Redis
+        expiry gets the cache type's default TTL in L1.
+
+        Args:
+            cache_type: Type of cached data ('nft_stats', 'protocol_metrics', etc.)
+            key: Identifier for the specific data entry
+
+        Returns:
+            Dict containing cached data or None if invalid/missing
+        """
+        data = self.get_cached_data(cache_type, key)
+        if data is not None or self.shared_tier is None:
+            return data
+
+        cache = self._get_cache_for_type(cache_type)
+        if cache is None:
+            return None
+
+        data, remaining_ttl = await self.shared_tier.get(cache_type, key)
+        if data is not None:
+            self.logger.debug(f"Shared cache hit for {cache_type}:{key}")
+            cache.set(key, data, ttl=remaining_ttl)
+        return data
+
+    async def store_cached_data(self, cache_type: str, key: str, data: Dict[str, Any]):
+        """
+        Store data in L1 and, when attached, in the shared tier.
+
         Args:
             cache_type: Type of data being cached
             key: Identifier for the data entry
             data: The data to cache
         """
+        self.set_cached_data(cache_type, key, data)
+        if self.shared_tier is not None and self._get_cache_for_type(cache_type) is not None:
+            await self.shared_tier.set(
+                cache_type, key, data, ttl=self.cache_durations.get(cache_type, 300)
+            )
+
+    async def get_or_load(
+        self,
+        cache_type: str,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+        stale_while_revalidate: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return cached data, loading it at most once across concurrent callers.
+
+        On a miss every caller awaits the same in-flight ``loader()`` call. If
+        the entry has expired but is still within its stale period, the stale
+        value is returned immediately and a single background refresh runs.
+
+        Args:
+            cache_type: Type of cached data ('nft_stats', 'protocol_metrics', etc.)
+            key: Identifier for the specific data entry
+            loader: Zero-argument coroutine function fetching fresh data
+            stale_while_revalidate: Serve expired data while refreshing
+
+        Returns:
+            Dict containing the data, or None if the loader found nothing
+        """
+        data = await self.fetch_cached_data(cache_type, key)
+        if data is not None:
+            return data
+
         cache = self._get_cache_for_type(cache_type)
-        if cache is not None:
-            cache[key] = {
-                'timestamp': time.time(),
-                'data': data
-            }
-            self.logger.debug(f"Updated cache for {cache_type}:{key}")
-
-    def _get_cache_for_type(self, cache_type: str) -> Dict:
-        """Map cache type to appropriate cache dictionary."""
+        if stale_while_revalidate and cache is not None:
+            stale_entry = cache.get_entry(key, allow_expired=True)
+            if stale_entry is not None:
+                self.logger.debug(f"Serving stale {cache_type}:{key} while refreshing")
+                self._start_load(cache_type, key, loader)
+                return stale_entry.data
+
+        return await asyncio.shield(self._start_load(cache_type, key, loader))
+
+    def _start_load(
+        self,
+        cache_type: str,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ) -> asyncio.Task:
+        """Return the in-flight load for a key, starting one if needed."""
+        flight_key = (cache_type, key)
+        task = self._inflight.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(cache_type, key, loader))
+            self._inflight[flight_key] = task
+            task.add_done_callback(lambda t: self._finish_load(flight_key, t))
+        return task
+
+    async def _load(
+        self,
+        cache_type: str,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Run the loader and cache a non-empty result."""
+        data = await loader()
+        if data is not None:
+            await self.store_cached_data(cache_type, key, data)
+        return data
+
+    def _finish_load(self, flight_key: Tuple[str, str], task: asyncio.Task):
+        """Forget a completed load and log failures nobody awaited."""
+        if self._inflight.get(flight_key) is task:
+            del self._inflight[flight_key]
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error(f"Error loading {flight_key[0]}:{flight_key[1]}: {task.exception()}")
+
+    async def attach_shared_tier(self, shared_tier: RedisCacheTier):
+        """Use a shared tier as L2 and keep L1 coherent with its invalidations."""
+        await self.detach_shared_tier()
+        self.shared_tier = shared_tier
+        await shared_tier.start_listener(self._invalidate_local)
+
+    async def detach_shared_tier(self):
+        """Stop using the shared tier and its invalidation listener."""
+        if self.shared_tier is not None:
+            await self.shared_tier.stop_listener()
+            self.shared_tier = None
+
+    def _invalidate_local(self, cache_type: str, key: str):
+        """Drop an L1 entry after another worker rewrote it."""
+        cache = self._get_cache_for_type(cache_type)
+        if cache is not None and cache.delete(key):
+            self.logger.debug(f"Invalidated local cache for {cache_type}:{key}")
+
+    def _build_cache(self, cache_type: str) -> BoundedCache:
+        """Create the bounded storage engine for a cache type."""
+        return BoundedCache(
+            ttl=self.cache_durations.get(cache_type, 300),
+            stale_ttl=self.stale_durations.get(cache_type, 0),
+            **self.cache_limits.get(cache_type, {})
+        )
+
+    def _get_cache_for_type(self, cache_type: str) -> Optional[BoundedCache]:
+        """Map cache type to appropriate cache store."""
         cache_map = {
             'nft_stats': self.nft_cache,
-            'protocol_metrics': self.protocol_cache
+            'protocol_metrics': self.protocol_cache,
+            'market_data': self.market_cache,
+            'social_trends': self.trends_cache
         }
         return cache_map.get(cache_type)
 
-    def _is_cache_valid(self, cached_item: Dict, cache_type: str) -> bool:
-        """Check if cached item is still within its validity period."""
-        if not cached_item:
-            return False
-            
-        age = time.time() - cached_item['timestamp']
-        return age < self.cache_durations.get(cache_type, 300)
-
-    def clear_expired(self):
+    def clear_expired(self) -> int:
         """Remove expired entries from all caches."""
+        removed = 0
         for cache_type in self.cache_durations.keys():
             cache = self._get_cache_for_type(cache_type)
-            if cache:
-                expired = [
-                    key for key, item in cache.items()
-                    if not self._is_cache_valid(item, cache_type)
-                ]
-                for key in expired:
-                    del cache[key]
-                    self.logger.debug(f"Cleared expired cache for {cache_type}:{key}") 
\ No newline at end of file
+            if cache is not None:
+                cleared = cache.sweep()
+                if cleared:
+                    self.logger.debug(f"Cleared {cleared} expired entries for {cache_type}")
+                removed += cleared
+        return removed
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get hit/miss/eviction counters and usage for each cache type."""
+        return {
+            cache_type: self._get_cache_for_type(cache_type).get_stats()
+            for cache_type in self.cache_durations.keys()
+        }
+
+    def start_sweeper(self, interval: float = 30.0):
+        """Start the background task that periodically clears expired entries."""
+        if self._sweeper_task is None or self._sweeper_task.done():
+            self._sweeper_task = asyncio.create_task(self._run_sweeper(interval))
+
+    async def stop_sweeper(self):
+        """Stop the background expiry task."""
+        if self._sweeper_task:
+            self._sweeper_task.cancel()
+            try:
+                await self._sweeper_task
+            except asyncio.CancelledError:
+                pass
+            self._sweeper_task = None
+
+    async def _run_sweeper(self, interval: float):
+        """Periodically expire entries so idle keys don't hold memory."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.clear_expired()
+            except Exception as e:
+                self.logger.error(f"Error clearing expired cache entries: {e}")
@@ -0,0 +1,151 @@
+"""
+Redis Cache Tier
+
+Shared L2 cache used behind ProtocolCache's in-process L1 so that every
+uvicorn worker reads the same NFT/protocol data instead of each refetching
+it upstream. Values are stored as msgpack with the per-type TTLs from
+ProtocolCache, and writes are announced over pub/sub so other workers drop
+their now-stale L1 copies.
+
+The tier only needs a ``redis.asyncio``-compatible client, so it runs
+against ResourceManager's client in production and fakeredis in tests.
+"""
+
+from typing import Any, Awaitable, Callable, Optional, Tuple, Union
+import asyncio
+import uuid
+import logging
+import msgpack
+
+logger = logging.getLogger(__name__)
+
+InvalidationHandler = Callable[[str, str], Union[None, Awaitable[None]]]
+
+
+class RedisCacheTier:
+    """
+    Redis-backed shared cache tier with pub/sub invalidation.
+
+    Attributes:
+        redis: Async Redis client (ResourceManager.redis_client)
+        namespace (str): Prefix for every cache key
+        channel (str): Pub/sub channel used for invalidation messages
+        instance_id (str): Identifies this process's own invalidations
+    """
+
+    def __init__(self, redis_client, namespace: str = "protocol_cache", channel: Optional[str] = None):
+        self.redis = redis_client
+        self.namespace = namespace
+        self.channel = channel or f"{namespace}:invalidate"
+        self.instance_id = uuid.uuid4().hex
+        self._pubsub = None
+        self._listener_task: Optional[asyncio.Task] = None
+
+    async def get(self, cache_type: str, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        """
+        Read a value and its remaining TTL from Redis.
+
+        Returns:
+            Tuple of (data or None, remaining seconds). The remaining TTL is
+            None for a key written without an expiry.
+        """
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.get(self._key(cache_type, key))
+                pipe.pttl(self._key(cache_type, key))
+                raw, pttl = await pipe.execute()
+            if raw is None:
+                return None, 0.0
+            return self._deserialize(raw), pttl / 1000 if pttl >= 0 else None
+        except Exception as e:
+            logger.error(f"Redis cache read failed for {cache_type}:{key}: {e}")
+            return None, 0.0
+
+    async def set(self, cache_type: str, key: str, data: Any, ttl: float) -> bool:
+        """Write a value with a TTL and notify other workers."""
+        try:
+            payload = self._serialize(data)
+        except Exception as e:
+            logger.warning(f"Skipping shared cache for {cache_type}:{key}, not serializable: {e}")
+            return False
+
+        try:
+            await self.redis.set(self._key(cache_type, key), payload, px=max(int(ttl * 1000), 1))
+            await self._publish(cache_type, key)
+            return True
+        except Exception as e:
+            logger.error(f"Redis cache write failed for {cache_type}:{key}: {e}")
+            return False
+
+    async def delete(self, cache_type: str, key: str) -> bool:
+        """Remove a value from Redis and notify other workers."""
+        try:
+            await self.redis.delete(self._key(cache_type, key))
+            await self._publish(cache_type, key)
+            return True
+        except Exception as e:
+            logger.error(f"Redis cache delete failed for {cache_type}:{key}: {e}")
+            return False
+
+    async def start_listener(self, on_invalidate: InvalidationHandler):
+        """
+        Subscribe to invalidation messages from other workers.
+
+        Args:
+            on_invalidate: Called with (cache_type, key) for every remote write
+        """
+        if self._listener_task is not None:
+            return
+        self._pubsub = self.redis.pubsub()
+        await self._pubsub.subscribe(self.channel)
+        self._listener_task = asyncio.create_task(self._listen(on_invalidate))
+
+    async def stop_listener(self):
+        """Unsubscribe and stop the invalidation listener."""
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        if self._pubsub:
+            await self._pubsub.unsubscribe(self.channel)
+            await self._pubsub.close()
+            self._pubsub = None
+
+    async def _listen(self, on_invalidate: InvalidationHandler):
+        """Dispatch invalidation messages published by other instances."""
+        while True:
+            try:
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if not message:
+                    continue
+                origin, cache_type, key = self._deserialize(message['data'])
+                if origin == self.instance_id:
+                    continue
+                result = on_invalidate(cache_type, key)
+                if asyncio.iscoroutine(result):
+                    await result
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error handling cache invalidation: {e}")
+                await asyncio.sleep(1.0)
+
+    async def _publish(self, cache_type: str, key: str):
+        await self.redis.publish(
+            self.channel,
+            self._serialize([self.instance_id, cache_type, key])
+        )
+
+    def _key(self, cache_type: str, key: str) -> str:
+        return f"{self.namespace}:{cache_type}:{key}"
+
+    @staticmethod
+    def _serialize(data: Any) -> bytes:
+        return msgpack.packb(data, use_bin_type=True)
+
+    @staticmethod
+    def _deserialize(raw: bytes) -> Any:
+        return msgpack.unpackb(raw, raw=False)
@@ -29,6 +29,16 @@ class Settings(BaseSettings):
     
     # Cache Settings
     CACHE_TTL: int = 300  # 5 minutes
+    TRENDING_REFRESH_INTERVAL: int = 300  # seconds between trending-topics rebuilds
+    
+    # Local documentation search (built by scripts/build_docs_index.py)
+    DOCS_INDEX_PATH: str = "data/docs_index"
+    DOCS_CORPUS_PATH: str = "data/sei_docs"
+    
+    # Sentiment model inference backend: pytorch, int8 or onnx
+    SENTIMENT_BACKEND: str = "pytorch"
+    # Where the onnx backend keeps its one-time model export
+    SENTIMENT_ONNX_DIR: str = "data/sentiment_onnx"
     
     @validator('ENVIRONMENT')
     def validate_environment(cls, v):
@@ -37,6 +47,13 @@ class Settings(BaseSettings):
             raise ValueError(f'Environment must be one of {allowed}')
         return v
     
+    @validator('SENTIMENT_BACKEND')
+    def validate_sentiment_backend(cls, v):
+        allowed = ['pytorch', 'int8', 'onnx']
+        if v not in allowed:
+            raise ValueError(f'SENTIMENT_BACKEND must be one of {allowed}')
+        return v
+    
     @validator('SECRET_KEY')
     def validate_secret_key(cls, v):
         if len(v) < 32:
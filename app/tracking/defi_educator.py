@@ -110,18 +110,19 @@ class DeFiEducator:
 
     async def _get_protocol_data(self, protocol: str) -> Optional[Dict]:
         """Fetch protocol data with caching"""
-        cached_data = self.cache.get_cached_data('protocol_metrics', protocol)
-        if cached_data:
-            return cached_data
-            
+        return await self.cache.get_or_load(
+            'protocol_metrics',
+            protocol,
+            lambda: self._fetch_protocol_data(protocol)
+        )
+
+    async def _fetch_protocol_data(self, protocol: str) -> Optional[Dict]:
+        """Fetch fresh protocol data from upstream"""
         # Implement actual API calls here
         # For MVP, return placeholder data
-        data = {
+        return {
             'apy': 15.5,
             'tvl': 1000000,
             'volume_24h': 500000,
             'top_pool': 'SEI-USDC'
-        }
-        
-        self.cache.set_cached_data('protocol_metrics', protocol, data)
-        return data 
\ No newline at end of file
+        } 
\ No newline at end of file
@@ -49,17 +49,13 @@ class NFTCollectionTracker:
         Returns:
             Dict containing collection statistics
         """
-        # Check cache first
-        cached_stats = self.cache.get_cached_data('nft_stats', collection_name)
-        if cached_stats:
-            return cached_stats
-
         try:
-            # Fetch fresh data (implement API call)
-            stats = await self._fetch_collection_stats(collection_name)
-            if stats:
-                self.cache.set_cached_data('nft_stats', collection_name, stats)
-            return stats
+            # Concurrent misses share a single upstream fetch
+            return await self.cache.get_or_load(
+                'nft_stats',
+                collection_name,
+                lambda: self._fetch_collection_stats(collection_name)
+            )
         except Exception as e:
             self.logger.error(f"Error fetching collection stats: {e}")
             return None
@@ -5,27 +5,35 @@ Handles initialization and cleanup of application resources.
 """
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
-import aiohttp
+from typing import AsyncGenerator, Optional
 import redis.asyncio as redis
 from loguru import logger
+from utils.http_client import HTTPClient
 from ..config.settings import settings
+from ..cache.protocol_cache import ProtocolCache
+from ..cache.redis_tier import RedisCacheTier
 
 class ResourceManager:
     def __init__(self):
-        self.http_session: Optional[aiohttp.ClientSession] = None
+        self.http_client: Optional[HTTPClient] = None
         self.redis_client: Optional[redis.Redis] = None
+        self.protocol_cache = ProtocolCache()
         
     async def initialize(self):
         """Initialize all application resources"""
         try:
-            # Initialize HTTP session
-            self.http_session = aiohttp.ClientSession()
+            # Initialize the shared pooled HTTP client
+            self.http_client = HTTPClient()
             
             # Initialize Redis if configured
             if settings.REDIS_URL:
                 self.redis_client = redis.from_url(settings.REDIS_URL)
                 await self.redis_client.ping()
+                await self.protocol_cache.attach_shared_tier(
+                    RedisCacheTier(self.redis_client)
+                )
+            
+            self.protocol_cache.start_sweeper()
                 
             logger.info("Successfully initialized all resources")
         except Exception as e:
@@ -36,8 +44,11 @@ class ResourceManager:
     async def cleanup(self):
         """Cleanup all application resources"""
         try:
-            if self.http_session:
-                await self.http_session.close()
+            await self.protocol_cache.stop_sweeper()
+            await self.protocol_cache.detach_shared_tier()
+            
+            if self.http_client:
+                await self.http_client.close()
                 
             if self.redis_client:
                 await self.redis_client.close()
@@ -1,28 +1,16 @@
 import discord
 from discord.ext import commands
-import requests
-import os
 from dotenv import load_dotenv
+from utils.market_listings import get_listings
 
 # Load environment variables
 load_dotenv()
-COINMARKETCAP_API_KEY = os.getenv("COINMARKETCAP_API_KEY")
-COINMARKETCAP_URL = "https://pro-api.coinmarketcap.com/v1/cryptocurrency/listings/latest"
 
 # Helper Function to Fetch Data
-def fetch_crypto_data(limit=10, convert="USD"):
-    """Fetch top cryptocurrencies by market cap."""
+async def fetch_crypto_data(limit=10):
+    """Top cryptocurrencies by market cap, from the shared listings snapshot."""
     try:
-        headers = {"X-CMC_PRO_API_KEY": COINMARKETCAP_API_KEY}
-        params = {
-            "start": 1,  # Starting rank
-            "limit": limit,  # Number of results
-            "convert": convert,  # Conversion currency
-        }
-        response = requests.get(COINMARKETCAP_URL, headers=headers, params=params)
-        response.raise_for_status()
-        data = response.json()
-        return data.get("data", [])
+        return await get_listings().top(limit)
     except Exception as e:
         print(f"Error fetching cryptocurrency data: {e}")
         return []
@@ -37,7 +25,7 @@ class CryptoCommands(commands.Cog):
     @commands.command()
     async def crypto_stats(self, ctx):
         """Display top cryptocurrency stats."""
-        cryptos = fetch_crypto_data(limit=5)
+        cryptos = await fetch_crypto_data(limit=5)
         if not cryptos:
             await ctx.send("Could not fetch cryptocurrency data.")
             return
@@ -61,8 +49,7 @@ class CryptoCommands(commands.Cog):
     @commands.command()
     async def crypto_price(self, ctx, symbol: str):
         """Fetch the price of a specific cryptocurrency."""
-        cryptos = fetch_crypto_data(limit=100)
-        crypto = next((c for c in cryptos if c["symbol"].lower() == symbol.lower()), None)
+        crypto = await get_listings().get_by_symbol(symbol)
 
         if not crypto:
             await ctx.send(f"Cryptocurrency '{symbol}' not found.")
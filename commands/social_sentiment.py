@@ -1,6 +1,11 @@
 from discord.ext import commands
 import snscrape.modules.twitter as sntwitter
 from textblob import TextBlob
+from utils.api_helpers import run_blocking
+from utils.sentiment_cache import SentimentCache
+
+# Shared with the other TextBlob scorers through the same model id and store
+sentiment_cache = SentimentCache("textblob")
 
 def analyze_sentiment(keyword):
     """Fetch recent tweets and analyze sentiment."""
@@ -12,7 +17,7 @@ def analyze_sentiment(keyword):
     
     sentiments = {"positive": 0, "negative": 0, "neutral": 0}
     for tweet in tweets:
-        sentiment = TextBlob(tweet).sentiment.polarity
+        sentiment = sentiment_cache.score(tweet, lambda t: TextBlob(t).sentiment.polarity)
         if sentiment > 0:
             sentiments["positive"] += 1
         elif sentiment < 0:
@@ -22,6 +27,10 @@ def analyze_sentiment(keyword):
     
     return sentiments
 
+async def analyze_sentiment_async(keyword):
+    """Run analyze_sentiment on the bounded executor, off the event loop."""
+    return await run_blocking(analyze_sentiment, keyword)
+
 class SocialSentiment(commands.Cog):
     """Commands for social sentiment analysis."""
 
@@ -31,7 +40,7 @@ class SocialSentiment(commands.Cog):
     @commands.command()
     async def sentiment(self, ctx, keyword: str):
         """Analyze and report sentiment on a given keyword."""
-        sentiments = analyze_sentiment(keyword)
+        sentiments = await analyze_sentiment_async(keyword)
         await ctx.send(
             f"Sentiment for '{keyword}':\n"
             f"- Positive: {sentiments['positive']}\n"
@@ -39,11 +48,5 @@ class SocialSentiment(commands.Cog):
             f"- Neutral: {sentiments['neutral']}"
         )
 
-@bot.command(name="social_sentiment")
-async def social_sentiment(ctx, keyword: str):
-    sentiment_data = fetch_twitter_sentiment(keyword)  # Replace with actual Twitter API or snscrape logic
-    await ctx.send(f"Sentiment for {keyword}: {sentiment_data}")
-
-
 def setup(bot):
     bot.add_cog(SocialSentiment(bot))
@@ -1,12 +1,19 @@
 import discord
 from discord.ext import commands, tasks
-import requests
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from dotenv import load_dotenv
 import snscrape.modules.twitter as sntwitter
 import ssl
 import certifi
 from twitter_integration import api
+from utils.api_helpers import get_http_client, run_blocking
+from commands.social_sentiment import analyze_sentiment_async
+from utils.market_listings import get_listings
+from utils.trend_window import TrendAggregator
+from utils.parallel import map_with_timeout
 
 
 # Fix SSL Context
@@ -71,13 +78,11 @@ def get_magic_eden_headers():
         "Accept": "application/json"
     }
 
-def fetch_magic_eden_stats(collection_symbol):
+async def fetch_magic_eden_stats(collection_symbol):
     """Fetch NFT collection stats from Magic Eden."""
     try:
         url = f"{MAGIC_EDEN_BASE_URL}/collections/{collection_symbol}/stats"
-        response = requests.get(url, headers=get_magic_eden_headers())
-        response.raise_for_status()
-        data = response.json()
+        data = await get_http_client().get_json(url, headers=get_magic_eden_headers())
         return {
             "floor_price": data.get("floorPrice", 0) / 1e9,
             "volume_all_time": data.get("volumeAll", 0) / 1e9,
@@ -90,14 +95,12 @@ def fetch_magic_eden_stats(collection_symbol):
 # Magic Eden Activities Endpoint
 MAGIC_EDEN_ACTIVITIES_URL = "https://api-mainnet.magiceden.dev/v2/collections/{collection_symbol}/activities"
 
-def fetch_collection_activities(collection_symbol):
+async def fetch_collection_activities(collection_symbol):
     """Fetch recent activities for a collection from Magic Eden."""
     url = MAGIC_EDEN_ACTIVITIES_URL.format(collection_symbol=collection_symbol)
     headers = {"accept": "application/json"}
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return await get_http_client().get_json(url, headers=headers)
     except Exception as e:
         print(f"Error fetching activities for {collection_symbol}: {e}")
         return []
@@ -105,7 +108,7 @@ def fetch_collection_activities(collection_symbol):
 @bot.command()
 async def recent_activities(ctx, collection_symbol: str):
     """Fetch and display recent activities for an NFT collection."""
-    activities = fetch_collection_activities(collection_symbol)
+    activities = await fetch_collection_activities(collection_symbol)
     if not activities:
         await ctx.send(f"No activities found for collection: {collection_symbol}")
         return
@@ -125,7 +128,7 @@ async def recent_activities(ctx, collection_symbol: str):
 @bot.command()
 async def collection_stats(ctx, collection_symbol: str):
     """Display Magic Eden collection stats."""
-    stats = fetch_magic_eden_stats(collection_symbol)
+    stats = await fetch_magic_eden_stats(collection_symbol)
     if not stats:
         await ctx.send(f"Could not fetch stats for collection: {collection_symbol}")
         return
@@ -139,15 +142,10 @@ async def collection_stats(ctx, collection_symbol: str):
     await ctx.send(message)
 
 # CoinMarketCap Integration
-COINMARKETCAP_URL = "https://pro-api.coinmarketcap.com/v1/cryptocurrency/listings/latest"
-
-def fetch_crypto_data(limit=10):
-    """Fetch top cryptocurrencies by market cap."""
+async def fetch_crypto_data(limit=10):
+    """Top cryptocurrencies by market cap, from the shared listings snapshot."""
     try:
-        headers = {"X-CMC_PRO_API_KEY": COINMARKETCAP_API_KEY}
-        response = requests.get(COINMARKETCAP_URL, headers=headers, params={"limit": limit})
-        response.raise_for_status()
-        return response.json().get("data", [])
+        return await get_listings().top(limit)
     except Exception as e:
         print(f"Error fetching cryptocurrency data: {e}")
         return []
@@ -155,7 +153,7 @@ def fetch_crypto_data(limit=10):
 @bot.command()
 async def crypto_stats(ctx):
     """Display top cryptocurrency stats."""
-    cryptos = fetch_crypto_data(limit=5)
+    cryptos = await fetch_crypto_data(limit=5)
     if not cryptos:
         await ctx.send("Could not fetch cryptocurrency data.")
         return
@@ -185,8 +183,8 @@ async def daily_update():
     collections = ["degenape", "solpunks"]
     message = "**Daily NFT Update:**\n"
 
-    for collection in collections:
-        stats = fetch_magic_eden_stats(collection)
+    all_stats = await asyncio.gather(*(fetch_magic_eden_stats(c) for c in collections))
+    for collection, stats in zip(collections, all_stats):
         if stats:
             message += (
                 f"\n**{collection}**\n"
@@ -205,7 +203,12 @@ async def hourly_update():
         return
 
     keyword = "meme coin"
-    sentiments = analyze_sentiment(keyword)
+    collections = ["degenape", "solpunks"]
+    # Scrape sentiment on the executor while the collection stats are fetched
+    sentiments, *all_stats = await asyncio.gather(
+        analyze_sentiment_async(keyword),
+        *(fetch_magic_eden_stats(c) for c in collections)
+    )
     sentiment_message = (
         f"Sentiment for '{keyword}':\n"
         f"- Positive: {sentiments['positive']}\n"
@@ -213,10 +216,8 @@ async def hourly_update():
         f"- Neutral: {sentiments['neutral']}\n"
     )
 
-    collections = ["degenape", "solpunks"]
     collection_message = "**NFT Collection Updates:**\n"
-    for collection in collections:
-        stats = fetch_magic_eden_stats(collection)
+    for collection, stats in zip(collections, all_stats):
         if stats:
             collection_message += (
                 f"- {collection}: Floor Price: {stats['floor_price']} SOL\n"
@@ -287,51 +288,39 @@ class CryptoTrendAgent:
             "defi", "nft", "altcoin",
             "bitcoin", "ethereum"
         ]
+        # Keywords are scraped concurrently; a slow one only drops itself
+        self.scrape_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="trend-scrape")
+        self.keyword_timeout = 30.0
         
     def analyze_social_trends(self, hours_back=24):
         """Analyze recent social media trends for crypto-related topics"""
-        trends = {}
-        for keyword in self.tracked_keywords:
+        aggregator = TrendAggregator()
+        
+        def scrape(keyword):
             query = f"{keyword} since:{hours_back}h"
             tweets = sntwitter.TwitterSearchScraper(query).get_items()
             
-            # Collect and analyze tweet data
-            mentions = []
-            for tweet in list(tweets)[:100]:  # Analyze last 100 tweets
-                mentions.append({
-                    'text': tweet.content,
-                    'date': tweet.date,
-                    'engagement': tweet.likeCount + tweet.retweetCount,
-                    'sentiment': self._analyze_sentiment(tweet.content)
-                })
-            
-            trends[keyword] = self._process_mentions(mentions)
+            # Stream the last 100 tweets into the trend window without
+            # draining the scraper
+            for tweet in islice(tweets, 100):
+                aggregator.add(
+                    keyword,
+                    tweet.date,
+                    tweet.likeCount + tweet.retweetCount,
+                    self._analyze_sentiment(tweet.content)
+                )
         
-        return trends
+        map_with_timeout(scrape, self.tracked_keywords, self.scrape_executor, self.keyword_timeout)
+        return {
+            keyword: aggregator.query(keyword, hours_back * 3600)
+            for keyword in self.tracked_keywords
+        }
     
     def _analyze_sentiment(self, text):
         """Basic sentiment analysis - to be enhanced with proper NLP"""
         # Placeholder for sentiment analysis
         return 'neutral'
     
-    def _process_mentions(self, mentions):
-        """Process collected mentions to identify trends"""
-        if not mentions:
-            return None
-            
-        total_engagement = sum(mention['engagement'] for mention in mentions)
-        avg_engagement = total_engagement / len(mentions)
-        
-        return {
-            'mention_count': len(mentions),
-            'avg_engagement': avg_engagement,
-            'sentiment_distribution': {
-                'positive': sum(1 for m in mentions if m['sentiment'] == 'positive'),
-                'neutral': sum(1 for m in mentions if m['sentiment'] == 'neutral'),
-                'negative': sum(1 for m in mentions if m['sentiment'] == 'negative')
-            }
-        }
-    
     def generate_insight_tweet(self, trends):
         """Generate insights based on trend analysis"""
         # Find the most discussed topic
@@ -350,7 +339,7 @@ class CryptoTrendAgent:
 async def tweet(ctx, *, message: str):
     """Post a tweet."""
     try:
-        api.update_status(message)
+        await run_blocking(api.update_status, message)
         await ctx.send("Tweet posted successfully!")
     except Exception as e:
         await ctx.send(f"Failed to post tweet: {e}")
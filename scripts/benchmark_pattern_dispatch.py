@@ -0,0 +1,107 @@
+"""
+Pattern Dispatch Benchmark
+
+Times PatternDispatcher against trying each compiled pattern in turn,
+the loop it replaced, on a set of tweet-style patterns and messages.
+Every message must select the same pattern both ways. Exits non-zero
+if a winner differs or the dispatcher is slower than the loop.
+
+Usage:
+    python scripts/benchmark_pattern_dispatch.py [--patterns 200] [--rounds 2000]
+"""
+
+import argparse
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root / "tests"))
+
+from sei_agent_modules import load_service_module
+
+PatternDispatcher = load_service_module("conversation", "pattern_dispatch").PatternDispatcher
+
+FILLER = ['the', 'sei', 'chain', 'defi', 'yield', 'is', 'fast', 'gm', 'what', 'to', 'how', 'ser', 'wen']
+
+
+def make_patterns(count: int, rng: random.Random) -> list:
+    """Patterns shaped like the engines' own: keywords, alternations, gaps"""
+    words = [''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 8))) for _ in range(3 * count)]
+    shapes = [
+        r'(?i)\b{0}\b',
+        r'(?i){0}.*(?:{1}|{2})',
+        r'(?i)(?:{0}|{1}) {2}',
+        r'(?i)how.*{0}.*to.*{1}',
+    ]
+    keywords = [rng.sample(words, 3) for _ in range(count)]
+    return [rng.choice(shapes).format(*chosen) for chosen in keywords], keywords
+
+
+def make_messages(keywords: list, rng: random.Random) -> list:
+    messages = []
+    for i in range(20):
+        tokens = [rng.choice(FILLER) for _ in range(50)]
+        # A quarter of the messages contain text some pattern matches
+        if i % 4 == 0:
+            first, second, third = rng.choice(keywords)
+            tokens.insert(rng.randrange(len(tokens)), f"how {first} to {second} {first} {third}")
+        messages.append(' '.join(tokens)[:280])
+    return messages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--patterns", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    patterns, keywords = make_patterns(args.patterns, rng)
+    messages = make_messages(keywords, rng)
+
+    compiled = [re.compile(pattern) for pattern in patterns]
+    dispatcher = PatternDispatcher((pattern, index) for index, pattern in enumerate(patterns))
+
+    def loop(text):
+        for index, pattern in enumerate(compiled):
+            if pattern.search(text):
+                return index
+        return None
+
+    def dispatch(text):
+        result = dispatcher.match(text)
+        return result[1] if result else None
+
+    mismatches = [text for text in messages if loop(text) != dispatch(text)]
+    matched = sum(loop(text) is not None for text in messages)
+
+    timings = {}
+    for name, func in (("loop", loop), ("dispatcher", dispatch)):
+        started = time.perf_counter()
+        for _ in range(args.rounds // len(messages)):
+            for text in messages:
+                func(text)
+        timings[name] = time.perf_counter() - started
+
+    per_call = args.rounds // len(messages) * len(messages)
+    print(f"{len(patterns)} patterns, {len(messages)} messages ({matched} matching)")
+    for name, seconds in timings.items():
+        print(f"  {name:<10} {seconds:7.3f} s  {seconds / per_call * 1e6:8.1f} us/message")
+    print(f"  speedup    {timings['loop'] / timings['dispatcher']:7.1f}x")
+
+    if mismatches:
+        print(f"{len(mismatches)} messages selected a different pattern", file=sys.stderr)
+        return 1
+    if timings['dispatcher'] > timings['loop']:
+        print("Dispatcher is slower than the per-pattern loop", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Sentiment Backend Benchmark
+
+Compares the int8 and ONNX sentiment backends against the full-precision
+reference on a fixture set of financial texts:
+
+- accuracy parity: label agreement and maximum score difference
+- throughput: texts per second when scoring in batches
+- memory: resident set size added by loading and running the model
+
+Each backend runs in its own subprocess so memory numbers are not skewed
+by models loaded earlier. Exits non-zero if a backend's label agreement
+falls below --min-agreement.
+
+Usage:
+    python scripts/benchmark_sentiment.py [--backends int8 onnx] [--batch-size 16]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "sentiment_samples.json"
+REFERENCE_BACKEND = "pytorch"
+
+
+def rss_mb() -> float:
+    """Current resident set size in MB"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 1024 / 1024
+    except ImportError:
+        import resource
+        # Peak RSS (KB on Linux); close enough when psutil is missing
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_backend(backend: str, batch_size: int, rounds: int) -> dict:
+    """Load one backend, score the fixtures and report results and timings"""
+    from app.agent.sentiment_analyzer import SentimentAnalyzer
+
+    texts = json.loads(FIXTURE_PATH.read_text())
+    base_rss = rss_mb()
+
+    started = time.perf_counter()
+    analyzer = SentimentAnalyzer(backend=backend)
+    load_seconds = time.perf_counter() - started
+
+    # Score through the model directly; the result cache would hide the cost
+    results = []
+    for start in range(0, len(texts), batch_size):
+        results.extend(analyzer._score_batch(texts[start:start + batch_size]))
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for start in range(0, len(texts), batch_size):
+            analyzer._score_batch(texts[start:start + batch_size])
+    elapsed = time.perf_counter() - started
+
+    return {
+        'backend': backend,
+        'load_seconds': round(load_seconds, 2),
+        'texts_per_second': round(len(texts) * rounds / elapsed, 1),
+        'rss_mb': round(rss_mb() - base_rss, 1),
+        'results': results
+    }
+
+
+def spawn(backend: str, batch_size: int, rounds: int) -> dict:
+    output = subprocess.run(
+        [sys.executable, __file__, "--worker", backend,
+         "--batch-size", str(batch_size), "--rounds", str(rounds)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def compare(reference: list, candidate: list) -> dict:
+    agreement = sum(r['label'] == c['label'] for r, c in zip(reference, candidate)) / len(reference)
+    max_score_diff = max(
+        abs(r['score'] - c['score'])
+        for r, c in zip(reference, candidate)
+        if r['label'] == c['label']
+    ) if agreement else 1.0
+    return {'label_agreement': round(agreement, 4), 'max_score_diff': round(max_score_diff, 4)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", default=["int8", "onnx"])
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--min-agreement", type=float, default=0.95)
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_backend(args.worker, args.batch_size, args.rounds)))
+        return 0
+
+    reference = spawn(REFERENCE_BACKEND, args.batch_size, args.rounds)
+    rows = [dict(reference, label_agreement=1.0, max_score_diff=0.0)]
+    failed = []
+
+    for backend in args.backends:
+        try:
+            result = spawn(backend, args.batch_size, args.rounds)
+        except subprocess.CalledProcessError as e:
+            print(f"{backend}: failed to run\n{e.stderr}", file=sys.stderr)
+            failed.append(backend)
+            continue
+        result.update(compare(reference['results'], result['results']))
+        rows.append(result)
+        if result['label_agreement'] < args.min_agreement:
+            failed.append(backend)
+
+    print(f"{'backend':<10}{'load s':>9}{'texts/s':>10}{'rss MB':>9}{'agree':>8}{'max diff':>10}")
+    for row in rows:
+        print(
+            f"{row['backend']:<10}{row['load_seconds']:>9}{row['texts_per_second']:>10}"
+            f"{row['rss_mb']:>9}{row['label_agreement']:>8}{row['max_score_diff']:>10}"
+        )
+
+    if failed:
+        print(f"Parity check failed for: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
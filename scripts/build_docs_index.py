@@ -0,0 +1,59 @@
+"""
+Build the Local Docs Index
+
+Loads a snapshot of the SEI documentation (a directory of Markdown
+files, data/sei_docs by default), splits it into passages, and writes a
+BM25 inverted index that SEIKnowledgeBase searches at chat time. The
+index records a fingerprint of the snapshot, so the app rebuilds it on
+start if the snapshot has changed since. scripts/fixtures/sei_docs is a
+small fixture corpus for tests and smoke runs.
+
+Usage:
+    python scripts/build_docs_index.py [--source DIR] [--output DIR] [--query TEXT ...]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.docs_index import DocsIndex, corpus_fingerprint, load_markdown_corpus
+
+DEFAULT_SOURCE = project_root / "data" / "sei_docs"
+DEFAULT_OUTPUT = project_root / "data" / "docs_index"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default=str(DEFAULT_SOURCE), help="directory of Markdown docs")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="index directory to write")
+    parser.add_argument("--query", action="append", default=[], help="search the new index as a smoke test")
+    args = parser.parse_args()
+
+    passages = load_markdown_corpus(args.source)
+    if not passages:
+        print(f"No Markdown documents found under {args.source}", file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+    DocsIndex.build(passages).save(args.output, corpus_fingerprint=corpus_fingerprint(args.source))
+    print(f"Indexed {len(passages)} passages into {args.output} in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    index = DocsIndex.open(args.output)
+    print(f"  {len(index.terms)} terms")
+    for query in args.query:
+        started = time.perf_counter()
+        hits = index.search(query)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"\n{query!r} ({elapsed_ms:.3f} ms)")
+        for hit in hits:
+            print(f"  {hit['score']:>7.3f}  {hit['title']}  [{hit['source']}]")
+    index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
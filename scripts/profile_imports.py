@@ -0,0 +1,87 @@
+"""
+Import-Time Profile
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter
+for each module and reports the total import time and the slowest
+imports. Use it as a regression benchmark for startup cost: it exits
+non-zero when a module fails to import and, with --max-ms, when any
+module takes longer to import than the budget.
+
+Usage:
+    python scripts/profile_imports.py [modules ...] [--top 15] [--max-ms 500]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+
+DEFAULT_MODULES = ["app", "app.api.routes", "sei_agent.app.api.routes"]
+
+# "import time:   self [us] | cumulative | imported package"
+_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def profile(module: str):
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        (rows, error) where rows are (cumulative_us, self_us, depth, name)
+        and error is the interpreter's last stderr line if the import failed
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root, capture_output=True, text=True
+    )
+    rows = []
+    other = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((int(cumulative_us), int(self_us), (len(indent) - 1) // 2, name))
+        elif line.strip():
+            other.append(line)
+    error = other[-1] if result.returncode != 0 and other else None
+    return rows, error
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list per module")
+    parser.add_argument("--max-ms", type=float, help="fail if a module's total import time exceeds this")
+    args = parser.parse_args()
+
+    over_budget = []
+    failed = []
+    for module in args.modules:
+        rows, error = profile(module)
+        # The requested module's own top-level entry; its parent packages nest under it
+        total_us = next((cumulative for cumulative, _, depth, name in rows if depth == 0 and name == module), None)
+        if error or total_us is None:
+            print(f"\n{module}: import failed: {error or 'no import-time entry'}")
+            failed.append(module)
+            continue
+        total_ms = total_us / 1000
+        print(f"\n{module}: {total_ms:.1f} ms total, {len(rows)} modules imported")
+        print(f"  {'cumulative ms':>13}  {'self ms':>8}  module")
+        for cumulative, self_us, _, name in sorted(rows, reverse=True)[:args.top]:
+            print(f"  {cumulative / 1000:>13.1f}  {self_us / 1000:>8.1f}  {name}")
+
+        if args.max_ms is not None and total_ms > args.max_ms:
+            over_budget.append(f"{module} ({total_ms:.1f} ms)")
+
+    if failed:
+        print(f"\nFailed to import: {', '.join(failed)}", file=sys.stderr)
+    if over_budget:
+        print(f"\nOver the {args.max_ms} ms import budget: {', '.join(over_budget)}", file=sys.stderr)
+    return 1 if failed or over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, Security
+from fastapi import APIRouter, Depends, Header, HTTPException, Security
 from pydantic import BaseModel
-from typing import List, Dict
+from typing import Dict, Optional
+import asyncio
 from loguru import logger
 from fastapi.security.api_key import APIKeyHeader
+from utils.sse import sse_response
 
 from ..services import (
     BlockchainService,
@@ -20,11 +22,15 @@ from ..schemas.responses import (
 )
 
 router = APIRouter()
+# Cheap to construct: services are built on first use or by the startup warm-up
 service_manager = ServiceManager()
+warmup_task: Optional[asyncio.Task] = None
 api_key_header = APIKeyHeader(name="X-API-KEY")
 
 class ChatMessage(BaseModel):
     message: str
+    # Without one the reply uses no per-user context and nothing is stored
+    user_id: Optional[str] = None
 
 def verify_api_key(api_key: str = Security(api_key_header)):
     if api_key != "expected_api_key":
@@ -35,7 +41,7 @@ async def chat_endpoint(message: ChatMessage):
     """Chat endpoint with enhanced responses"""
     try:
         response = await service_manager.content_generator.generate_chat_response(
-            message.message
+            message.message, message.user_id
         )
         return {
             "response": response['response'],
@@ -46,9 +52,25 @@ async def chat_endpoint(message: ChatMessage):
         logger.error(f"Error in chat endpoint: {str(e)}")
         raise HTTPException(status_code=500, detail="Chat processing failed")
 
+@router.post("/chat/stream")
+async def stream_chat_endpoint(message: ChatMessage):
+    """
+    Chat over Server-Sent Events.
+
+    Emits ``response`` as soon as the message is pattern-matched, then
+    ``suggested_actions`` and ``metrics`` as they become ready, then ``done``.
+    """
+    return sse_response(
+        service_manager.content_generator.stream_chat_response(message.message, message.user_id)
+    )
+
+def get_blockchain() -> BlockchainService:
+    """Shared blockchain service backed by the pooled HTTP client."""
+    return service_manager.blockchain
+
 @router.get("/blockchain/status")
 async def get_blockchain_status(
-    blockchain: BlockchainService = Depends(lambda: BlockchainService())
+    blockchain: BlockchainService = Depends(get_blockchain)
 ) -> Dict:
     """Get blockchain connection status."""
     status = await blockchain.verify_connection()
@@ -57,10 +79,10 @@ async def get_blockchain_status(
 @router.get("/nft/{collection_address}/stats")
 async def get_nft_stats(
     collection_address: str,
-    blockchain: BlockchainService = Depends(lambda: BlockchainService()),
-    nft_tracker: NFTTracker = Depends(lambda: NFTTracker(blockchain))
+    blockchain: BlockchainService = Depends(get_blockchain)
 ) -> Dict:
     """Get NFT collection statistics."""
+    nft_tracker = NFTTracker(blockchain)
     stats = await nft_tracker.get_collection_stats(collection_address)
     if not stats:
         raise HTTPException(status_code=404, detail="Collection not found")
@@ -79,49 +101,37 @@ async def create_educational_content(
 @router.get("/protocols/astroport/pools/{pool_address}")
 async def get_pool_info(
     pool_address: str,
-    blockchain: BlockchainService = Depends(lambda: BlockchainService()),
-    tracker: AstroportTracker = Depends(lambda: AstroportTracker(blockchain))
+    blockchain: BlockchainService = Depends(get_blockchain)
 ) -> Dict:
     """Get Astroport pool information."""
+    tracker = AstroportTracker(blockchain)
     info = await tracker.get_pool_info(pool_address)
     if not info:
         raise HTTPException(status_code=404, detail="Pool not found")
     return info
 
-@router.get("/trending/topics", response_model=Dict[str, List[Dict]])
-async def get_trending_topics():
-    """Get trending topics endpoint."""
+@router.get("/trending/topics")
+async def get_trending_topics(if_none_match: Optional[str] = Header(None)):
+    """Get trending topics from the precomputed view; supports If-None-Match."""
     try:
-        # Example response for testing
-        return {
-            "trending_topics": [
-                {
-                    "topic": "SEI",
-                    "data": {
-                        "mention_count": 150,
-                        "avg_engagement": 45.5,
-                        "mentions_per_hour": 12,
-                        "sentiment_distribution": {
-                            "positive": 0.6,
-                            "neutral": 0.3,
-                            "negative": 0.1
-                        }
-                    }
-                }
-            ]
-        }
+        view = service_manager.trending_view
+        await view.get()
+        return view.respond(if_none_match)
     except Exception as e:
         logger.error(f"Error getting trending topics: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to get trending topics")
 
 @router.on_event("startup")
 async def startup_event():
-    """Initialize services on startup"""
-    await service_manager.initialize()
+    """Warm up services in the background so the worker reports healthy right away"""
+    global warmup_task
+    warmup_task = asyncio.create_task(service_manager.initialize())
 
 @router.on_event("shutdown")
 async def shutdown_event():
     """Cleanup services on shutdown"""
+    if warmup_task:
+        warmup_task.cancel()
     await service_manager.cleanup()
 
 @router.get("/analytics/network", response_model=NetworkStatus)
@@ -184,7 +194,7 @@ async def get_status():
         raise HTTPException(status_code=500, detail="Service error")
 
 @router.get("/blockchain/latest-block")
-async def get_latest_block(blockchain: BlockchainService = Depends()):
+async def get_latest_block(blockchain: BlockchainService = Depends(get_blockchain)):
     """Get the latest block information."""
     try:
         block = await blockchain.get_latest_block()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from pydantic import BaseSettings, validator, SecretStr
 
 class Settings(BaseSettings):
@@ -10,14 +10,41 @@ class Settings(BaseSettings):
     
     # SEI Network Configuration
     SEI_RPC_URL: str = "https://rest.sei-apis.com"
+    SEI_TENDERMINT_RPC_URL: str = "https://rpc.sei-apis.com"  # net_info (peer count)
     SEI_CHAIN_ID: str = "sei-chain"
     
+    # Local block store
+    BLOCK_STORE_PATH: str = "data/blocks.db"
+    BLOCK_SYNC_INTERVAL: float = 2.0  # seconds between chain tail polls
+    SENTIMENT_CACHE_PATH: str = "data/sentiment_cache.db"
+    MENTION_STORE_PATH: str = "data/mentions.db"
+    TRENDING_REFRESH_INTERVAL: int = 300  # seconds between trending-topics rebuilds
+    
+    # Per-user conversation sessions
+    SESSION_BACKEND: str = "sqlite"  # memory, sqlite or redis
+    SESSION_STORE_PATH: str = "data/sessions.db"
+    REDIS_URL: Optional[str] = None
+    SESSION_MAX_USERS: int = 10000  # per store, in memory
+    SESSION_IDLE_TTL: int = 24 * 3600  # seconds before an idle session expires
+    SESSION_SNAPSHOT_INTERVAL: float = 30.0
+    
+    # Ecosystem metrics served to chat
+    ECOSYSTEM_REFRESH_INTERVAL: float = 60.0
+    CHAT_DATA_MAX_STALENESS: float = 300.0  # seconds; older metrics are left out of replies
+    
     # Application Settings
     DEBUG: bool = False
     ENVIRONMENT: str = "production"
     POST_INTERVAL: int = 3600  # 1 hour in seconds
     allowed_origins: List[str] = ["http://localhost:3000"]
     
+    @validator('SESSION_BACKEND')
+    def validate_session_backend(cls, v: str) -> str:
+        allowed = ['memory', 'sqlite', 'redis']
+        if v not in allowed:
+            raise ValueError(f"Session backend must be one of {allowed}")
+        return v
+
     @validator('ENVIRONMENT')
     def validate_environment(cls, v: str) -> str:
         allowed = ['development', 'staging', 'production']
@@ -3,7 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from loguru import logger
 import uvicorn
-from typing import Dict, List
+from typing import Dict
 
 from .config.settings import Settings
 from .utils.logging import setup_logging
@@ -99,45 +99,6 @@ def create_app() -> FastAPI:
         except Exception as e:
             logger.error(f"Error during shutdown: {str(e)}")
 
-    @app.get("/api/trending/topics")
-    async def get_trending_topics() -> Dict[str, List[Dict]]:
-        """Get trending topics endpoint."""
-        try:
-            # Example response matching frontend interface
-            return {
-                "trending_topics": [
-                    {
-                        "topic": "SEI",
-                        "data": {
-                            "mention_count": 150,
-                            "avg_engagement": 45.5,
-                            "mentions_per_hour": 12,
-                            "sentiment_distribution": {
-                                "positive": 0.6,
-                                "neutral": 0.3,
-                                "negative": 0.1
-                            }
-                        }
-                    },
-                    {
-                        "topic": "DeFi",
-                        "data": {
-                            "mention_count": 120,
-                            "avg_engagement": 38.2,
-                            "mentions_per_hour": 10,
-                            "sentiment_distribution": {
-                                "positive": 0.5,
-                                "neutral": 0.4,
-                                "negative": 0.1
-                            }
-                        }
-                    }
-                ]
-            }
-        except Exception as e:
-            logger.error(f"Error getting trending topics: {str(e)}")
-            raise HTTPException(status_code=500, detail="Failed to get trending topics")
-
     return app
 
 def run_server() -> None:
@@ -4,15 +4,29 @@ Services Package
 Initializes all service components.
 """
 
+from typing import Dict
+from loguru import logger
 from .blockchain import BlockchainService
 from .twitter import TwitterService
 from .content_generator import ContentGenerator
 from .scheduler import ContentScheduler
 from .analytics.network_analytics import NetworkAnalytics
 from .analytics.social_analytics import SocialAnalytics
+from .analytics.block_store import BlockStore, BlockSyncer
+from .analytics.ecosystem_snapshot import EcosystemSnapshot
 from .protocol_trackers.base import AstroportTracker
 from .defi_educator import DeFiEducator
 from .nft_tracker import NFTTracker
+from ..config.settings import Settings
+from utils.http_client import HTTPClient
+from utils.component_registry import ComponentRegistry
+from utils.materialized_view import MaterializedView
+from .conversation.advanced_chat_engine import AdvancedSEIConversationEngine
+from .conversation.session_backends import RedisSessionBackend, SQLiteSessionBackend
+from .conversation.educational_scaffold import EducationalScaffold
+from .conversation.session_records import ConversationContext, LearningProgress, TutorialSession
+from .conversation.session_store import SessionStore
+from .trading.strategy_advisor import TradingStrategyAdvisor
 
 __all__ = [
     'BlockchainService',
@@ -23,28 +37,188 @@ __all__ = [
 ]
 
 class ServiceManager:
-    """Manages all service instances and their lifecycle"""
+    """
+    Manages all service instances and their lifecycle.
+
+    Services are registered as factories and built on first access, so
+    constructing the manager (and importing the API routes) does no network
+    or auth work. ``initialize`` warms up the services that need to run in
+    the background; ``cleanup`` shuts down whatever was built.
+    """
+
+    # Built and warmed up by initialize(), in this order
+    WARM_UP_ORDER = (
+        'http_client', 'blockchain', 'twitter', 'block_store',
+        'network_analytics', 'social_analytics', 'chat_sessions', 'learning_progress',
+        'tutorial_sessions', 'ecosystem_snapshot', 'content_generator', 'scheduler',
+        'block_syncer', 'trending_view'
+    )
+
+    # Topics served by the trending view
+    TRENDING_LIMIT = 5
+
     def __init__(self):
-        self.blockchain = BlockchainService()
-        self.twitter = TwitterService()
-        self.content_generator = ContentGenerator()
-        self.scheduler = ContentScheduler()
-        self.network_analytics = NetworkAnalytics()
-        self.social_analytics = SocialAnalytics()
-        self.defi_educator = DeFiEducator()
-        self.nft_tracker = NFTTracker()
-        
+        self.registry = ComponentRegistry()
+        register = self.registry.register
+        get = self.registry.get
+
+        # One pooled HTTP client shared by every service that calls out
+        register('http_client', HTTPClient, shutdown=lambda client: client.close())
+        register('settings', Settings)
+        register(
+            'blockchain',
+            lambda: BlockchainService(get('http_client')),
+            warmup=lambda blockchain: blockchain.verify_connection(),
+            shutdown=lambda blockchain: blockchain.close()
+        )
+        register('twitter', TwitterService, warmup=lambda twitter: twitter.verify_credentials())
+        register(
+            'block_store',
+            lambda: BlockStore(get('settings').BLOCK_STORE_PATH),
+            shutdown=lambda store: store.close()
+        )
+        register('network_analytics', self._build_network_analytics)
+        register('content_generator', self._build_content_generator)
+        register(
+            'scheduler',
+            lambda: ContentScheduler(get('content_generator')),
+            warmup=lambda scheduler: scheduler.initialize(),
+            shutdown=lambda scheduler: scheduler.cleanup()
+        )
+        register(
+            'block_syncer',
+            lambda: BlockSyncer(
+                get('block_store'),
+                # The chain NetworkAnalytics reads, so _store_covers compares like with like
+                get('network_analytics').get_latest_block,
+                get('network_analytics').get_block,
+                interval=get('settings').BLOCK_SYNC_INTERVAL
+            ),
+            warmup=lambda syncer: syncer.start(),
+            shutdown=lambda syncer: syncer.stop()
+        )
+        register('social_analytics', SocialAnalytics)
+        register(
+            'session_backend',
+            self._build_session_backend,
+            shutdown=lambda backend: backend.close() if backend else None
+        )
+        for name, record_type, namespace in (
+            ('chat_sessions', ConversationContext, 'chat_context'),
+            ('learning_progress', LearningProgress, 'learning_progress'),
+            ('tutorial_sessions', TutorialSession, 'tutorial_sessions')
+        ):
+            register(
+                name,
+                lambda record_type=record_type, namespace=namespace: self._build_session_store(record_type, namespace),
+                warmup=lambda store: store.start_snapshots(get('settings').SESSION_SNAPSHOT_INTERVAL),
+                shutdown=lambda store: store.close()
+            )
+        register('educational_scaffold', lambda: EducationalScaffold(get('learning_progress')))
+        register('strategy_advisor', lambda: TradingStrategyAdvisor(get('tutorial_sessions')))
+        register(
+            'ecosystem_snapshot',
+            lambda: EcosystemSnapshot(
+                {
+                    'network': lambda: get('network_analytics').get_status(strict=True),
+                    'social': lambda: get('social_analytics').get_sentiment()
+                },
+                interval=get('settings').ECOSYSTEM_REFRESH_INTERVAL,
+                max_staleness=get('settings').CHAT_DATA_MAX_STALENESS
+            ),
+            warmup=lambda snapshot: snapshot.start(),
+            shutdown=lambda snapshot: snapshot.stop()
+        )
+        register(
+            'chat_engine',
+            lambda: AdvancedSEIConversationEngine(
+                get('network_analytics'), get('social_analytics'), get('chat_sessions'),
+                snapshot=get('ecosystem_snapshot')
+            )
+        )
+        register(
+            'trending_view',
+            lambda: MaterializedView('trending_topics', self._build_trending_topics),
+            warmup=lambda view: get('scheduler').schedule_view_refresh(
+                view, get('settings').TRENDING_REFRESH_INTERVAL
+            )
+        )
+        register('defi_educator', lambda: DeFiEducator(get('twitter')))
+        register('nft_tracker', lambda: NFTTracker(get('blockchain')))
+
+    def __getattr__(self, name: str):
+        # Only called for attributes not set on the instance
+        registry = self.__dict__.get('registry')
+        if registry is not None and name in registry:
+            return registry.get(name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def _build_network_analytics(self) -> NetworkAnalytics:
+        network_analytics = NetworkAnalytics(self.registry.get('http_client'))
+        network_analytics.block_store = self.registry.get('block_store')
+        return network_analytics
+
+    def _build_content_generator(self) -> ContentGenerator:
+        return ContentGenerator(
+            self.registry.get('http_client'),
+            social_analytics=self.registry.get('social_analytics'),
+            chat_engine=self.registry.get('chat_engine'),
+            snapshot=self.registry.get('ecosystem_snapshot'),
+            network_analytics=self.registry.get('network_analytics')
+        )
+
+    def _build_session_backend(self):
+        """Snapshot backend for session stores, or None to keep sessions in memory only"""
+        settings = self.registry.get('settings')
+        if settings.SESSION_BACKEND == 'memory':
+            return None
+        if settings.SESSION_BACKEND == 'redis':
+            if settings.REDIS_URL:
+                return RedisSessionBackend.from_url(settings.REDIS_URL, ttl=settings.SESSION_IDLE_TTL)
+            logger.warning("SESSION_BACKEND is redis but REDIS_URL is not set; using SQLite")
+        return SQLiteSessionBackend(settings.SESSION_STORE_PATH, ttl=settings.SESSION_IDLE_TTL)
+
+    def _build_session_store(self, record_type, namespace: str) -> SessionStore:
+        settings = self.registry.get('settings')
+        return SessionStore(
+            record_type,
+            namespace,
+            max_sessions=settings.SESSION_MAX_USERS,
+            idle_ttl=settings.SESSION_IDLE_TTL,
+            backend=self.registry.get('session_backend')
+        )
+
+    async def _build_trending_topics(self) -> Dict:
+        """Top keywords by 24h mention count, with sentiment as fractions"""
+        trends = await self.registry.get('social_analytics').get_keyword_trends(hours=24)
+        ranked = sorted(
+            ((keyword, data) for keyword, data in trends.items() if data),
+            key=lambda item: item[1]['mention_count'],
+            reverse=True
+        )
+        topics = []
+        for keyword, data in ranked[:self.TRENDING_LIMIT]:
+            total = data['mention_count']
+            topics.append({
+                'topic': keyword,
+                'data': {
+                    'mention_count': total,
+                    'avg_engagement': round(data['avg_engagement'], 2),
+                    'mentions_per_hour': round(data['mentions_per_hour'], 2),
+                    'sentiment_distribution': {
+                        label: round(count / total, 2)
+                        for label, count in data['sentiment_distribution'].items()
+                    }
+                }
+            })
+        return {'trending_topics': topics}
+
     async def initialize(self):
         """Initialize all services"""
-        await self.blockchain.initialize()
-        await self.twitter.verify_credentials()
-        await self.content_generator.initialize()
-        await self.scheduler.initialize()
-        
+        await self.registry.warm_up(self.WARM_UP_ORDER)
+
     async def cleanup(self):
         """Cleanup all services"""
-        await self.scheduler.cleanup()
-        await self.content_generator.cleanup()
-        await self.blockchain.cleanup()
+        await self.registry.shutdown()
 
 # Initialize service components 
\ No newline at end of file
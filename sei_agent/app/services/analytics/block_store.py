@@ -0,0 +1,244 @@
+from typing import Awaitable, Callable, Dict, List, Optional
+from pathlib import Path
+import asyncio
+import sqlite3
+import threading
+from loguru import logger
+from .block_window import parse_block_time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocks (
+    height INTEGER PRIMARY KEY,
+    hash TEXT,
+    time TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    proposer TEXT,
+    tx_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_blocks_timestamp ON blocks (timestamp);
+"""
+
+class BlockStore:
+    """
+    Local append-only store of block headers and transaction counts.
+
+    Backed by SQLite in WAL mode so the syncer can write while API handlers
+    read. Chain analytics (block time, TPS, proposer distribution, charts)
+    are answered from indexed local rows instead of re-downloading blocks.
+    """
+
+    def __init__(self, path: str = "data/blocks.db"):
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def add_blocks(self, blocks: List[Dict]) -> int:
+        """
+        Append blocks as returned by the REST ``blocks/{height}`` endpoint.
+
+        Accepts either the full response (with ``block_id``) or the bare
+        ``block`` object. Heights already stored are ignored.
+
+        Returns:
+            Number of rows inserted
+        """
+        rows = []
+        for response in blocks:
+            block = response.get('block', response)
+            header = block['header']
+            rows.append((
+                int(header['height']),
+                response.get('block_id', {}).get('hash'),
+                header['time'],
+                parse_block_time(header['time']).timestamp(),
+                header.get('proposer_address'),
+                len(block.get('data', {}).get('txs') or [])
+            ))
+        if not rows:
+            return 0
+
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO blocks (height, hash, time, timestamp, proposer, tx_count) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            return self._conn.total_changes - before
+
+    def latest_height(self) -> Optional[int]:
+        """Highest stored block height"""
+        row = self._query_one("SELECT MAX(height) AS height FROM blocks")
+        return row['height'] if row else None
+
+    def missing_heights(self, start: int, end: int) -> List[int]:
+        """Heights in [start, end] that are not stored yet, newest first"""
+        stored = {
+            row['height'] for row in self._query(
+                "SELECT height FROM blocks WHERE height BETWEEN ? AND ?", (start, end)
+            )
+        }
+        return [height for height in range(end, start - 1, -1) if height not in stored]
+
+    def average_block_time(self, last_n: int = 100) -> float:
+        """Average seconds per block over the last ``last_n`` stored heights"""
+        span = self._window_span(last_n)
+        if not span or span['max_height'] == span['min_height']:
+            return 0.0
+        return (span['max_ts'] - span['min_ts']) / (span['max_height'] - span['min_height'])
+
+    def transactions_per_second(self, last_n: int = 100) -> float:
+        """Transactions per second over the last ``last_n`` stored heights"""
+        span = self._window_span(last_n)
+        if not span or span['max_ts'] == span['min_ts']:
+            return 0.0
+        # Transactions in the oldest block happened before the measured interval
+        return (span['tx_total'] - span['oldest_tx']) / (span['max_ts'] - span['min_ts'])
+
+    def proposer_distribution(self, last_n: int = 1000) -> Dict[str, int]:
+        """Blocks proposed per validator over the last ``last_n`` stored heights"""
+        latest = self.latest_height()
+        if latest is None:
+            return {}
+        rows = self._query(
+            "SELECT proposer, COUNT(*) AS blocks FROM blocks WHERE height > ? "
+            "GROUP BY proposer ORDER BY blocks DESC",
+            (latest - last_n,)
+        )
+        return {row['proposer']: row['blocks'] for row in rows}
+
+    def block_series(self, start_ts: float, end_ts: float, bucket_seconds: int = 3600) -> List[Dict]:
+        """Block and transaction counts per time bucket, for historical charts"""
+        rows = self._query(
+            "SELECT CAST(timestamp / ? AS INTEGER) * ? AS bucket, "
+            "COUNT(*) AS blocks, SUM(tx_count) AS transactions "
+            "FROM blocks WHERE timestamp BETWEEN ? AND ? "
+            "GROUP BY bucket ORDER BY bucket",
+            (bucket_seconds, bucket_seconds, start_ts, end_ts)
+        )
+        return [dict(row) for row in rows]
+
+    def _window_span(self, last_n: int) -> Optional[sqlite3.Row]:
+        latest = self.latest_height()
+        if latest is None:
+            return None
+        return self._query_one(
+            "SELECT MIN(height) AS min_height, MAX(height) AS max_height, "
+            "MIN(timestamp) AS min_ts, MAX(timestamp) AS max_ts, "
+            "SUM(tx_count) AS tx_total, "
+            "(SELECT tx_count FROM blocks WHERE height > ? ORDER BY height LIMIT 1) AS oldest_tx "
+            "FROM blocks WHERE height > ?",
+            (latest - last_n, latest - last_n)
+        )
+
+    def _query(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _query_one(self, sql: str, params: tuple = ()) -> Optional[sqlite3.Row]:
+        rows = self._query(sql, params)
+        return rows[0] if rows else None
+
+
+class BlockSyncer:
+    """
+    Background task keeping a BlockStore in sync with the chain.
+
+    Every interval it reads the latest block, then fetches any heights
+    missing from the last ``backfill_depth`` blocks, newest first, at most
+    ``batch_size`` per round and ``max_concurrency`` at a time.
+    """
+
+    def __init__(
+        self,
+        store: BlockStore,
+        fetch_latest: Callable[[], Awaitable[Optional[Dict]]],
+        fetch_block: Callable[[int], Awaitable[Optional[Dict]]],
+        interval: float = 2.0,
+        backfill_depth: int = 10000,
+        batch_size: int = 200,
+        max_concurrency: int = 10
+    ):
+        self.store = store
+        self.fetch_latest = fetch_latest
+        self.fetch_block = fetch_block
+        self.interval = interval
+        self.backfill_depth = backfill_depth
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start syncing in the background"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the background sync"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def sync_once(self) -> int:
+        """
+        Run one sync round.
+
+        Returns:
+            Number of blocks stored
+        """
+        latest = await self.fetch_latest()
+        if not latest:
+            return 0
+        latest_height = int(latest['block']['header']['height'])
+        stored = await asyncio.to_thread(self.store.add_blocks, [latest])
+
+        missing = await asyncio.to_thread(
+            self.store.missing_heights,
+            max(latest_height - self.backfill_depth + 1, 1),
+            latest_height - 1
+        )
+        missing = missing[:self.batch_size]
+        if not missing:
+            return stored
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(height: int) -> Optional[Dict]:
+            async with semaphore:
+                try:
+                    return await self.fetch_block(height)
+                except Exception as e:
+                    logger.error(f"Error fetching block {height}: {str(e)}")
+                    return None
+
+        blocks = [block for block in await asyncio.gather(*(fetch(h) for h in missing)) if block]
+        stored += await asyncio.to_thread(self.store.add_blocks, blocks)
+        return stored
+
+    async def _run(self):
+        while True:
+            try:
+                stored = await self.sync_once()
+                if stored:
+                    logger.debug(f"Block store synced {stored} blocks")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Block sync failed: {str(e)}")
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,141 @@
+from typing import Awaitable, Callable, Dict, List, Optional
+from datetime import datetime
+import asyncio
+import re
+from loguru import logger
+
+BlockFetcher = Callable[[int], Awaitable[Optional[Dict]]]
+
+_FRACTION_PATTERN = re.compile(r'\.(\d+)')
+
+def parse_block_time(value: str) -> datetime:
+    """Parse a Tendermint RFC 3339 timestamp (nanosecond precision) into a datetime"""
+    value = value.replace('Z', '+00:00')
+    # datetime only supports microseconds, Tendermint emits up to nanoseconds
+    return datetime.fromisoformat(
+        _FRACTION_PATTERN.sub(lambda m: '.' + m.group(1)[:6].ljust(6, '0'), value, count=1)
+    )
+
+class BlockWindow:
+    """
+    Rolling window of the most recent block headers.
+
+    Headers are kept in a height-indexed ring buffer. Each sync fetches only
+    heights that are not already buffered, concurrently and bounded by a
+    semaphore, so after warm-up a sync costs one request per new block
+    instead of one per block in the window.
+    """
+
+    def __init__(self, fetch_block: BlockFetcher, size: int = 100, max_concurrency: int = 10):
+        self.fetch_block = fetch_block
+        self.size = size
+        self.max_concurrency = max_concurrency
+        self._slots: List[Optional[Dict]] = [None] * size
+        self.latest_height: Optional[int] = None
+        self._sync_lock = asyncio.Lock()
+
+    async def sync(self, latest_height: int) -> int:
+        """
+        Bring the window up to ``latest_height``.
+
+        Returns:
+            Number of blocks fetched
+        """
+        async with self._sync_lock:
+            if self.latest_height is not None and latest_height < self.latest_height:
+                # Lagging node behind a load balancer; keep the newer window
+                return 0
+
+            lowest = latest_height - self.size + 1
+            missing = [
+                height for height in range(max(lowest, 1), latest_height + 1)
+                if self._get(height) is None
+            ]
+            self.latest_height = latest_height
+            if not missing:
+                return 0
+
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def fetch(height: int) -> None:
+                async with semaphore:
+                    try:
+                        block = await self.fetch_block(height)
+                    except Exception as e:
+                        logger.error(f"Error fetching block {height}: {str(e)}")
+                        return
+                if block:
+                    self._put(height, block)
+
+            await asyncio.gather(*(fetch(height) for height in missing))
+            return len(missing)
+
+    def recent(self, limit: Optional[int] = None) -> List[Dict]:
+        """Get buffered blocks, newest first"""
+        if self.latest_height is None:
+            return []
+        limit = min(limit or self.size, self.size)
+        blocks = []
+        for height in range(self.latest_height, self.latest_height - limit, -1):
+            block = self._get(height)
+            if block is not None:
+                blocks.append(block)
+        return blocks
+
+    def average_block_time(self) -> float:
+        """
+        Average seconds per block across the window.
+
+        The mean of consecutive block intervals telescopes to
+        (newest time - oldest time) / (newest height - oldest height), so only
+        the window's two end blocks are needed.
+        """
+        newest = self._edge(newest=True)
+        oldest = self._edge(newest=False)
+        if newest is None or oldest is None or newest is oldest:
+            return 0.0
+
+        height_span = int(newest['header']['height']) - int(oldest['header']['height'])
+        time_span = (
+            parse_block_time(newest['header']['time']) - parse_block_time(oldest['header']['time'])
+        ).total_seconds()
+        return time_span / height_span
+
+    def transactions_per_second(self) -> float:
+        """Transactions per second across the window"""
+        blocks = self.recent()
+        if len(blocks) < 2:
+            return 0.0
+        time_span = (
+            parse_block_time(blocks[0]['header']['time']) - parse_block_time(blocks[-1]['header']['time'])
+        ).total_seconds()
+        if time_span <= 0:
+            return 0.0
+        # Transactions in the oldest block happened before the measured interval
+        return sum(block['tx_count'] for block in blocks[:-1]) / time_span
+
+    def _edge(self, newest: bool) -> Optional[Dict]:
+        """Find the newest or oldest buffered block in the current window"""
+        if self.latest_height is None:
+            return None
+        heights = range(self.latest_height - self.size + 1, self.latest_height + 1)
+        for height in (reversed(heights) if newest else heights):
+            block = self._get(height)
+            if block is not None:
+                return block
+        return None
+
+    def _get(self, height: int) -> Optional[Dict]:
+        block = self._slots[height % self.size]
+        if block is not None and int(block['header']['height']) == height:
+            return block
+        return None
+
+    def _put(self, height: int, block: Dict) -> None:
+        # Only the header and transaction count are kept so the window stays small
+        if self.latest_height is not None and height <= self.latest_height - self.size:
+            return
+        self._slots[height % self.size] = {
+            'header': block['header'],
+            'tx_count': len(block.get('data', {}).get('txs') or [])
+        }
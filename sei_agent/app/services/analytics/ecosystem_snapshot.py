@@ -0,0 +1,91 @@
+"""
+Ecosystem Snapshot
+
+Network and social metrics refreshed in the background on a fixed
+interval, so chat handlers read the latest values from memory instead of
+calling RPC nodes and Twitter inside the request. Reads never wait on
+upstream APIs; a section older than the staleness bound is left out
+rather than served silently out of date.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import asyncio
+import time
+from loguru import logger
+
+Source = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class EcosystemSnapshot:
+    """
+    Periodically refreshed metrics, one section per source.
+
+    Args:
+        sources: Section name to a coroutine function fetching it
+        interval: Seconds between refreshes
+        max_staleness: Default age in seconds beyond which a section is
+            not returned by ``read``
+
+    A failed source keeps its previous value (and its age keeps growing),
+    so one slow upstream cannot blank out the others. A source must raise
+    or return nothing when its upstream is down; placeholder values would
+    be stored as a fresh section.
+    """
+
+    def __init__(self, sources: Dict[str, Source], interval: float = 60.0, max_staleness: float = 300.0):
+        self.sources = sources
+        self.interval = interval
+        self.max_staleness = max_staleness
+        self._sections: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def refresh(self):
+        """Fetch every section concurrently."""
+        names = list(self.sources)
+        results = await asyncio.gather(
+            *(self.sources[name]() for name in names), return_exceptions=True
+        )
+        now = time.monotonic()
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error refreshing {name} snapshot: {str(result)}")
+            elif result:
+                self._sections[name] = (now, result)
+
+    def read(self, max_staleness: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Sections no older than ``max_staleness`` seconds.
+
+        Returns:
+            Section name to metrics; stale or never-fetched sections are absent
+        """
+        bound = self.max_staleness if max_staleness is None else max_staleness
+        now = time.monotonic()
+        return {
+            name: data
+            for name, (updated_at, data) in self._sections.items()
+            if now - updated_at <= bound
+        }
+
+    def ages(self) -> Dict[str, float]:
+        """Seconds since each section was last refreshed"""
+        now = time.monotonic()
+        return {name: round(now - updated_at, 1) for name, (updated_at, _) in self._sections.items()}
+
+    def start(self):
+        """Refresh now and then every ``interval`` seconds until ``stop``."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Error refreshing ecosystem snapshot: {str(e)}")
+            await asyncio.sleep(self.interval)
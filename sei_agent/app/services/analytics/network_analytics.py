@@ -1,32 +1,95 @@
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
-import aiohttp
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
 from loguru import logger
+from utils.http_client import HTTPClient
 from ...config.settings import Settings
+from .block_window import BlockWindow
+from .block_store import BlockStore
+
+LATEST_BLOCK_PATH = "/cosmos/base/tendermint/v1beta1/blocks/latest"
+BONDED_VALIDATORS_PATH = "/cosmos/staking/v1beta1/validators?status=BOND_STATUS_BONDED"
+STAKING_POOL_PATH = "/cosmos/staking/v1beta1/pool"
+SYNCING_PATH = "/cosmos/base/tendermint/v1beta1/syncing"
 
 class NetworkAnalytics:
-    def __init__(self):
+    def __init__(self, http_client: Optional[HTTPClient] = None):
         self.settings = Settings()
         self.base_url = self.settings.SEI_RPC_URL
-        self.session: Optional[aiohttp.ClientSession] = None
-        
+        self.tendermint_rpc_url = self.settings.SEI_TENDERMINT_RPC_URL
+        self.http_client = http_client
+        self._owns_client = False
+        self.request_timeout = 5.0  # seconds per upstream call in a status snapshot
+        self.block_window_timeout = 30.0  # first window fill makes many calls
+        self.block_window = BlockWindow(self._fetch_block, size=100)
+        self.block_store: Optional[BlockStore] = None  # set when a synced local store is available
+
     async def initialize(self):
-        """Initialize HTTP session"""
-        self.session = aiohttp.ClientSession()
-        
+        """Create a private HTTP client if no shared one was injected"""
+        if self.http_client is None:
+            self.http_client = HTTPClient()
+            self._owns_client = True
+
     async def cleanup(self):
         """Cleanup resources"""
-        if self.session:
-            await self.session.close()
-            
-    async def get_transactions_per_second(self) -> float:
+        if self.http_client and self._owns_client:
+            await self.http_client.close()
+            self.http_client = None
+            self._owns_client = False
+
+    async def _get_json(self, path: str) -> Dict:
+        """GET a REST endpoint and return its JSON body"""
+        response = await self.http_client.get(f"{self.base_url}{path}")
+        if response.status_code == 200:
+            return response.json()
+        raise Exception(f"Request to {path} failed: {response.status_code}")
+
+    async def _get_latest_block(self) -> Dict:
+        """Fetch the latest block response"""
+        return await self._get_json(LATEST_BLOCK_PATH)
+
+    async def _get_latest_block_height(self, latest_block: Optional[Dict] = None) -> int:
+        """Get the latest block height, reusing a prefetched block if given"""
+        if latest_block is None:
+            latest_block = await self._get_latest_block()
+        return int(latest_block['block']['header']['height'])
+
+    async def get_latest_block(self) -> Dict:
+        """Fetch the latest block response (the BlockSyncer tip source)"""
+        return await self._get_latest_block()
+
+    async def get_block(self, height: int) -> Optional[Dict]:
+        """Fetch the full response for one block, including its ``block_id``"""
+        response = await self.http_client.get(f"{self.base_url}/cosmos/base/tendermint/v1beta1/blocks/{height}")
+        if response.status_code == 200:
+            return response.json()
+        return None
+
+    async def _fetch_block(self, height: int) -> Optional[Dict]:
+        """Fetch a single block by height"""
+        response = await self.get_block(height)
+        return response['block'] if response else None
+
+    def _store_covers(self, latest_height: int) -> bool:
+        """Check whether the local block store is caught up with the chain tip"""
+        if self.block_store is None:
+            return False
+        stored_height = self.block_store.latest_height()
+        return stored_height is not None and stored_height >= latest_height - 1
+
+    async def _calculate_tps(self, latest_block: Dict) -> float:
+        """Calculate TPS over recent blocks, from the local block store when it is synced"""
+        latest_height = await self._get_latest_block_height(latest_block)
+        if self._store_covers(latest_height):
+            return self.block_store.transactions_per_second()
+        await self.block_window.sync(latest_height)
+        return self.block_window.transactions_per_second()
+
+    async def get_transactions_per_second(self, latest_block: Optional[Dict] = None) -> float:
         """Calculate current TPS"""
         try:
-            async with self.session.get(f"{self.base_url}/cosmos/base/tendermint/v1beta1/blocks/latest") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return await self._calculate_tps(data)
-                raise Exception(f"Failed to get block data: {response.status}")
+            if latest_block is None:
+                latest_block = await self._get_latest_block()
+            return await self._calculate_tps(latest_block)
         except Exception as e:
             logger.error(f"Error calculating TPS: {str(e)}")
             return 0.0
@@ -34,11 +97,8 @@ class NetworkAnalytics:
     async def count_active_validators(self) -> int:
         """Get count of active validators"""
         try:
-            async with self.session.get(f"{self.base_url}/cosmos/staking/v1beta1/validators?status=BOND_STATUS_BONDED") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return len(data.get('validators', []))
-                raise Exception(f"Failed to get validators: {response.status}")
+            data = await self._get_json(BONDED_VALIDATORS_PATH)
+            return len(data.get('validators', []))
         except Exception as e:
             logger.error(f"Error counting validators: {str(e)}")
             return 0
@@ -46,29 +106,32 @@ class NetworkAnalytics:
     async def get_total_stake(self) -> float:
         """Get total staked SEI"""
         try:
-            async with self.session.get(f"{self.base_url}/cosmos/staking/v1beta1/pool") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    bonded_tokens = float(data.get('pool', {}).get('bonded_tokens', 0))
-                    return bonded_tokens / 1e6  # Convert to SEI
-                raise Exception(f"Failed to get stake data: {response.status}")
+            data = await self._get_json(STAKING_POOL_PATH)
+            bonded_tokens = float(data.get('pool', {}).get('bonded_tokens', 0))
+            return bonded_tokens / 1e6  # Convert to SEI
         except Exception as e:
             logger.error(f"Error getting total stake: {str(e)}")
             return 0.0
 
-    async def get_average_block_time(self) -> float:
+    async def get_peer_count(self) -> int:
+        """Get the number of peers connected to the RPC node"""
+        try:
+            response = await self.http_client.get(f"{self.tendermint_rpc_url}/net_info")
+            if response.status_code != 200:
+                raise Exception(f"Request to /net_info failed: {response.status_code}")
+            return int(response.json()['result']['n_peers'])
+        except Exception as e:
+            logger.error(f"Error getting peer count: {str(e)}")
+            return 0
+
+    async def get_average_block_time(self, latest_block: Optional[Dict] = None) -> float:
         """Calculate average block time in seconds"""
         try:
-            blocks = await self._get_recent_blocks(100)
-            if not blocks:
-                return 0.0
-            
-            times = [datetime.fromisoformat(block['header']['time'].replace('Z', '+00:00')) 
-                    for block in blocks]
-            differences = [(times[i] - times[i+1]).total_seconds() 
-                         for i in range(len(times)-1)]
-            
-            return sum(differences) / len(differences)
+            latest_height = await self._get_latest_block_height(latest_block)
+            if self._store_covers(latest_height):
+                return self.block_store.average_block_time()
+            await self.block_window.sync(latest_height)
+            return self.block_window.average_block_time()
         except Exception as e:
             logger.error(f"Error calculating block time: {str(e)}")
             return 0.0
@@ -76,27 +139,23 @@ class NetworkAnalytics:
     async def calculate_uptime(self) -> float:
         """Calculate network uptime percentage"""
         try:
-            async with self.session.get(f"{self.base_url}/cosmos/base/tendermint/v1beta1/syncing") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return 100.0 if not data.get('syncing', True) else 0.0
-                raise Exception(f"Failed to get sync status: {response.status}")
+            data = await self._get_json(SYNCING_PATH)
+            return 100.0 if not data.get('syncing', True) else 0.0
         except Exception as e:
             logger.error(f"Error calculating uptime: {str(e)}")
             return 0.0
 
-    async def get_consensus_status(self) -> Dict:
+    async def get_consensus_status(self, latest_block: Optional[Dict] = None) -> Dict:
         """Get consensus status"""
         try:
-            async with self.session.get(f"{self.base_url}/cosmos/base/tendermint/v1beta1/blocks/latest") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        'height': int(data['block']['header']['height']),
-                        'time': data['block']['header']['time'],
-                        'proposer': data['block']['header']['proposer_address']
-                    }
-                raise Exception(f"Failed to get consensus status: {response.status}")
+            if latest_block is None:
+                latest_block = await self._get_latest_block()
+            header = latest_block['block']['header']
+            return {
+                'height': int(header['height']),
+                'time': header['time'],
+                'proposer': header['proposer_address']
+            }
         except Exception as e:
             logger.error(f"Error getting consensus status: {str(e)}")
             return {}
@@ -119,43 +178,136 @@ class NetworkAnalytics:
             logger.error(f"Error calculating health score: {str(e)}")
             return {'score': 0, 'status': 'unknown', 'metrics': {}}
 
-    async def _get_recent_blocks(self, limit: int = 100) -> List[Dict]:
-        """Get recent blocks"""
+    async def _get_recent_blocks(self, limit: int = 100, latest_height: Optional[int] = None) -> List[Dict]:
+        """Get recent blocks, newest first, fetching only heights not yet in the block window"""
         try:
-            latest = await self._get_latest_block_height()
-            blocks = []
-            for height in range(latest, latest - limit, -1):
-                async with self.session.get(f"{self.base_url}/cosmos/base/tendermint/v1beta1/blocks/{height}") as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        blocks.append(data['block'])
-            return blocks
+            latest = latest_height if latest_height is not None else await self._get_latest_block_height()
+            await self.block_window.sync(latest)
+            return self.block_window.recent(limit)
         except Exception as e:
             logger.error(f"Error getting recent blocks: {str(e)}")
             return []
 
-    async def get_status(self) -> Dict:
-        """Get comprehensive network status"""
+    async def _run_step(
+        self,
+        name: str,
+        step: Callable[[], Awaitable[Any]],
+        default: Any,
+        timeout: Optional[float] = None
+    ) -> Any:
+        """Run one step of a status snapshot with a timeout, falling back to a default"""
+        timeout = timeout or self.request_timeout
+        try:
+            return await asyncio.wait_for(step(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Network status step '{name}' timed out after {timeout}s")
+        except Exception as e:
+            logger.error(f"Network status step '{name}' failed: {str(e)}")
+        return default
+
+    async def get_status(self, strict: bool = False) -> Dict:
+        """
+        Get comprehensive network status.
+
+        Independent endpoints are fetched concurrently. The latest block is
+        fetched once and shared by every metric derived from it (TPS, block
+        metrics, average block time and consensus). Each call has its own
+        timeout; a slow or failing endpoint only blanks its own fields.
+
+        Args:
+            strict: Raise if the latest block cannot be fetched, instead of
+                returning a status of zeros, so callers keeping the last
+                good status (e.g. EcosystemSnapshot) can tell an outage apart
+        """
+        latest_block_task = asyncio.ensure_future(
+            self._run_step('latest_block', self._get_latest_block, None)
+        )
+        if strict and await asyncio.shield(latest_block_task) is None:
+            raise Exception("Latest block unavailable")
+
+        async def after_latest_block(
+            name: str,
+            step: Callable[[Dict], Awaitable[Any]],
+            default: Any,
+            timeout: Optional[float] = None
+        ) -> Any:
+            latest_block = await asyncio.shield(latest_block_task)
+            if latest_block is None:
+                return default
+            return await self._run_step(name, lambda: step(latest_block), default, timeout)
+
+        (
+            tps, block_metrics, avg_block_time, consensus,
+            active_validators, total_stake, uptime, peer_count
+        ) = await asyncio.gather(
+            after_latest_block(
+                'tps', self.get_transactions_per_second, 0.0,
+                timeout=self.block_window_timeout
+            ),
+            after_latest_block('block_metrics', self.get_block_metrics, {}),
+            after_latest_block(
+                'avg_block_time', self.get_average_block_time, 0.0,
+                timeout=self.block_window_timeout
+            ),
+            after_latest_block('consensus', self.get_consensus_status, {}),
+            self._run_step('active_validators', self.count_active_validators, 0),
+            self._run_step('total_stake', self.get_total_stake, 0.0),
+            self._run_step('uptime', self.calculate_uptime, 0.0),
+            self._run_step('peer_count', self.get_peer_count, 0)
+        )
+
         return {
-            'tps': await self.get_transactions_per_second(),
-            'validators': await self.get_validator_metrics(),
-            'blocks': await self.get_block_metrics(),
-            'network_health': await self.get_network_health()
+            'tps': tps,
+            'validators': {
+                'active_validators': active_validators,
+                'total_stake': total_stake,
+                'avg_block_time': avg_block_time
+            },
+            'blocks': block_metrics,
+            'network_health': self.calculate_health_score({
+                'uptime': uptime,
+                'consensus': consensus,
+                'peer_count': peer_count
+            })
         }
-        
+
     async def get_validator_metrics(self) -> Dict:
         """Get validator-related metrics"""
+        active_validators, total_stake, avg_block_time = await asyncio.gather(
+            self.count_active_validators(),
+            self.get_total_stake(),
+            self.get_average_block_time()
+        )
         return {
-            'active_validators': await self.count_active_validators(),
-            'total_stake': await self.get_total_stake(),
-            'avg_block_time': await self.get_average_block_time()
+            'active_validators': active_validators,
+            'total_stake': total_stake,
+            'avg_block_time': avg_block_time
         }
 
+    async def get_block_metrics(self, latest_block: Optional[Dict] = None) -> Dict:
+        """Get metrics for the latest block"""
+        try:
+            if latest_block is None:
+                latest_block = await self._get_latest_block()
+            block = latest_block['block']
+            return {
+                'height': int(block['header']['height']),
+                'time': block['header']['time'],
+                'tx_count': len(block.get('data', {}).get('txs', []) or [])
+            }
+        except Exception as e:
+            logger.error(f"Error getting block metrics: {str(e)}")
+            return {}
+
     async def get_network_health(self) -> Dict:
         """Calculate overall network health score"""
-        metrics = {
-            'uptime': await self.calculate_uptime(),
-            'consensus': await self.get_consensus_status(),
-            'peer_count': await self.get_peer_count()
-        }
-        return self.calculate_health_score(metrics) 
\ No newline at end of file
+        uptime, consensus, peer_count = await asyncio.gather(
+            self.calculate_uptime(),
+            self.get_consensus_status(),
+            self._run_step('peer_count', self.get_peer_count, 0)
+        )
+        return self.calculate_health_score({
+            'uptime': uptime,
+            'consensus': consensus,
+            'peer_count': peer_count
+        })
@@ -1,20 +1,40 @@
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 import tweepy
 from textblob import TextBlob
 import asyncio
+import threading
+import time
 from loguru import logger
 from ...config.settings import Settings
+from utils.sentiment_cache import SentimentCache
+from utils.mention_store import MentionIngestor, MentionStore
+from utils.trend_window import TrendAggregator
 
 class SocialAnalytics:
     def __init__(self):
         self.settings = Settings()
         self.twitter_api = self.setup_twitter_api()
-        self.sentiment_cache = {}
+        self.sentiment_cache = SentimentCache("textblob", path=self.settings.SENTIMENT_CACHE_PATH)
         self.keywords = [
             'SEI Network', '$SEI', 'SEI Protocol',
             'SEI DeFi', 'SEI NFT', 'SEI Ecosystem'
         ]
+        self.mention_ttl = 300  # seconds a mention snapshot is reused
+        self._mention_snapshots: Dict[int, Tuple[float, List[Dict]]] = {}
+        self._mention_fetches: Dict[int, asyncio.Task] = {}
+        self.mention_store = MentionStore(self.settings.MENTION_STORE_PATH)
+        # Per-keyword trend windows, fed by each ingestion round's new tweets
+        self.trend_aggregator = TrendAggregator()
+        self._aggregated_keywords = set()
+        self._aggregate_lock = threading.Lock()
+        self.mention_ingestor = MentionIngestor(
+            self.mention_store,
+            self._search_keyword,
+            source="twitter_api",
+            on_new=self._aggregate_mentions
+        )
         
     def setup_twitter_api(self) -> tweepy.API:
         """Initialize Twitter API client"""
@@ -29,34 +49,157 @@ class SocialAnalytics:
         return tweepy.API(auth, wait_on_rate_limit=True)
 
     async def get_recent_mentions(self, hours: int = 24) -> List[Dict]:
-        """Get recent mentions of SEI"""
+        """
+        Get recent mentions of SEI.
+
+        Served from a per-window snapshot that is refetched at most once per
+        ``mention_ttl`` seconds; concurrent callers share one upstream fetch.
+        """
+        snapshot = self._mention_snapshots.get(hours)
+        if snapshot and time.monotonic() - snapshot[0] < self.mention_ttl:
+            return snapshot[1]
+
+        task = self._mention_fetches.get(hours)
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._refresh_mentions(hours))
+            self._mention_fetches[hours] = task
+        return await asyncio.shield(task)
+
+    async def _refresh_mentions(self, hours: int) -> List[Dict]:
         try:
-            mentions = []
-            since_time = datetime.utcnow() - timedelta(hours=hours)
-            
-            for keyword in self.keywords:
-                tweets = self.twitter_api.search_tweets(
-                    q=keyword,
-                    lang="en",
-                    count=100,
-                    tweet_mode="extended"
-                )
-                
-                for tweet in tweets:
-                    if tweet.created_at >= since_time:
-                        mentions.append({
-                            'id': tweet.id,
-                            'text': tweet.full_text,
-                            'user': tweet.user.screen_name,
-                            'created_at': tweet.created_at,
-                            'retweets': tweet.retweet_count,
-                            'likes': tweet.favorite_count
-                        })
-            
-            return mentions
+            mentions = await asyncio.to_thread(self._fetch_mentions, hours)
         except Exception as e:
             logger.error(f"Error getting mentions: {str(e)}")
-            return []
+            # Fall back to the previous snapshot rather than reporting nothing
+            snapshot = self._mention_snapshots.get(hours)
+            return snapshot[1] if snapshot else []
+        self._mention_snapshots[hours] = (time.monotonic(), mentions)
+        return mentions
+
+    def _fetch_mentions(self, hours: int) -> List[Dict]:
+        """Ingest new tweets for every keyword (blocking), then read the window from the local store"""
+        # Seed first: once ingestion has stored a tweet, on_new has counted it
+        self._load_aggregates()
+        self.mention_ingestor.ingest(self.keywords, window=timedelta(hours=hours))
+        return self.mention_store.query(
+            since=datetime.now(timezone.utc) - timedelta(hours=hours),
+            keywords=self.keywords
+        )
+
+    def _search_keyword(self, keyword: str, since_id: Optional[int], since: datetime) -> List[Dict]:
+        """Search tweets newer than since_id, or created after since on the first run"""
+        # Paged down to since_id in full: the cursor moves to the newest
+        # tweet, so stopping early would skip the older new ones for good
+        tweets = tweepy.Cursor(
+            self.twitter_api.search_tweets,
+            q=keyword,
+            lang="en",
+            count=100,
+            tweet_mode="extended",
+            since_id=since_id
+        ).items()
+
+        mentions = []
+        for tweet in tweets:
+            if since_id is None and tweet.created_at < since:
+                # Results are newest first; the rest of the backfill is older
+                break
+            mentions.append({
+                'id': tweet.id,
+                'text': tweet.full_text,
+                'user': tweet.user.screen_name,
+                'created_at': tweet.created_at,
+                'retweets': tweet.retweet_count,
+                'likes': tweet.favorite_count
+            })
+        return mentions
+
+    def _aggregate_mentions(self, keyword: str, mentions: List[Dict]):
+        """Label mentions with sentiment and add them to the keyword's trend windows"""
+        for mention in mentions:
+            polarity = self.analyze_text_sentiment(mention['text'])
+            sentiment = 'positive' if polarity > 0 else 'negative' if polarity < 0 else 'neutral'
+            self.trend_aggregator.add(
+                keyword,
+                mention['created_at'],
+                mention['retweets'] + mention['likes'],
+                sentiment
+            )
+
+    def _load_aggregates(self):
+        """
+        Seed trend windows from the store the first time a keyword is queried.
+
+        Must run before the keyword is ingested: mentions stored by an
+        ingestion round are already added to the windows through on_new.
+        """
+        since = datetime.now(timezone.utc) - timedelta(days=7)
+        # Held across the seed so concurrent requests cannot count it twice
+        with self._aggregate_lock:
+            for keyword in self.keywords:
+                if keyword in self._aggregated_keywords:
+                    continue
+                self._aggregate_mentions(keyword, self.mention_store.query(since=since, keywords=[keyword]))
+                self._aggregated_keywords.add(keyword)
+
+    async def get_keyword_trends(self, hours: int = 24) -> Dict[str, Optional[Dict]]:
+        """
+        Trend metrics per keyword over the last ``hours``.
+
+        Only tweets newer than each keyword's cursor are fetched; the
+        metrics come from the streaming trend windows.
+        """
+        def ingest():
+            self._load_aggregates()
+            self.mention_ingestor.ingest(self.keywords, window=timedelta(hours=hours))
+
+        try:
+            await asyncio.to_thread(ingest)
+        except Exception as e:
+            logger.error(f"Error ingesting mentions: {str(e)}")
+        return {
+            keyword: self.trend_aggregator.query(keyword, hours * 3600)
+            for keyword in self.keywords
+        }
+
+    def summarize_mentions(self, mentions: List[Dict]) -> Dict:
+        """
+        Derive sentiment, engagement and hashtag metrics in a single pass.
+
+        Returns:
+            Dict with 'overall_sentiment' (percentages), 'engagement_rate'
+            and 'trending_topics' (top 10 hashtags)
+        """
+        sentiments = {'positive': 0, 'neutral': 0, 'negative': 0}
+        total_engagement = 0
+        topics = Counter()
+
+        for mention in mentions:
+            polarity = self.analyze_text_sentiment(mention['text'])
+            if polarity > 0:
+                sentiments['positive'] += 1
+            elif polarity < 0:
+                sentiments['negative'] += 1
+            else:
+                sentiments['neutral'] += 1
+
+            total_engagement += mention['retweets'] + mention['likes']
+            topics.update(
+                word for word in mention['text'].lower().split() if word.startswith('#')
+            )
+
+        total = len(mentions)
+        return {
+            'overall_sentiment': {
+                label: round(count / total * 100, 2) if total else 0
+                for label, count in sentiments.items()
+            },
+            'engagement_rate': round(total_engagement / total, 2) if total else 0.0,
+            'trending_topics': [
+                {'topic': topic, 'mentions': count}
+                for topic, count in topics.most_common(10)
+            ]
+        }
 
     async def calculate_overall_sentiment(self, mentions: List[Dict]) -> Dict:
         """Calculate overall sentiment from mentions"""
@@ -88,59 +231,54 @@ class SocialAnalytics:
     def analyze_text_sentiment(self, text: str) -> float:
         """Analyze sentiment of text using TextBlob"""
         try:
-            analysis = TextBlob(text)
-            return analysis.sentiment.polarity
+            return self.sentiment_cache.score(text, lambda t: TextBlob(t).sentiment.polarity)
         except Exception as e:
             logger.error(f"Error analyzing sentiment: {str(e)}")
             return 0.0
 
-    async def get_trending_topics(self) -> List[Dict]:
+    async def get_trending_topics(self, mentions: Optional[List[Dict]] = None) -> List[Dict]:
         """Get trending topics related to SEI"""
         try:
-            mentions = await self.get_recent_mentions(hours=24)
-            topics = {}
-            
-            for mention in mentions:
-                words = mention['text'].lower().split()
-                for word in words:
-                    if word.startswith('#'):
-                        topics[word] = topics.get(word, 0) + 1
-            
-            sorted_topics = sorted(
-                topics.items(), 
-                key=lambda x: x[1], 
-                reverse=True
-            )[:10]
-            
+            if mentions is None:
+                mentions = await self.get_recent_mentions(hours=24)
+            topics = Counter(
+                word
+                for mention in mentions
+                for word in mention['text'].lower().split()
+                if word.startswith('#')
+            )
             return [
                 {'topic': topic, 'mentions': count}
-                for topic, count in sorted_topics
+                for topic, count in topics.most_common(10)
             ]
         except Exception as e:
             logger.error(f"Error getting trending topics: {str(e)}")
             return []
 
-    async def get_community_growth(self) -> Dict:
+    async def get_community_growth(self, engagement_rate: Optional[float] = None) -> Dict:
         """Get community growth metrics"""
         try:
-            user = self.twitter_api.get_user(screen_name="SeiNetwork")
+            user = await asyncio.to_thread(self.twitter_api.get_user, screen_name="SeiNetwork")
             current_followers = user.followers_count
+            if engagement_rate is None:
+                engagement_rate = await self.calculate_engagement_rate()
             
             # Get historical data from cache/database
             # For MVP, we'll return basic metrics
             return {
                 'followers': current_followers,
                 'growth_rate': 0,  # To be implemented with historical data
-                'engagement_rate': await self.calculate_engagement_rate()
+                'engagement_rate': engagement_rate
             }
         except Exception as e:
             logger.error(f"Error getting community growth: {str(e)}")
             return {'followers': 0, 'growth_rate': 0, 'engagement_rate': 0}
 
-    async def calculate_engagement_rate(self) -> float:
+    async def calculate_engagement_rate(self, mentions: Optional[List[Dict]] = None) -> float:
         """Calculate engagement rate"""
         try:
-            mentions = await self.get_recent_mentions(hours=24)
+            if mentions is None:
+                mentions = await self.get_recent_mentions(hours=24)
             if not mentions:
                 return 0.0
             
@@ -155,13 +293,25 @@ class SocialAnalytics:
             return 0.0
 
     async def get_sentiment(self) -> Dict:
-        """Get social sentiment analysis"""
+        """
+        Get social sentiment analysis.
+
+        All metrics are derived from one shared mention snapshot in a single
+        pass, so a request costs at most one round of keyword searches.
+        """
         mentions = await self.get_recent_mentions()
+        try:
+            summary = await asyncio.to_thread(self.summarize_mentions, mentions)
+        except Exception as e:
+            logger.error(f"Error calculating sentiment: {str(e)}")
+            summary = {
+                'overall_sentiment': {'positive': 0, 'neutral': 0, 'negative': 0},
+                'engagement_rate': 0.0,
+                'trending_topics': []
+            }
         return {
-            'overall_sentiment': await self.calculate_overall_sentiment(mentions),
-            'engagement_rate': await self.calculate_engagement_rate(),
-            'trending_topics': await self.get_trending_topics(),
-            'community_growth': await self.get_community_growth()
+            **summary,
+            'community_growth': await self.get_community_growth(summary['engagement_rate'])
         }
         
     async def analyze_community_sentiment(self, timeframe: str = '24h') -> Dict:
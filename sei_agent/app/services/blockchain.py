@@ -1,11 +1,13 @@
 from loguru import logger
-import httpx
 from typing import Optional, Dict, List, Any
 from tenacity import retry, stop_after_attempt, wait_exponential
+from utils.http_client import HTTPClient
 
 class BlockchainService:
-    def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
+    def __init__(self, http_client: Optional[HTTPClient] = None):
+        # Use the shared pooled client when one is injected
+        self._owns_client = http_client is None
+        self.client = http_client or HTTPClient(timeout=30.0)
         self.base_url = "https://rest.atlantic-2.seinetwork.io"
         
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
@@ -48,8 +50,9 @@ class BlockchainService:
             return []
 
     async def close(self):
-        """Close the HTTP client connection."""
-        await self.client.aclose()
+        """Close the HTTP client connection if this service created it."""
+        if self._owns_client:
+            await self.client.close()
 
     async def fetch_real_time_data(self) -> Dict[str, Any]:
         # Implement real-time data fetching
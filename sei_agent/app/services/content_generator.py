@@ -1,22 +1,33 @@
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
+import asyncio
 from loguru import logger
+from utils.http_client import HTTPClient
 from .analytics.social_analytics import SocialAnalytics
 from .analytics.network_analytics import NetworkAnalytics
-from .protocol_trackers.base import AstroportTracker
 from .conversation.chat_engine import SEIConversationEngine
 from .conversation.advanced_chat_engine import AdvancedSEIConversationEngine
+from .analytics.ecosystem_snapshot import EcosystemSnapshot
 
 class ContentGenerator:
-    def __init__(self):
-        self.social_analytics = SocialAnalytics()
-        self.network_analytics = NetworkAnalytics()
-        self.protocol_tracker = AstroportTracker()
+    def __init__(
+        self,
+        http_client: Optional[HTTPClient] = None,
+        social_analytics: Optional[SocialAnalytics] = None,
+        chat_engine: Optional[AdvancedSEIConversationEngine] = None,
+        snapshot: Optional[EcosystemSnapshot] = None,
+        network_analytics: Optional[NetworkAnalytics] = None
+    ):
+        self.social_analytics = social_analytics or SocialAnalytics()
+        self.network_analytics = network_analytics or NetworkAnalytics(http_client)
+        # Chat reads precomputed metrics from here when set, instead of calling upstream
+        self.snapshot = snapshot
+        # One engine serves every chat request; per-user context lives in its session store
+        self.chat_engine = chat_engine or AdvancedSEIConversationEngine(
+            self.network_analytics, self.social_analytics, snapshot=snapshot
+        )
         self.content_types = {
-            'network_update': self.generate_network_update,
-            'market_analysis': self.generate_market_analysis,
-            'educational': self.generate_educational_content,
-            'community': self.generate_community_update
+            'educational': self.generate_educational_content
         }
 
     async def generate_hourly_content(self) -> Dict:
@@ -112,20 +123,62 @@ class ContentGenerator:
         template = self.brand_voice.get_thread_template()
         return await self.format_educational_content(topic, template)
 
-    async def generate_chat_response(self, message: str, user_id: str = "default") -> Dict:
+    async def stream_chat_response(self, message: str, user_id: Optional[str] = None) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        Yield the chat reply in parts as each becomes ready.
+
+        Yields ``(event, data)`` pairs: the pattern-matched ``response``
+        first, then ``suggested_actions``, then ``metrics``. Nothing is
+        fetched before the first two; without a snapshot, only the sections
+        the response's ``data_requirements`` name are fetched, and each is
+        sent as soon as its live fetch completes.
+        """
+        response = await self.chat_engine.match_message(message, user_id)
+        yield 'response', {'response': response['response'], 'data': response.get('data', {})}
+        yield 'suggested_actions', {'suggested_actions': response.get('follow_up', [])}
+
+        if self.snapshot is not None:
+            yield 'metrics', self.snapshot.read()
+            return
+
+        async def fetch(name: str, coro) -> Tuple[str, Dict]:
+            return name, await coro
+
+        tasks = [
+            asyncio.ensure_future(fetch(name, loader()))
+            for name, loader in self._live_fetches(response).items()
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                name, data = await next_done
+                yield 'metrics', {name: data}
+        finally:
+            # Client went away or a fetch failed; don't leave fetches running
+            for task in tasks:
+                task.cancel()
+
+    async def generate_chat_response(self, message: str, user_id: Optional[str] = None) -> Dict:
         """Generate enhanced conversational response"""
-        chat_engine = AdvancedSEIConversationEngine()
+        # Match with context; the metrics below cover any data it requires
+        response = await self.chat_engine.match_message(message, user_id)
+        data = response.setdefault('data', {})
         
-        # Process message with context
-        response = await chat_engine.process_message(message, user_id)
+        if self.snapshot is not None:
+            # Bounded staleness, no upstream calls in the request path
+            data.update(self.snapshot.read())
+        else:
+            fetches = self._live_fetches(response)
+            results = await asyncio.gather(*(loader() for loader in fetches.values()))
+            data.update(zip(fetches, results))
         
-        # Enhance with additional data if needed
-        if 'data' in response:
-            network_stats = await self.network_analytics.get_status()
-            social_stats = await self.social_analytics.get_sentiment()
-            response['data'].update({
-                'network': network_stats,
-                'social': social_stats
-            })
-        
-        return response 
\ No newline at end of file
+        return response
+
+    def _live_fetches(self, response: Dict) -> Dict[str, Callable[[], Awaitable[Dict]]]:
+        """Upstream fetches for the data sections a matched response requires"""
+        requirements = response.get('data_requirements', [])
+        fetches = {}
+        if 'network_stats' in requirements:
+            fetches['network'] = self.network_analytics.get_status
+        if 'social_metrics' in requirements:
+            fetches['social'] = self.social_analytics.get_sentiment
+        return fetches 
\ No newline at end of file
@@ -1,28 +1,68 @@
 from typing import Dict, List, Optional, Tuple
-import re
 from loguru import logger
+import time
 from .patterns import CONVERSATION_PATTERNS
 from ..analytics.network_analytics import NetworkAnalytics
 from ..analytics.social_analytics import SocialAnalytics
+from ..analytics.ecosystem_snapshot import EcosystemSnapshot
 from .eliza_patterns import ElizaPatternMatcher
+from .pattern_dispatch import PatternDispatcher
+from .session_records import ConversationContext
+from .session_store import SessionStore
 import random
 
 class AdvancedSEIConversationEngine:
-    def __init__(self):
+    """
+    Long-lived conversation engine shared by all users.
+
+    Build it once and reuse it: pattern tables are compiled at
+    construction, analytics services are injected, and per-user context
+    lives in a shared, bounded SessionStore rather than on the engine.
+    """
+
+    def __init__(
+        self,
+        network_analytics: Optional[NetworkAnalytics] = None,
+        social_analytics: Optional[SocialAnalytics] = None,
+        sessions: Optional[SessionStore[ConversationContext]] = None,
+        snapshot: Optional[EcosystemSnapshot] = None
+    ):
         self.patterns = CONVERSATION_PATTERNS
-        self.context = {}
-        self.network_analytics = NetworkAnalytics()
-        self.social_analytics = SocialAnalytics()
-        self.conversation_history = []
+        self.dispatcher = PatternDispatcher(self.patterns)
+        self.context = sessions if sessions is not None else SessionStore(ConversationContext, 'chat_context')
+        self.network_analytics = network_analytics or NetworkAnalytics()
+        self.social_analytics = social_analytics or SocialAnalytics()
         self.eliza_matcher = ElizaPatternMatcher()
+        # Precomputed metrics; without one, data is fetched live per message
+        self.snapshot = snapshot
         
-    async def process_message(self, message: str, user_id: str = "default") -> Dict:
+    async def process_message(self, message: str, user_id: Optional[str] = None) -> Dict:
         """Process message using ELIZA patterns first, then domain-specific logic"""
+        response = await self.match_message(message, user_id)
+        try:
+            return await self.enhance_with_data(response)
+        except Exception as e:
+            logger.error(f"Error in conversation processing: {str(e)}")
+            return self.generate_fallback_response()
+
+    async def match_message(self, message: str, user_id: Optional[str] = None) -> Dict:
+        """
+        Pattern-match a message without fetching any data.
+
+        The response lists the data it needs in 'data_requirements' for
+        ``enhance_with_data``, so a streaming reply can send the text
+        before any upstream call. Anonymous messages (no ``user_id``)
+        neither read nor update any user's context.
+        """
         try:
+            if user_id is not None:
+                # Restores the user's context from the snapshot backend if needed
+                await self.context.load(user_id)
+                self.update_context(message, user_id)
+
             # Try ELIZA-style pattern matching first
             if eliza_response := self.eliza_matcher.match_pattern(message):
-                response = self.format_eliza_response(eliza_response)
-                return await self.enhance_with_data(response)
+                return self.format_eliza_response(eliza_response)
                 
             # Fall back to domain-specific patterns
             return await self.match_and_respond(message)
@@ -35,51 +75,54 @@ class AdvancedSEIConversationEngine:
         """Match message against patterns and generate response"""
         message = message.lower()
         
-        for pattern, handlers in self.patterns.items():
-            if match := re.search(pattern, message):
-                response_func = handlers['response_func']
-                response = await response_func(self, match)
-                return {
-                    'response': response['text'],
-                    'follow_up': response.get('follow_up', []),
-                    'data': response.get('data', {}),
-                    'sentiment': response.get('sentiment', 'neutral')
-                }
+        if result := self.dispatcher.match(message):
+            match, handlers = result
+            response_func = handlers['response_func']
+            response = await response_func(self, match)
+            return {
+                'response': response['text'],
+                'follow_up': response.get('follow_up', []),
+                'data': response.get('data', {}),
+                'data_requirements': response.get('data_requirements', []),
+                'sentiment': response.get('sentiment', 'neutral')
+            }
                 
         return await self.generate_default_response(message)
         
     def update_context(self, message: str, user_id: str):
         """Update conversation context"""
-        if user_id not in self.context:
-            self.context[user_id] = {
-                'topics_discussed': set(),
-                'questions_asked': [],
-                'sentiment': 'neutral',
-                'expertise_level': 'beginner',
-                'last_interaction': None
-            }
-            
-        context = self.context[user_id]
-        context['last_interaction'] = datetime.now()
+        context = self.context.get_or_create(user_id)
+        context.last_interaction = time.time()
         
         # Update topics discussed
         for topic in ['defi', 'trading', 'development', 'network']:
             if topic in message.lower():
-                context['topics_discussed'].add(topic)
+                context.topics_discussed.add(topic)
                 
         # Update expertise level based on conversation
         if any(term in message.lower() for term in ['code', 'develop', 'smart contract']):
-            context['expertise_level'] = 'advanced'
+            context.expertise_level = 'advanced'
+        self.context.mark_dirty(user_id)
             
     async def enhance_with_data(self, response: Dict) -> Dict:
         """Enhance response with real-time data"""
-        if 'network_stats' in response.get('data_requirements', []):
+        requirements = response.get('data_requirements', [])
+        data = response.setdefault('data', {})
+        if self.snapshot is not None:
+            metrics = self.snapshot.read()
+            if 'network_stats' in requirements and 'network' in metrics:
+                data['network'] = metrics['network']
+            if 'social_metrics' in requirements and 'social' in metrics:
+                data['social'] = metrics['social']
+            return response
+
+        if 'network_stats' in requirements:
             stats = await self.network_analytics.get_status()
-            response['data']['network'] = stats
+            data['network'] = stats
             
-        if 'social_metrics' in response.get('data_requirements', []):
+        if 'social_metrics' in requirements:
             metrics = await self.social_analytics.get_sentiment()
-            response['data']['social'] = metrics
+            data['social'] = metrics
             
         return response
         
@@ -97,17 +140,16 @@ class AdvancedSEIConversationEngine:
 
     async def handle_context_based_response(self, user_id: str) -> Optional[Dict]:
         """Handle responses based on conversation context"""
-        if user_id not in self.context:
+        context = self.context.get(user_id)
+        if context is None:
             return None
-            
-        context = self.context[user_id]
         
         # Handle follow-ups based on expertise level
-        if context['expertise_level'] == 'advanced':
+        if context.expertise_level == 'advanced':
             return await self.generate_advanced_response(context)
         
         # Handle based on topics discussed
-        if 'defi' in context['topics_discussed']:
+        if 'defi' in context.topics_discussed:
             return await self.generate_defi_focused_response(context)
             
         return None 
@@ -1,6 +1,6 @@
 from typing import Dict, List, Optional
-import re
 from loguru import logger
+from .pattern_dispatch import PatternDispatcher
 
 class SEIConversationEngine:
     def __init__(self):
@@ -22,20 +22,20 @@ class SEIConversationEngine:
                 'follow_up': ["Would you like to see our developer documentation?", "Are you interested in building a specific type of application?"]
             }
         }
+        self.dispatcher = PatternDispatcher(self.patterns)
         self.context = {}
 
     async def process_message(self, message: str) -> Dict:
         """Process incoming message and generate response"""
         try:
             # Check for pattern matches
-            for pattern, response_data in self.patterns.items():
-                if re.search(pattern, message):
-                    response = await self.enhance_response(response_data)
-                    return {
-                        'response': response['response'],
-                        'follow_up': response.get('follow_up', []),
-                        'data': response.get('data', {})
-                    }
+            if result := self.dispatcher.match(message):
+                response = await self.enhance_response(result[1])
+                return {
+                    'response': response['response'],
+                    'follow_up': response.get('follow_up', []),
+                    'data': response.get('data', {})
+                }
 
             # Default response with network stats
             return await self.generate_default_response(message)
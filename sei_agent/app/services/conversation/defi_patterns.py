@@ -8,6 +8,7 @@ import re
 from datetime import datetime
 from loguru import logger
 import random
+from .pattern_dispatch import PatternDispatcher
 
 class DeFiConversationEngine:
     def __init__(self):
@@ -47,6 +48,8 @@ class DeFiConversationEngine:
             }
         }
         
+        self.dispatcher = PatternDispatcher(self.defi_patterns, flags=re.I, search=False)
+        
         # Track trending DeFi topics
         self.trending_topics = {
             'yield_farming': 0,
@@ -62,10 +65,10 @@ class DeFiConversationEngine:
             self.update_trending_topics(message)
             
             # Match patterns
-            for pattern, data in self.defi_patterns.items():
-                if match := re.match(pattern, message, re.I):
-                    response = await self.generate_defi_response(match, data, user_context)
-                    return self.add_personality(response, user_context)
+            if result := self.dispatcher.match(message):
+                match, data = result
+                response = await self.generate_defi_response(match, data, user_context)
+                return self.add_personality(response, user_context)
                     
             return await self.generate_default_defi_response(message)
             
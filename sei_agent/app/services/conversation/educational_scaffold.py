@@ -2,11 +2,13 @@
 Educational scaffolding system inspired by ELIZA's contextual awareness.
 """
 
-from typing import Dict, List
-from datetime import datetime
+from typing import Dict, List, Optional
+import time
+from .session_records import LearningProgress, PathProgress
+from .session_store import SessionStore
 
 class EducationalScaffold:
-    def __init__(self):
+    def __init__(self, sessions: Optional[SessionStore[LearningProgress]] = None):
         self.learning_paths = {
             'trading': [
                 'market_basics',
@@ -28,27 +30,22 @@ class EducationalScaffold:
             ]
         }
         
-        self.user_progress = {}
+        self.user_progress = sessions if sessions is not None else SessionStore(LearningProgress, 'learning_progress')
 
-    def track_progress(self, user_id: str, topic: str, subtopic: str):
+    async def track_progress(self, user_id: str, topic: str, subtopic: str):
         """Track user's learning progress"""
-        if user_id not in self.user_progress:
-            self.user_progress[user_id] = {}
-        
-        if topic not in self.user_progress[user_id]:
-            self.user_progress[user_id][topic] = {
-                'current_level': 0,
-                'completed_topics': set(),
-                'last_interaction': None
-            }
-            
-        self.user_progress[user_id][topic]['completed_topics'].add(subtopic)
-        self.user_progress[user_id][topic]['last_interaction'] = datetime.now()
+        # load, not get_or_create: an empty record would overwrite the saved one
+        record = await self.user_progress.load(user_id)
+        progress = record.paths.setdefault(topic, PathProgress())
+        progress.completed_topics.add(subtopic)
+        progress.last_interaction = time.time()
+        self.user_progress.mark_dirty(user_id)
 
-    def get_next_topic(self, user_id: str, path: str) -> str:
+    async def get_next_topic(self, user_id: str, path: str) -> str:
         """Get next topic in learning path"""
-        progress = self.user_progress.get(user_id, {}).get(path, {})
-        completed = progress.get('completed_topics', set())
+        record = await self.user_progress.load(user_id)
+        progress = record.paths.get(path)
+        completed = progress.completed_topics if progress else set()
         all_topics = self.learning_paths[path]
         
         for topic in all_topics:
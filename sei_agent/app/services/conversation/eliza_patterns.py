@@ -6,6 +6,7 @@ Original ELIZA concepts by Joseph Weizenbaum (MIT, 1966)
 from typing import Dict, List, Pattern
 import re
 from datetime import datetime
+from .pattern_dispatch import PatternDispatcher
 
 class ElizaPatternMatcher:
     def __init__(self):
@@ -78,6 +79,7 @@ class ElizaPatternMatcher:
                 'follow_up': ['comparison', 'examples', 'use_cases']
             }
         }
+        self.dispatcher = PatternDispatcher(self.patterns, flags=re.I, search=False)
 
     def get_expertise_level(self, message: str) -> str:
         """Determine user's expertise level from message content"""
@@ -127,11 +129,11 @@ class ElizaPatternMatcher:
         """
         Enhanced ELIZA-style pattern matching with blockchain context
         """
-        for pattern, response_data in self.patterns.items():
-            if match := re.match(pattern, input_text, re.I):
-                return {
-                    'match': match,
-                    'response_template': response_data['reassembly'],
-                    'variables': dict(zip(response_data['decomposition'], match.groups()))
-                }
+        if result := self.dispatcher.match(input_text):
+            match, response_data = result
+            return {
+                'match': match,
+                'response_template': response_data['reassembly'],
+                'variables': dict(zip(response_data['decomposition'], match.groups()))
+            }
         return None 
\ No newline at end of file
@@ -4,6 +4,7 @@ Market-specific conversation patterns extending ELIZA framework.
 
 from typing import Dict, List
 import re
+from .pattern_dispatch import PatternDispatcher
 
 class MarketPatternMatcher:
     def __init__(self):
@@ -41,12 +42,13 @@ class MarketPatternMatcher:
                 'data_requirements': ['risk_metrics', 'historical_data']
             }
         }
+        self.dispatcher = PatternDispatcher(self.market_patterns, flags=re.I, search=False)
 
     async def process_market_query(self, message: str, user_context: Dict) -> Dict:
         """Process market-related queries with context awareness"""
-        for pattern, response_data in self.market_patterns.items():
-            if match := re.match(pattern, message, re.I):
-                return await self.generate_market_response(match, response_data, user_context)
+        if result := self.dispatcher.match(message):
+            match, response_data = result
+            return await self.generate_market_response(match, response_data, user_context)
         return None
 
     async def generate_market_response(self, match: re.Match, response_data: Dict, user_context: Dict) -> Dict:
@@ -0,0 +1,162 @@
+"""
+Compiled multi-pattern dispatch.
+
+Patterns are compiled once at load. For each one the literal text any
+match must contain is extracted from its parse tree (for example "what"
+in ``(?i)what.*(?:chain|l1)``, or one of "price"/"market" in
+``(price|market)``), and at match time a pattern only runs if that text
+occurs in the message. Substring checks are far cheaper than regex
+scans, so on a typical message most patterns are skipped without
+running at all.
+
+Each pattern still costs one substring check per message, so matching
+stays linear in the number of patterns; it is the regex scans that are
+skipped.
+
+Priority follows the order the patterns were given in: an earlier pattern
+wins over a later one even if the later one matches further left.
+"""
+
+from typing import Dict, Generic, Iterable, List, Mapping, Optional, Pattern, Tuple, TypeVar, Union
+import functools
+import re
+
+try:
+    from re import _constants as _sre, _parser as _sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants as _sre
+    import sre_parse as _sre_parse
+
+V = TypeVar('V')
+
+# (text, case-insensitive); a case-insensitive literal is ASCII lowercase
+Literal = Tuple[str, bool]
+# At least one of these must occur in any text the pattern matches
+Requirement = Tuple[Literal, ...]
+
+_REQUIRED_ITEM = (_sre.MAX_REPEAT, _sre.MIN_REPEAT, getattr(_sre, 'POSSESSIVE_REPEAT', None))
+
+
+def _collect(items, ignorecase: bool, requirements: List[Requirement]):
+    """Append the requirements of a parsed sequence"""
+    run: List[str] = []
+
+    def flush():
+        if run:
+            requirements.append(((''.join(run), ignorecase),))
+            run.clear()
+
+    for op, av in items:
+        if op is _sre.LITERAL and (not ignorecase or av < 128):
+            run.append(chr(av).lower() if ignorecase else chr(av))
+            continue
+        flush()
+        if op is _sre.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            scoped = (ignorecase or bool(add_flags & re.IGNORECASE)) and not del_flags & re.IGNORECASE
+            _collect(sub, scoped, requirements)
+        elif op is getattr(_sre, 'ATOMIC_GROUP', None):
+            _collect(av, ignorecase, requirements)
+        elif op in _REQUIRED_ITEM and av[0] >= 1:
+            _collect(av[2], ignorecase, requirements)
+        elif op is _sre.BRANCH:
+            # Each branch must contribute an option, else the branch is free
+            options = []
+            for branch in av[1]:
+                branch_requirements: List[Requirement] = []
+                _collect(branch, ignorecase, branch_requirements)
+                if not branch_requirements:
+                    options = None
+                    break
+                options.extend(_most_selective(branch_requirements))
+            if options:
+                requirements.append(tuple(options))
+    flush()
+
+
+def _most_selective(requirements: List[Requirement]) -> Requirement:
+    # The requirement whose shortest option is longest
+    return max(requirements, key=lambda options: min(len(text) for text, _ in options))
+
+
+@functools.lru_cache(maxsize=None)
+def _ascii_fold() -> Dict[int, int]:
+    """
+    Translation mapping every character IGNORECASE treats as equal to an
+    ASCII character onto that character in lowercase.
+
+    Besides A-Z, sre matches a few non-ASCII characters against ASCII
+    letters (dotless "ı" and "İ" for "i", "ſ" for "s", the Kelvin sign for
+    "k") that ``str.casefold`` does not map, so the table is read off sre
+    itself. No character outside the BMP is case-equivalent to ASCII.
+    """
+    table = {code: ord(chr(code).lower()) for code in range(128)}
+    candidates = ''.join(map(chr, range(0x80, 0xD800))) + ''.join(map(chr, range(0xE000, 0x10000)))
+    for char in set(re.findall(r'(?i)[\x00-\x7f]', candidates)):
+        code = next(code for code in range(128) if re.fullmatch('(?i)' + re.escape(chr(code)), char))
+        table[ord(char)] = table[code]
+    return table
+
+
+def required_literals(pattern: Pattern) -> Optional[Requirement]:
+    """
+    Literals one of which occurs in every text ``pattern`` can match.
+
+    Returns:
+        The most selective such set, or None if none can be derived (the
+        pattern is then always run)
+    """
+    try:
+        parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None
+    flags = parsed.state.flags
+    if flags & re.LOCALE:
+        return None
+    requirements: List[Requirement] = []
+    _collect(parsed, bool(flags & re.IGNORECASE), requirements)
+    return _most_selective(requirements) if requirements else None
+
+
+class PatternDispatcher(Generic[V]):
+    """
+    First-match dispatch over an ordered set of regex patterns.
+
+    Args:
+        patterns: Mapping or (pattern, value) pairs, in priority order
+        flags: Flags applied to every pattern
+        search: Match anywhere in the text like ``re.search``; when False,
+            match at the start like ``re.match``
+
+    ``match`` returns the winning pattern's own ``re.Match`` and its value.
+    """
+
+    def __init__(
+        self,
+        patterns: Union[Mapping[str, V], Iterable[Tuple[str, V]]],
+        flags: int = 0,
+        search: bool = True
+    ):
+        items = patterns.items() if isinstance(patterns, Mapping) else patterns
+        self._compiled: List[Tuple[Pattern, V, Optional[Requirement]]] = []
+        for pattern, value in items:
+            compiled = re.compile(pattern, flags)
+            self._compiled.append((compiled, value, required_literals(compiled)))
+        self.search = search
+        self._fold = _ascii_fold()
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def match(self, text: str) -> Optional[Tuple[re.Match, V]]:
+        """Find the highest-priority pattern matching ``text``."""
+        folded = None
+        for compiled, value, requirement in self._compiled:
+            if requirement is not None:
+                if folded is None:
+                    folded = text.translate(self._fold)
+                if not any(literal in (folded if fold else text) for literal, fold in requirement):
+                    continue
+            if match := (compiled.search(text) if self.search else compiled.match(text)):
+                return match, value
+        return None
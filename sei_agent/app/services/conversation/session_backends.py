@@ -0,0 +1,129 @@
+"""
+Snapshot backends for SessionStore.
+
+A backend persists session records as JSON dicts keyed by namespace and
+user id. SQLiteSessionBackend keeps them on local disk so sessions
+survive restarts; RedisSessionBackend keeps them where any worker or host
+can restore them and lets Redis expire idle users.
+"""
+
+from typing import Any, Dict, Optional
+from pathlib import Path
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from loguru import logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    namespace TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (namespace, user_id)
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions (updated_at);
+"""
+
+
+class SQLiteSessionBackend:
+    """
+    Session snapshots in a local SQLite file.
+
+    Rows idle for longer than ``ttl`` seconds are dropped on save.
+    """
+
+    def __init__(self, path: str = "data/sessions.db", ttl: float = 7 * 24 * 3600):
+        self.path = path
+        self.ttl = ttl
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+
+    async def load(self, namespace: str, user_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._load, namespace, user_id)
+
+    async def save_many(self, namespace: str, records: Dict[str, Dict[str, Any]]):
+        await asyncio.to_thread(self._save_many, namespace, records)
+
+    async def delete(self, namespace: str, user_id: str):
+        await asyncio.to_thread(self._delete, namespace, user_id)
+
+    async def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _load(self, namespace: str, user_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM sessions WHERE namespace = ? AND user_id = ? AND updated_at >= ?",
+                (namespace, user_id, time.time() - self.ttl)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _save_many(self, namespace: str, records: Dict[str, Dict[str, Any]]):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sessions (namespace, user_id, data, updated_at) VALUES (?, ?, ?, ?)",
+                [(namespace, user_id, json.dumps(data), now) for user_id, data in records.items()]
+            )
+            self._conn.execute("DELETE FROM sessions WHERE updated_at < ?", (now - self.ttl,))
+
+    def _delete(self, namespace: str, user_id: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM sessions WHERE namespace = ? AND user_id = ?", (namespace, user_id)
+            )
+
+
+class RedisSessionBackend:
+    """
+    Session snapshots in Redis, reachable from every worker.
+
+    Keys expire ``ttl`` seconds after their last save.
+
+    Attributes:
+        redis: Async Redis client (``redis.asyncio``)
+        prefix (str): Prefix for every session key
+    """
+
+    def __init__(self, redis_client, prefix: str = "sessions", ttl: float = 7 * 24 * 3600):
+        self.redis = redis_client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> 'RedisSessionBackend':
+        import redis.asyncio as aioredis
+        return cls(aioredis.from_url(url), **kwargs)
+
+    async def load(self, namespace: str, user_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            raw = await self.redis.get(self._key(namespace, user_id))
+            return json.loads(raw) if raw is not None else None
+        except Exception as e:
+            logger.error(f"Error loading session {namespace}:{user_id} from Redis: {str(e)}")
+            return None
+
+    async def save_many(self, namespace: str, records: Dict[str, Dict[str, Any]]):
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for user_id, data in records.items():
+                pipe.set(self._key(namespace, user_id), json.dumps(data), ex=max(int(self.ttl), 1))
+            await pipe.execute()
+
+    async def delete(self, namespace: str, user_id: str):
+        await self.redis.delete(self._key(namespace, user_id))
+
+    async def close(self):
+        await self.redis.close()
+
+    def _key(self, namespace: str, user_id: str) -> str:
+        return f"{self.prefix}:{namespace}:{user_id}"
@@ -0,0 +1,121 @@
+"""
+Compact per-user session records.
+
+Each record uses __slots__ and converts to and from plain JSON types, so
+it can be snapshotted to disk or Redis. Sets are stored as lists and
+times as epoch seconds.
+"""
+
+from typing import Any, Dict, List, Optional
+
+# Recent questions kept per user; older ones are dropped
+MAX_QUESTIONS = 20
+
+
+class ConversationContext:
+    """Chat context for one user (AdvancedSEIConversationEngine)."""
+
+    __slots__ = ('topics_discussed', 'questions_asked', 'sentiment', 'expertise_level', 'last_interaction')
+
+    def __init__(self):
+        self.topics_discussed: set = set()
+        self.questions_asked: List[str] = []
+        self.sentiment = 'neutral'
+        self.expertise_level = 'beginner'
+        self.last_interaction: Optional[float] = None
+
+    def add_question(self, question: str):
+        self.questions_asked.append(question)
+        del self.questions_asked[:-MAX_QUESTIONS]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'topics_discussed': sorted(self.topics_discussed),
+            'questions_asked': self.questions_asked,
+            'sentiment': self.sentiment,
+            'expertise_level': self.expertise_level,
+            'last_interaction': self.last_interaction
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ConversationContext':
+        context = cls()
+        context.topics_discussed = set(data.get('topics_discussed', ()))
+        context.questions_asked = list(data.get('questions_asked', ()))[-MAX_QUESTIONS:]
+        context.sentiment = data.get('sentiment', 'neutral')
+        context.expertise_level = data.get('expertise_level', 'beginner')
+        context.last_interaction = data.get('last_interaction')
+        return context
+
+
+class PathProgress:
+    """Progress through one learning path."""
+
+    __slots__ = ('current_level', 'completed_topics', 'last_interaction')
+
+    def __init__(self, current_level: int = 0, completed_topics=(), last_interaction: Optional[float] = None):
+        self.current_level = current_level
+        self.completed_topics = set(completed_topics)
+        self.last_interaction = last_interaction
+
+
+class LearningProgress:
+    """Learning progress for one user, by path (EducationalScaffold)."""
+
+    __slots__ = ('paths',)
+
+    def __init__(self):
+        self.paths: Dict[str, PathProgress] = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            path: {
+                'current_level': progress.current_level,
+                'completed_topics': sorted(progress.completed_topics),
+                'last_interaction': progress.last_interaction
+            }
+            for path, progress in self.paths.items()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LearningProgress':
+        record = cls()
+        record.paths = {path: PathProgress(**progress) for path, progress in data.items()}
+        return record
+
+
+class TutorialSession:
+    """
+    An interactive tutorial in progress (TradingStrategyAdvisor).
+
+    Holds the tutorial id rather than the tutorial definition, whose steps
+    reference bound methods and cannot be serialized.
+    """
+
+    __slots__ = ('tutorial_id', 'current_step', 'progress', 'start_time', 'user_context')
+
+    def __init__(self):
+        self.tutorial_id: Optional[str] = None
+        self.current_step = 0
+        self.progress: List[int] = []
+        self.start_time: Optional[float] = None
+        self.user_context: Dict[str, Any] = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'tutorial_id': self.tutorial_id,
+            'current_step': self.current_step,
+            'progress': self.progress,
+            'start_time': self.start_time,
+            'user_context': self.user_context
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TutorialSession':
+        session = cls()
+        session.tutorial_id = data.get('tutorial_id')
+        session.current_step = data.get('current_step', 0)
+        session.progress = list(data.get('progress', ()))
+        session.start_time = data.get('start_time')
+        session.user_context = dict(data.get('user_context') or {})
+        return session
@@ -0,0 +1,248 @@
+"""
+Per-user conversation sessions shared by long-lived engines.
+
+Engines are built once and serve every user, so per-user state lives
+here rather than on the engine. Each store holds one kind of record
+(see session_records) and stays bounded: once it holds ``max_sessions``
+users the least recently active one is dropped, and users idle for
+longer than ``idle_ttl`` seconds expire.
+
+With a snapshot backend (local SQLite or Redis) changed records are
+written out periodically and on shutdown, and a user missing from memory
+is restored from the backend, so sessions survive restarts and
+evictions. Each worker keeps its own copy and does not re-read a session
+it already holds: if two workers serve the same user, whichever flushes
+last wins. Route each user to one worker (sticky sessions) when running
+several.
+"""
+
+from typing import Any, Dict, Generic, Optional, Protocol, Type, TypeVar
+from collections import OrderedDict
+import asyncio
+import threading
+import time
+from loguru import logger
+
+
+class SessionRecord(Protocol):
+    def to_dict(self) -> Dict[str, Any]: ...
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SessionRecord': ...
+
+
+class SessionBackend(Protocol):
+    async def load(self, namespace: str, user_id: str) -> Optional[Dict[str, Any]]: ...
+
+    async def save_many(self, namespace: str, records: Dict[str, Dict[str, Any]]): ...
+
+    async def delete(self, namespace: str, user_id: str): ...
+
+    async def close(self): ...
+
+
+R = TypeVar('R', bound=SessionRecord)
+
+
+class _Session:
+    __slots__ = ('record', 'last_access', 'dirty')
+
+    def __init__(self, record: Any, last_access: float):
+        self.record = record
+        self.last_access = last_access
+        self.dirty = False
+
+
+class SessionStore(Generic[R]):
+    """
+    Bounded LRU + idle-TTL map of user id to session record.
+
+    Args:
+        record_type: Record class with ``to_dict``/``from_dict``; called
+            with no arguments to create a new session
+        namespace: Separates this store's records in a shared backend
+        max_sessions: Most sessions kept in memory
+        idle_ttl: Seconds of inactivity after which a session expires
+        backend: Optional snapshot backend
+
+    ``get_or_create`` and ``get`` only look in memory; ``load`` also
+    restores from the backend. Call ``mark_dirty`` after changing a
+    record so the next snapshot writes it.
+    """
+
+    def __init__(
+        self,
+        record_type: Type[R],
+        namespace: str,
+        max_sessions: int = 10000,
+        idle_ttl: float = 24 * 3600,
+        backend: Optional[SessionBackend] = None
+    ):
+        self.record_type = record_type
+        self.namespace = namespace
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.backend = backend
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        # Dirty records evicted before the next snapshot wrote them
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._snapshot_task: Optional[asyncio.Task] = None
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, user_id: str) -> Optional[R]:
+        """A user's in-memory session, or None."""
+        with self._lock:
+            session = self._touch(user_id, time.time())
+            return session.record if session else None
+
+    def get_or_create(self, user_id: str) -> R:
+        """A user's in-memory session, creating an empty one if needed."""
+        with self._lock:
+            now = time.time()
+            session = self._touch(user_id, now)
+            if session is None:
+                session = self._insert(user_id, self.record_type(), now)
+            return session.record
+
+    async def load(self, user_id: str) -> R:
+        """A user's session from memory, else from the backend, else a new one."""
+        record = self.get(user_id)
+        if record is not None:
+            return record
+
+        data = self._pending.get(user_id)
+        if data is None and self.backend is not None:
+            try:
+                data = await self.backend.load(self.namespace, user_id)
+            except Exception as e:
+                logger.error(f"Error restoring session {self.namespace}:{user_id}: {str(e)}")
+
+        with self._lock:
+            now = time.time()
+            # Another request may have created it while we were loading
+            session = self._touch(user_id, now)
+            if session is None:
+                record = self.record_type.from_dict(data) if data is not None else self.record_type()
+                session = self._insert(user_id, record, now)
+            return session.record
+
+    def mark_dirty(self, user_id: str):
+        with self._lock:
+            session = self._sessions.get(user_id)
+            if session is not None:
+                session.dirty = True
+
+    async def delete(self, user_id: str):
+        """Forget a user's session, in memory and in the backend."""
+        with self._lock:
+            self._pending.pop(user_id, None)
+            self._sessions.pop(user_id, None)
+        if self.backend is not None:
+            try:
+                await self.backend.delete(self.namespace, user_id)
+            except Exception as e:
+                logger.error(f"Error deleting session {self.namespace}:{user_id}: {str(e)}")
+
+    def sweep(self) -> int:
+        """Expire idle sessions. Returns the number removed."""
+        cutoff = time.time() - self.idle_ttl
+        removed = 0
+        with self._lock:
+            # Least recently used first, so stop at the first live session
+            while self._sessions:
+                user_id, session = next(iter(self._sessions.items()))
+                if session.last_access >= cutoff:
+                    break
+                self._drop(user_id)
+                removed += 1
+            self.expirations += removed
+        return removed
+
+    async def flush(self) -> int:
+        """Write changed sessions to the backend. Returns the number written."""
+        if self.backend is None:
+            return 0
+        with self._lock:
+            records = self._pending
+            self._pending = {}
+            for user_id, session in self._sessions.items():
+                if session.dirty:
+                    records[user_id] = session.record.to_dict()
+                    session.dirty = False
+        if not records:
+            return 0
+        try:
+            await self.backend.save_many(self.namespace, records)
+        except Exception as e:
+            logger.error(f"Error snapshotting {len(records)} {self.namespace} sessions: {str(e)}")
+            with self._lock:
+                # Retry with the next snapshot unless they changed again meanwhile
+                for user_id, data in records.items():
+                    self._pending.setdefault(user_id, data)
+            return 0
+        return len(records)
+
+    def start_snapshots(self, interval: float = 30.0):
+        """Sweep idle sessions and snapshot changed ones every ``interval`` seconds."""
+        if self._snapshot_task is None or self._snapshot_task.done():
+            self._snapshot_task = asyncio.create_task(self._run_snapshots(interval))
+
+    async def close(self):
+        """Stop snapshotting and write out whatever changed."""
+        if self._snapshot_task:
+            self._snapshot_task.cancel()
+            self._snapshot_task = None
+        await self.flush()
+
+    def __contains__(self, user_id: str) -> bool:
+        return self.get(user_id) is not None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'sessions': len(self._sessions),
+            'max_sessions': self.max_sessions,
+            'pending_snapshots': len(self._pending),
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+
+    async def _run_snapshots(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.sweep()
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Error in {self.namespace} session snapshot: {str(e)}")
+
+    def _touch(self, user_id: str, now: float) -> Optional[_Session]:
+        # Caller holds the lock
+        session = self._sessions.get(user_id)
+        if session is None:
+            return None
+        if now - session.last_access > self.idle_ttl:
+            self._drop(user_id)
+            self.expirations += 1
+            return None
+        session.last_access = now
+        self._sessions.move_to_end(user_id)
+        return session
+
+    def _insert(self, user_id: str, record: R, now: float) -> _Session:
+        # Caller holds the lock
+        session = self._sessions[user_id] = _Session(record, now)
+        while len(self._sessions) > self.max_sessions:
+            self._drop(next(iter(self._sessions)))
+            self.evictions += 1
+        return session
+
+    def _drop(self, user_id: str):
+        # Caller holds the lock; keep unsaved changes for the next snapshot
+        session = self._sessions.pop(user_id)
+        if session.dirty and self.backend is not None:
+            self._pending[user_id] = session.record.to_dict()
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import asyncio
 from loguru import logger
@@ -6,11 +6,12 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from .content_generator import ContentGenerator
 from .twitter import TwitterService
+from utils.materialized_view import MaterializedView
 
 class ContentScheduler:
-    def __init__(self):
+    def __init__(self, content_generator: Optional[ContentGenerator] = None):
         self.scheduler = AsyncIOScheduler()
-        self.content_generator = ContentGenerator()
+        self.content_generator = content_generator or ContentGenerator()
         self.twitter_service = TwitterService()
         self.scheduled_jobs = {}
 
@@ -45,6 +46,19 @@ class ContentScheduler:
         self.scheduler.start()
         logger.info("Content scheduler initialized")
 
+    def schedule_view_refresh(self, view: MaterializedView, seconds: int):
+        """Rebuild a materialized view now and then every ``seconds``"""
+        self.scheduler.add_job(
+            view.refresh,
+            'interval',
+            seconds=seconds,
+            id=f'refresh_{view.name}',
+            next_run_time=datetime.now(),
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True
+        )
+
     async def post_hourly_update(self):
         """Post hourly network update"""
         try:
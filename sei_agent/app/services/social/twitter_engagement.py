@@ -5,8 +5,8 @@ with SEI-focused value propositions.
 
 from typing import Dict, List, Optional
 from datetime import datetime
-import re
 from loguru import logger
+from ..conversation.pattern_dispatch import PatternDispatcher
 
 class TwitterEngagementEngine:
     def __init__(self):
@@ -38,6 +38,13 @@ class TwitterEngagementEngine:
             }
         }
 
+        # All categories' patterns in one dispatcher, in category order
+        self.dispatcher = PatternDispatcher(
+            (pattern, (category, data['response_type']))
+            for category, data in self.opportunity_patterns.items()
+            for pattern in data['patterns']
+        )
+
         # Response templates optimized for Twitter
         self.response_templates = {
             'yield_opportunity': [
@@ -60,15 +67,14 @@ class TwitterEngagementEngine:
     async def analyze_tweet(self, tweet_text: str, user_metrics: Dict) -> Optional[Dict]:
         """Analyze tweet for engagement opportunities"""
         try:
-            for category, data in self.opportunity_patterns.items():
-                for pattern in data['patterns']:
-                    if re.search(pattern, tweet_text):
-                        return await self.generate_response(
-                            category,
-                            data['response_type'],
-                            tweet_text,
-                            user_metrics
-                        )
+            if result := self.dispatcher.match(tweet_text):
+                category, response_type = result[1]
+                return await self.generate_response(
+                    category,
+                    response_type,
+                    tweet_text,
+                    user_metrics
+                )
             return None
         except Exception as e:
             logger.error(f"Error analyzing tweet: {str(e)}")
@@ -2,11 +2,15 @@
 Trading strategy advisor with risk management and educational components.
 """
 
-from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
+import time
+from ..conversation.session_records import TutorialSession
+from ..conversation.session_store import SessionStore
 
 class TradingStrategyAdvisor:
-    def __init__(self):
+    def __init__(self, sessions: Optional[SessionStore[TutorialSession]] = None):
+        # Tutorial in progress per user
+        self.sessions = sessions if sessions is not None else SessionStore(TutorialSession, 'tutorial_sessions')
         self.strategies = {
             'beginner': {
                 'dollar_cost_averaging': {
@@ -142,28 +146,36 @@ class TradingStrategyAdvisor:
             'risk_warnings': self.get_risk_warnings(suitable_strategies)
         }
 
-    async def start_interactive_tutorial(self, tutorial_id: str, user_context: Dict) -> Dict:
-        """Start an interactive tutorial session"""
-        tutorial = self.tutorials.get(tutorial_id)
-        if not tutorial:
+    async def start_interactive_tutorial(self, tutorial_id: str, user_context: Dict, user_id: Optional[str] = None) -> Dict:
+        """Start an interactive tutorial session; without a user_id it cannot be resumed"""
+        if tutorial_id not in self.tutorials:
             return {"error": "Tutorial not found"}
 
         # Initialize tutorial session
-        session = {
-            'tutorial': tutorial,
-            'current_step': 0,
-            'progress': [],
-            'start_time': datetime.now(),
-            'user_context': user_context
-        }
+        session = await self.sessions.load(user_id) if user_id is not None else TutorialSession()
+        session.tutorial_id = tutorial_id
+        session.current_step = 0
+        session.progress = []
+        session.start_time = time.time()
+        session.user_context = user_context
+        if user_id is not None:
+            self.sessions.mark_dirty(user_id)
 
         # Get first step with live data
         return await self.get_tutorial_step(session)
 
-    async def get_tutorial_step(self, session: Dict) -> Dict:
+    async def resume_tutorial(self, user_id: str) -> Dict:
+        """Return the current step of a user's tutorial in progress"""
+        session = await self.sessions.load(user_id)
+        if session.tutorial_id not in self.tutorials:
+            return {"error": "No tutorial in progress"}
+        return await self.get_tutorial_step(session)
+
+    async def get_tutorial_step(self, session: TutorialSession) -> Dict:
         """Get current tutorial step with live data"""
-        tutorial = session['tutorial']
-        step = tutorial['steps'][session['current_step']]
+        tutorial = self.tutorials[session.tutorial_id]
+        # Copy so live data is not written into the shared tutorial definition
+        step = dict(tutorial['steps'][session.current_step])
         
         # Enhance step with live data
         if 'live_data' in tutorial:
@@ -173,11 +185,11 @@ class TradingStrategyAdvisor:
         # Add interactive elements
         if 'interactive_elements' in step:
             for element_key, element_func in step['interactive_elements'].items():
-                step[f'{element_key}_data'] = await element_func(session['user_context'])
+                step[f'{element_key}_data'] = await element_func(session.user_context)
 
         return {
             'step': step,
-            'progress': len(session['progress']),
+            'progress': len(session.progress),
             'total_steps': len(tutorial['steps']),
             'can_proceed': await self.validate_step_completion(session)
         }
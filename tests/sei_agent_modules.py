@@ -0,0 +1,48 @@
+"""
+Load sei_agent service modules in isolation.
+
+The sei_agent services package imports every service (and their heavy
+dependencies) from its __init__, and sei_agent/app/services/analytics.py
+shadows the analytics/ directory beside it. Tests therefore load a
+service subdirectory as a bare package and import single modules from it.
+"""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+SERVICES_DIR = Path(__file__).parent.parent / "sei_agent" / "app" / "services"
+
+
+def load_service_module(subpackage: str, module: str):
+    """Import ``sei_agent/app/services/<subpackage>/<module>.py``"""
+    package = f"_sei_agent_{subpackage}"
+    if package not in sys.modules:
+        namespace = types.ModuleType(package)
+        namespace.__path__ = [str(SERVICES_DIR / subpackage)]
+        sys.modules[package] = namespace
+    return importlib.import_module(f"{package}.{module}")
+
+
+def load_services_module(module: str):
+    """
+    Import ``sei_agent/app/services/<module>.py`` under its real name.
+
+    For top-level service modules whose relative imports reach sibling
+    subpackages and ``sei_agent.app.config``. The packages above it are
+    registered bare, skipping the services __init__ and the analytics.py
+    shadow.
+    """
+    app_dir = SERVICES_DIR.parent
+    for package, path in (
+        ("sei_agent", app_dir.parent),
+        ("sei_agent.app", app_dir),
+        ("sei_agent.app.services", SERVICES_DIR),
+        ("sei_agent.app.services.analytics", SERVICES_DIR / "analytics"),
+    ):
+        if package not in sys.modules:
+            namespace = types.ModuleType(package)
+            namespace.__path__ = [str(path)]
+            sys.modules[package] = namespace
+    return importlib.import_module(f"sei_agent.app.services.{module}")
@@ -0,0 +1,125 @@
+"""
+BoundedCache Tests
+
+Covers LRU eviction by entry count and bytes, lazy expiry, the stale grace
+period and timer wheel sweeps, against a fake clock.
+"""
+
+import pytest
+
+from app.cache import cache_engine
+from app.cache.cache_engine import BoundedCache, estimate_size
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_engine, "time", clock)
+    return clock
+
+
+def test_evicts_least_recently_used(clock):
+    cache = BoundedCache(ttl=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Reading a makes b the least recently used
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.get_stats()['evictions'] == 1
+
+
+def test_byte_accounting(clock):
+    value = {'price': [1.5, 2.5], 'symbol': "SEI"}
+    size = estimate_size(value)
+    cache = BoundedCache(ttl=60, max_bytes=size * 2)
+
+    cache.set("a", value)
+    assert cache.current_bytes == size
+    # Overwriting a key replaces its size instead of adding to it
+    cache.set("a", dict(value))
+    assert cache.current_bytes == size
+
+    cache.set("b", dict(value))
+    cache.set("c", dict(value))
+    assert "a" not in cache
+    assert cache.current_bytes == size * 2
+
+    cache.delete("b")
+    assert cache.current_bytes == size
+    cache.clear()
+    assert cache.current_bytes == 0
+
+
+def test_oversized_value_is_not_cached(clock):
+    cache = BoundedCache(ttl=60, max_bytes=64)
+    cache.set("big", "x" * 1024)
+    assert "big" not in cache
+    assert cache.current_bytes == 0
+
+
+def test_entries_expire_lazily(clock):
+    cache = BoundedCache(ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=30)
+
+    clock.now += 10
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert cache.get("b") == 2
+    assert cache.get_stats()['expirations'] == 1
+
+
+def test_stale_entries_are_served_only_when_allowed(clock):
+    cache = BoundedCache(ttl=10, stale_ttl=20)
+    cache.set("a", 1)
+
+    clock.now += 15
+    assert cache.get("a") is None
+    assert cache.get_entry("a", allow_expired=True).data == 1
+    # A normal read inside the grace period keeps the entry
+    assert "a" in cache
+
+    clock.now += 15
+    assert cache.get_entry("a", allow_expired=True) is None
+    assert "a" not in cache
+
+
+def test_sweep_purges_only_passed_ticks(clock):
+    cache = BoundedCache(ttl=10, stale_ttl=5, wheel_slots=8)
+    cache.set("short", 1)
+    cache.set("long", 2, ttl=100)
+
+    clock.now += 14
+    assert cache.sweep() == 0
+    clock.now += 2
+    assert cache.sweep() == 1
+    assert "short" not in cache
+
+    # long shares a slot with earlier ticks but is a rotation ahead
+    assert "long" in cache
+    clock.now += 90
+    assert cache.sweep() == 1
+    assert len(cache) == 0
+    assert cache.get_stats()['expirations'] == 2
+
+
+def test_sweep_after_a_long_pause_walks_one_rotation(clock):
+    cache = BoundedCache(ttl=1, wheel_slots=4)
+    for i in range(10):
+        cache.set(f"k{i}", i)
+        clock.now += 0.5
+
+    clock.now += 1000
+    assert cache.sweep() == 10
+    assert cache.current_bytes == 0
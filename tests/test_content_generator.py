@@ -0,0 +1,122 @@
+"""
+ContentGenerator chat tests with a stub conversation engine and stub
+analytics: which metrics are fetched, and the order of streamed events.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("textblob")
+from sei_agent_modules import load_services_module  # noqa: E402
+
+content_generator = load_services_module("content_generator")
+ContentGenerator = content_generator.ContentGenerator
+
+
+class StubEngine:
+    """Matches every message to the same response"""
+
+    def __init__(self, requirements):
+        self.requirements = requirements
+
+    async def match_message(self, message, user_id=None):
+        return {
+            'response': f"echo: {message}",
+            'follow_up': ["Show network status"],
+            'data': {},
+            'data_requirements': list(self.requirements)
+        }
+
+
+class StubNetwork:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+
+    async def get_status(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {'tps': 100.0}
+
+
+class StubSocial:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+
+    async def get_sentiment(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {'engagement_rate': 5}
+
+
+class StubSnapshot:
+    def read(self):
+        return {'network': {'tps': 1.0}, 'social': {'engagement_rate': 1}}
+
+
+def make_generator(requirements, network=None, social=None, snapshot=None):
+    return ContentGenerator(
+        social_analytics=social or StubSocial(),
+        network_analytics=network or StubNetwork(),
+        chat_engine=StubEngine(requirements),
+        snapshot=snapshot
+    )
+
+
+def collect(generator, message="hi"):
+    async def run():
+        return [event async for event in generator.stream_chat_response(message)]
+    return asyncio.run(run())
+
+
+def test_chat_response_fetches_only_required_data():
+    generator = make_generator(['network_stats'])
+    response = asyncio.run(generator.generate_chat_response("status"))
+    assert response['data'] == {'network': {'tps': 100.0}}
+    assert generator.network_analytics.calls == 1
+    assert generator.social_analytics.calls == 0
+
+
+def test_chat_response_without_requirements_makes_no_upstream_calls():
+    generator = make_generator([])
+    response = asyncio.run(generator.generate_chat_response("hello"))
+    assert response['data'] == {}
+    assert generator.network_analytics.calls == 0
+    assert generator.social_analytics.calls == 0
+
+
+def test_chat_response_reads_snapshot():
+    generator = make_generator(['network_stats'], snapshot=StubSnapshot())
+    response = asyncio.run(generator.generate_chat_response("status"))
+    assert response['data']['network'] == {'tps': 1.0}
+    assert generator.network_analytics.calls == 0
+
+
+def test_stream_sends_text_first_then_metrics_as_they_complete():
+    generator = make_generator(
+        ['network_stats', 'social_metrics'],
+        network=StubNetwork(delay=0.05),
+        social=StubSocial(delay=0.01)
+    )
+    assert collect(generator) == [
+        ('response', {'response': "echo: hi", 'data': {}}),
+        ('suggested_actions', {'suggested_actions': ["Show network status"]}),
+        ('metrics', {'social': {'engagement_rate': 5}}),
+        ('metrics', {'network': {'tps': 100.0}}),
+    ]
+
+
+def test_stream_skips_metrics_the_response_does_not_need():
+    generator = make_generator([])
+    assert [event for event, _ in collect(generator)] == ['response', 'suggested_actions']
+    assert generator.network_analytics.calls == 0
+    assert generator.social_analytics.calls == 0
+
+
+def test_stream_reads_snapshot_once():
+    generator = make_generator(['network_stats'], snapshot=StubSnapshot())
+    events = collect(generator)
+    assert events[-1] == ('metrics', StubSnapshot().read())
+    assert generator.network_analytics.calls == 0
@@ -0,0 +1,159 @@
+"""
+Local docs index tests, run on the bundled fixture corpus.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from app.agent.knowledge_base import SEIKnowledgeBase
+from utils.docs_index import DocsIndex, corpus_fingerprint, load_markdown_corpus, split_markdown, tokenize
+
+CORPUS_PATH = Path(__file__).parent.parent / "scripts" / "fixtures" / "sei_docs"
+
+
+@pytest.fixture(scope="module")
+def passages():
+    return load_markdown_corpus(str(CORPUS_PATH))
+
+
+@pytest.fixture
+def index_path(tmp_path, passages):
+    path = tmp_path / "docs_index"
+    DocsIndex.build(passages).save(str(path))
+    return path
+
+
+def test_tokenize_stems_inflections():
+    assert tokenize("Staked") == tokenize("staking") == tokenize("stakes")
+    assert tokenize("how do I stake") == ["stak"]
+
+
+def test_split_markdown_one_passage_per_heading():
+    text = "# Staking\n\nIntro text.\n\n## Unbonding\n\nTakes 21 days.\n"
+    assert split_markdown(text, "staking.md") == [
+        {'title': 'Staking', 'source': 'staking.md', 'text': 'Intro text.'},
+        {'title': 'Staking - Unbonding', 'source': 'staking.md', 'text': 'Takes 21 days.'},
+    ]
+
+
+def test_corpus_loads_in_stable_order(passages):
+    assert passages
+    assert passages == load_markdown_corpus(str(CORPUS_PATH))
+    assert {p['source'] for p in passages} == {f.name for f in CORPUS_PATH.glob("*.md")}
+
+
+def test_saved_index_matches_built_index(passages, index_path):
+    built = DocsIndex.build(passages)
+    opened = DocsIndex.open(str(index_path))
+    try:
+        assert len(opened) == len(passages)
+        for query in ("unbonding period", "link EVM address", "swap tokens"):
+            assert opened.search(query) == built.search(query)
+    finally:
+        opened.close()
+
+
+def test_search_ranks_relevant_passage_first(index_path):
+    index = DocsIndex.open(str(index_path))
+    try:
+        hits = index.search("unbonding")
+        assert hits[0]['title'] == "Staking SEI - Unbonding"
+        assert hits[0]['source'] == "staking.md"
+        assert [hit['score'] for hit in hits] == sorted((hit['score'] for hit in hits), reverse=True)
+        assert len(index.search("validator", limit=1)) == 1
+        assert index.search("zzzunknownzzz") == []
+    finally:
+        index.close()
+
+
+def test_open_missing_index(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        DocsIndex.open(str(tmp_path / "missing"))
+
+
+def test_open_incompatible_index(index_path):
+    meta_path = index_path / "meta.json"
+    meta = json.loads(meta_path.read_text())
+    meta_path.write_text(json.dumps(dict(meta, version=meta['version'] + 1)))
+    with pytest.raises(ValueError):
+        DocsIndex.open(str(index_path))
+
+
+def test_knowledge_base_builds_missing_index(tmp_path):
+    index_path = tmp_path / "docs_index"
+    knowledge_base = SEIKnowledgeBase(docs_index_path=str(index_path), docs_corpus_path=str(CORPUS_PATH))
+    docs = asyncio.run(knowledge_base.fetch_sei_docs("unbonding"))
+    assert "Unbonding" in docs
+    assert (index_path / "meta.json").exists()
+
+
+def test_knowledge_base_rebuilds_incompatible_index(index_path):
+    meta_path = index_path / "meta.json"
+    meta_path.write_text(json.dumps(dict(json.loads(meta_path.read_text()), version=0)))
+    knowledge_base = SEIKnowledgeBase(docs_index_path=str(index_path), docs_corpus_path=str(CORPUS_PATH))
+    docs = asyncio.run(knowledge_base.fetch_sei_docs("unbonding"))
+    assert "Unbonding" in docs
+    DocsIndex.open(str(index_path)).close()
+
+
+def test_knowledge_base_does_not_persist_empty_corpus(tmp_path):
+    index_path = tmp_path / "docs_index"
+    corpus_path = tmp_path / "docs"
+    knowledge_base = SEIKnowledgeBase(docs_index_path=str(index_path), docs_corpus_path=str(corpus_path))
+    docs = asyncio.run(knowledge_base.fetch_sei_docs("unbonding"))
+    assert "trouble" in docs
+    assert not index_path.exists()
+
+    # Retried once the corpus appears
+    corpus_path.mkdir()
+    (corpus_path / "staking.md").write_text((CORPUS_PATH / "staking.md").read_text())
+    docs = asyncio.run(knowledge_base.fetch_sei_docs("unbonding"))
+    assert "Unbonding" in docs
+
+
+@pytest.fixture
+def corpus_path(tmp_path):
+    path = tmp_path / "sei_docs"
+    path.mkdir()
+    for file in CORPUS_PATH.glob("*.md"):
+        (path / file.name).write_text(file.read_text())
+    return path
+
+
+def test_corpus_fingerprint_tracks_edits(corpus_path, tmp_path):
+    fingerprint = corpus_fingerprint(str(corpus_path))
+    assert fingerprint == corpus_fingerprint(str(corpus_path))
+
+    (corpus_path / "staking.md").write_text("# Staking\n\nEdited.\n")
+    assert corpus_fingerprint(str(corpus_path)) != fingerprint
+    assert corpus_fingerprint(str(tmp_path / "missing")) is None
+
+
+def test_saved_index_records_fingerprint(passages, tmp_path):
+    path = tmp_path / "docs_index"
+    DocsIndex.build(passages).save(str(path), corpus_fingerprint="abc")
+    index = DocsIndex.open(str(path))
+    assert index.corpus_fingerprint == "abc"
+    index.close()
+
+
+def test_knowledge_base_rebuilds_after_corpus_edit(corpus_path, tmp_path):
+    index_path = tmp_path / "docs_index"
+    knowledge_base = SEIKnowledgeBase(docs_index_path=str(index_path), docs_corpus_path=str(corpus_path))
+    assert "Unbonding" in asyncio.run(knowledge_base.fetch_sei_docs("unbonding"))
+
+    (corpus_path / "governance.md").write_text("# Governance\n\n## Quorum\n\nProposals need a quorum of votes.\n")
+    restarted = SEIKnowledgeBase(docs_index_path=str(index_path), docs_corpus_path=str(corpus_path))
+    assert "Quorum" in asyncio.run(restarted.fetch_sei_docs("quorum"))
+    index = DocsIndex.open(str(index_path))
+    assert index.corpus_fingerprint == corpus_fingerprint(str(corpus_path))
+    index.close()
+
+
+def test_knowledge_base_keeps_index_without_corpus(index_path, tmp_path):
+    # A deployment may ship the built index without the snapshot
+    knowledge_base = SEIKnowledgeBase(docs_index_path=str(index_path), docs_corpus_path=str(tmp_path / "missing"))
+    assert "Unbonding" in asyncio.run(knowledge_base.fetch_sei_docs("unbonding"))
@@ -0,0 +1,117 @@
+"""
+EcosystemSnapshot Tests
+
+Sources are stubs and time is a fake monotonic clock. The strict network
+status path runs NetworkAnalytics against httpx.MockTransport.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from sei_agent_modules import load_service_module, load_services_module
+from utils.http_client import HTTPClient
+
+ecosystem_snapshot = load_service_module("analytics", "ecosystem_snapshot")
+EcosystemSnapshot = ecosystem_snapshot.EcosystemSnapshot
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ecosystem_snapshot, "time", clock)
+    return clock
+
+
+class StubSource:
+    """Returns queued results in order, raising any that are exceptions"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+
+    async def __call__(self):
+        result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def test_failed_source_keeps_last_good_section(clock):
+    network = StubSource({'tps': 100.0}, ConnectionError("rpc down"))
+    social = StubSource({'engagement_rate': 5}, {'engagement_rate': 6})
+    snapshot = EcosystemSnapshot({'network': network, 'social': social})
+
+    asyncio.run(snapshot.refresh())
+    clock.now += 60
+    asyncio.run(snapshot.refresh())
+
+    assert snapshot.read() == {'network': {'tps': 100.0}, 'social': {'engagement_rate': 6}}
+    # The failed section keeps aging
+    assert snapshot.ages() == {'network': 60.0, 'social': 0.0}
+
+
+def test_empty_result_does_not_replace_section(clock):
+    snapshot = EcosystemSnapshot({'social': StubSource({'engagement_rate': 5}, {})})
+    asyncio.run(snapshot.refresh())
+    asyncio.run(snapshot.refresh())
+    assert snapshot.read() == {'social': {'engagement_rate': 5}}
+
+
+def test_read_leaves_out_stale_sections(clock):
+    network = StubSource({'tps': 100.0}, ConnectionError("rpc down"))
+    social = StubSource({'engagement_rate': 5})
+    snapshot = EcosystemSnapshot({'network': network, 'social': social}, max_staleness=300)
+
+    asyncio.run(snapshot.refresh())
+    clock.now += 300
+    asyncio.run(snapshot.refresh())
+    assert set(snapshot.read()) == {'network', 'social'}
+
+    clock.now += 1
+    assert snapshot.read() == {'social': {'engagement_rate': 5}}
+    # A caller may ask for a looser bound
+    assert set(snapshot.read(max_staleness=600)) == {'network', 'social'}
+    assert snapshot.read(max_staleness=0.5) == {}
+
+
+def test_never_fetched_section_is_absent(clock):
+    snapshot = EcosystemSnapshot({'network': StubSource(ConnectionError("rpc down"))})
+    asyncio.run(snapshot.refresh())
+    assert snapshot.read() == {}
+    assert snapshot.ages() == {}
+
+
+@pytest.fixture
+def network_analytics(monkeypatch):
+    for name in ("TWITTER_API_KEY", "TWITTER_API_SECRET", "TWITTER_ACCESS_TOKEN", "TWITTER_ACCESS_TOKEN_SECRET"):
+        monkeypatch.setenv(name, "test")
+    return load_services_module("analytics.network_analytics")
+
+
+def test_strict_status_raises_so_snapshot_keeps_last_good(network_analytics, clock):
+    def handler(request):
+        return httpx.Response(503)
+
+    async def run():
+        client = HTTPClient(max_retries=0, http2=False)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        network = network_analytics.NetworkAnalytics(client)
+
+        with pytest.raises(Exception, match="Latest block unavailable"):
+            await network.get_status(strict=True)
+
+        snapshot = EcosystemSnapshot({'network': lambda: network.get_status(strict=True)})
+        snapshot._sections['network'] = (clock.now, {'tps': 100.0})
+        await snapshot.refresh()
+        assert snapshot.read() == {'network': {'tps': 100.0}}
+        await client.close()
+
+    asyncio.run(run())
@@ -0,0 +1,162 @@
+"""
+HTTPClient tests against httpx.MockTransport: retries and the retry
+budget, the per-host concurrency limit, and per-host stats.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from utils.http_client import HTTPClient, RetryBudget
+
+
+def make_client(handler, **kwargs) -> HTTPClient:
+    client = HTTPClient(retry_backoff=0, http2=False, **kwargs)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_retry_budget_limits_retries_to_a_ratio():
+    budget = RetryBudget(ratio=0.5, min_tokens=1, max_tokens=2)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+
+    for _ in range(10):
+        budget.deposit()
+    assert budget.tokens == 2
+
+
+def test_retries_retryable_status_until_success():
+    responses = [503, 429, 200]
+
+    def handler(request):
+        return httpx.Response(responses.pop(0), json={'ok': True})
+
+    async def run():
+        client = make_client(handler)
+        response = await client.get("https://api.example.com/status")
+        await client.close()
+        return response, client.get_stats()['hosts']['api.example.com']
+
+    response, stats = asyncio.run(run())
+    assert response.status_code == 200
+    assert stats['requests'] == 3
+    assert stats['retries'] == 2
+    assert stats['errors'] == 2
+
+
+def test_gives_up_after_max_retries():
+    def handler(request):
+        return httpx.Response(502)
+
+    async def run():
+        client = make_client(handler, max_retries=1)
+        response = await client.get("https://api.example.com/status")
+        await client.close()
+        return response, client.get_stats()['hosts']['api.example.com']
+
+    response, stats = asyncio.run(run())
+    assert response.status_code == 502
+    assert stats['requests'] == 2
+
+
+def test_non_idempotent_requests_are_not_retried():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(503)
+
+    async def run():
+        client = make_client(handler)
+        response = await client.post("https://api.example.com/submit", json={})
+        await client.close()
+        return response
+
+    assert asyncio.run(run()).status_code == 503
+    assert calls == ["POST"]
+
+
+def test_transport_errors_are_raised_once_retries_are_denied():
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    async def run():
+        client = make_client(handler, max_retries=5)
+        client.retry_budget.tokens = 1
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://api.example.com/status")
+        await client.close()
+        return client.get_stats()['hosts']['api.example.com']
+
+    stats = asyncio.run(run())
+    assert stats['requests'] == 2
+    assert stats['retries'] == 1
+    assert stats['retries_denied'] == 1
+
+
+def test_per_host_limit_caps_concurrency():
+    in_flight = {'a.example.com': 0, 'b.example.com': 0}
+    peak = dict(in_flight)
+
+    async def handler(request):
+        host = request.url.host
+        in_flight[host] += 1
+        peak[host] = max(peak[host], in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(200)
+
+    async def run():
+        client = make_client(handler, per_host_limit=2)
+        await asyncio.gather(*(
+            client.get(f"https://{host}/item/{i}")
+            for host in in_flight for i in range(6)
+        ))
+        await client.close()
+        return client.get_stats()
+
+    stats = asyncio.run(run())
+    assert peak == {'a.example.com': 2, 'b.example.com': 2}
+    assert {host: s['requests'] for host, s in stats['hosts'].items()} == {
+        'a.example.com': 6, 'b.example.com': 6
+    }
+
+
+def test_backoff_does_not_hold_the_host_slot():
+    statuses = {'/flaky': [503, 200], '/fast': [200]}
+
+    def handler(request):
+        return httpx.Response(statuses[request.url.path].pop(0))
+
+    async def run():
+        client = make_client(handler, per_host_limit=1)
+        client.retry_backoff = 0.2
+        flaky = asyncio.ensure_future(client.get("https://api.example.com/flaky"))
+        await asyncio.sleep(0.05)
+        # The flaky request is sleeping before its retry
+        fast = await asyncio.wait_for(client.get("https://api.example.com/fast"), timeout=0.1)
+        assert fast.status_code == 200
+        assert (await flaky).status_code == 200
+        await client.close()
+
+    asyncio.run(run())
+
+
+def test_get_json_raises_on_error_status():
+    def handler(request):
+        return httpx.Response(404, json={'error': 'missing'})
+
+    async def run():
+        client = make_client(handler)
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_json("https://api.example.com/missing")
+        await client.close()
+
+    asyncio.run(run())
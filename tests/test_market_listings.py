@@ -0,0 +1,89 @@
+"""
+ListingsSnapshot tests, with a stub in place of the shared HTTP client.
+"""
+
+import asyncio
+
+import pytest
+
+from utils import market_listings
+from utils.market_listings import ListingsSnapshot
+
+LISTINGS = [
+    {'symbol': 'BTC', 'cmc_rank': 1, 'quote': {'USD': {'price': 60000.0}}},
+    {'symbol': 'ETH', 'cmc_rank': 2, 'quote': {'USD': {'price': 3000.0}}},
+    {'symbol': 'SEI', 'cmc_rank': 3, 'quote': {'USD': {'price': 0.5}}},
+]
+
+
+class StubClient:
+    """Counts listings requests; fails while ``error`` is set"""
+
+    def __init__(self):
+        self.calls = 0
+        self.error = None
+
+    async def get_json(self, url, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.error is not None:
+            raise self.error
+        return {'data': LISTINGS}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = StubClient()
+    monkeypatch.setattr(market_listings, "get_http_client", lambda: client)
+    return client
+
+
+def test_concurrent_lookups_share_one_refresh(client):
+    async def run():
+        snapshot = ListingsSnapshot(api_key="test")
+        return await asyncio.gather(
+            snapshot.get_by_symbol("sei"),
+            snapshot.get_by_rank(1),
+            snapshot.top(2),
+            *(snapshot.get_by_symbol("BTC") for _ in range(5))
+        )
+
+    sei, first, top, *btc = asyncio.run(run())
+    assert client.calls == 1
+    assert sei['symbol'] == 'SEI'
+    assert first['symbol'] == 'BTC'
+    assert [listing['symbol'] for listing in top] == ['BTC', 'ETH']
+    assert all(listing['symbol'] == 'BTC' for listing in btc)
+
+
+def test_failed_refresh_backs_off_and_serves_last_snapshot(client):
+    async def run():
+        snapshot = ListingsSnapshot(api_key="test", interval=0, retry_interval=60)
+        assert (await snapshot.get_by_symbol("SEI"))['symbol'] == 'SEI'
+        assert client.calls == 1
+
+        # The snapshot is always stale; failures must not hammer the API
+        client.error = ConnectionError("rate limited")
+        for _ in range(5):
+            assert (await snapshot.get_by_symbol("SEI"))['symbol'] == 'SEI'
+        assert client.calls == 2
+
+        # Once the back-off has passed the next lookup tries again
+        snapshot.retry_interval = 0
+        client.error = None
+        await snapshot.get_by_symbol("SEI")
+        assert client.calls == 3
+        assert snapshot.failed_at is None
+
+    asyncio.run(run())
+
+
+def test_failed_first_refresh_is_not_retried_per_call(client):
+    async def run():
+        client.error = ConnectionError("down")
+        snapshot = ListingsSnapshot(api_key="test")
+        assert await snapshot.top(5) == []
+        assert await snapshot.get_by_symbol("SEI") is None
+        assert client.calls == 1
+
+    asyncio.run(run())
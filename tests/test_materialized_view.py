@@ -0,0 +1,62 @@
+"""
+Materialized view tests.
+"""
+
+import asyncio
+import json
+
+from utils.materialized_view import MaterializedView
+
+PAYLOAD = {'topics': [{'keyword': 'sei', 'mentions': 42}]}
+
+
+def make_view(payloads):
+    async def build():
+        return payloads.pop(0) if len(payloads) > 1 else payloads[0]
+    return MaterializedView("trending_topics", build)
+
+
+def test_etag_depends_only_on_content():
+    async def run():
+        # A long-running worker at version 3 and a fresh one at version 1
+        older = make_view([{'topics': []}, {'topics': ['x']}, PAYLOAD])
+        for _ in range(3):
+            await older.refresh()
+        fresh = make_view([PAYLOAD])
+        await fresh.refresh()
+
+        assert older.snapshot.version == 3
+        assert fresh.snapshot.version == 1
+        assert older.snapshot.etag == fresh.snapshot.etag
+        assert older.snapshot.body == fresh.snapshot.body
+        assert json.loads(fresh.snapshot.body) == PAYLOAD
+
+    asyncio.run(run())
+
+
+def test_unchanged_content_keeps_snapshot():
+    async def run():
+        view = make_view([PAYLOAD])
+        first = await view.refresh()
+        assert await view.refresh() is first
+
+    asyncio.run(run())
+
+
+def test_respond_with_etag():
+    async def run():
+        view = make_view([PAYLOAD])
+        assert view.respond().status_code == 503
+
+        snapshot = await view.get()
+        response = view.respond()
+        assert response.status_code == 200
+        assert response.body == snapshot.body
+        assert response.headers['ETag'] == snapshot.etag
+        assert response.headers['X-View-Version'] == "1"
+
+        assert view.respond(snapshot.etag).status_code == 304
+        assert view.respond(f'W/{snapshot.etag}, "other"').status_code == 304
+        assert view.respond('"other"').status_code == 200
+
+    asyncio.run(run())
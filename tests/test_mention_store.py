@@ -0,0 +1,181 @@
+"""
+MentionStore and MentionIngestor tests.
+
+The upstream search is a stub serving tweets from an in-memory list, the
+way the real sources do: newer than ``since_id`` when given one,
+otherwise created after ``since``, newest first.
+"""
+
+from datetime import datetime, timedelta, timezone
+import threading
+
+import pytest
+
+from utils.mention_store import MentionIngestor, MentionStore
+
+NOW = datetime.now(timezone.utc)
+
+
+def tweet(tweet_id: int, age: timedelta = timedelta(minutes=1), **fields) -> dict:
+    return {
+        'id': tweet_id, 'text': f"tweet {tweet_id}", 'user': 'sei_fan',
+        'created_at': NOW - age, 'retweets': 0, 'likes': 0, **fields
+    }
+
+
+class StubSearch:
+    """Serves tweets per keyword and records each call's arguments"""
+
+    def __init__(self, tweets=None):
+        self.tweets = tweets or {}
+        self.calls = []
+
+    def __call__(self, keyword, since_id, since):
+        self.calls.append((keyword, since_id, since))
+        return sorted(
+            (
+                t for t in self.tweets.get(keyword, [])
+                if (t['id'] > since_id if since_id is not None else t['created_at'] >= since)
+            ),
+            key=lambda t: t['id'],
+            reverse=True
+        )
+
+
+@pytest.fixture
+def store():
+    store = MentionStore(":memory:")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def make_ingestor(store):
+    ingestors = []
+
+    def make(search, **kwargs):
+        new_mentions = []
+        ingestor = MentionIngestor(
+            store, search, source="stub",
+            on_new=lambda keyword, mentions: new_mentions.extend((keyword, m['id']) for m in mentions),
+            **kwargs
+        )
+        ingestor.new_mentions = new_mentions
+        ingestors.append(ingestor)
+        return ingestor
+
+    yield make
+    for ingestor in ingestors:
+        ingestor.close()
+
+
+def test_store_deduplicates_by_tweet_id(store):
+    since = NOW - timedelta(hours=1)
+    assert store.add_mentions("SEI", [tweet(1), tweet(2)]) == 2
+    # Another keyword links to the same row
+    assert store.add_mentions("$SEI", [tweet(2)]) == 0
+    assert sorted(m['id'] for m in store.query(since)) == [1, 2]
+    assert [m['id'] for m in store.query(since, keywords=["$SEI"])] == [2]
+    assert len(store.query(since, keywords=["SEI", "$SEI"], limit=1)) == 1
+
+    # Counters follow the latest sighting
+    assert store.add_mentions("SEI", [tweet(2, likes=5, retweets=2)]) == 0
+    assert store.query(since, keywords=["$SEI"])[0]['likes'] == 5
+    assert store.query(since, keywords=["$SEI"])[0]['retweets'] == 2
+
+
+def test_query_window_newest_first(store):
+    store.add_mentions("SEI", [tweet(1, timedelta(hours=3)), tweet(2, timedelta(hours=1)), tweet(3)])
+    assert [m['id'] for m in store.query(NOW - timedelta(hours=2))] == [3, 2]
+    assert store.query(NOW - timedelta(hours=2))[0]['created_at'].tzinfo is not None
+
+
+def test_prune_drops_whole_old_days(store):
+    store.add_mentions("SEI", [tweet(1, timedelta(days=9)), tweet(2, timedelta(days=8)), tweet(3)])
+    assert store.prune(timedelta(days=7)) == 2
+    assert [m['id'] for m in store.query(NOW - timedelta(days=30))] == [3]
+    assert store.keyword_mention_ids("SEI", [1, 2, 3]) == {3}
+
+
+def test_cursor_and_coverage_only_move_forward(store):
+    store.set_cursor("stub:SEI", 10)
+    store.set_cursor("stub:SEI", 5)
+    assert store.get_cursor("stub:SEI") == 10
+    assert store.get_cursor("stub:other") is None
+
+    store.set_coverage("stub:SEI", NOW - timedelta(hours=24))
+    store.set_coverage("stub:SEI", NOW - timedelta(hours=1))
+    assert store.get_coverage("stub:SEI") == NOW - timedelta(hours=24)
+
+
+def test_first_run_backfills_then_follows_cursor(make_ingestor):
+    search = StubSearch({"SEI": [tweet(1, timedelta(hours=30)), tweet(2, timedelta(hours=2)), tweet(3)]})
+    ingestor = make_ingestor(search, min_interval=0)
+
+    assert ingestor.ingest(["SEI"]) == 2
+    _, since_id, since = search.calls[-1]
+    assert since_id is None
+    assert abs((NOW - since) - timedelta(hours=24)) < timedelta(minutes=1)
+
+    search.tweets["SEI"].append(tweet(4, timedelta(seconds=1)))
+    assert ingestor.ingest(["SEI"]) == 1
+    assert search.calls[-1][1] == 3
+    assert ingestor.new_mentions == [("SEI", 3), ("SEI", 2), ("SEI", 4)]
+
+
+def test_longer_window_backfills_again(make_ingestor):
+    search = StubSearch({"SEI": [tweet(1, timedelta(hours=60)), tweet(2, timedelta(hours=2))]})
+    ingestor = make_ingestor(search)
+
+    ingestor.ingest(["SEI"])
+    assert ingestor.new_mentions == [("SEI", 2)]
+
+    # Within min_interval, but the store does not cover 72h yet
+    assert ingestor.ingest(["SEI"], window=timedelta(hours=72)) == 1
+    assert search.calls[-1][1] is None
+    # The overlap with the first backfill is not reported as new again
+    assert ingestor.new_mentions == [("SEI", 2), ("SEI", 1)]
+
+    calls = len(search.calls)
+    ingestor.ingest(["SEI"], window=timedelta(hours=48))
+    assert len(search.calls) == calls
+
+
+def test_window_is_capped_at_retention(make_ingestor):
+    search = StubSearch()
+    ingestor = make_ingestor(search, retention=timedelta(days=7))
+    ingestor.ingest(["SEI"], window=timedelta(days=30))
+    assert abs((NOW - search.calls[-1][2]) - timedelta(days=7)) < timedelta(minutes=1)
+
+
+def test_recently_ingested_keyword_is_skipped_unless_forced(make_ingestor):
+    search = StubSearch({"SEI": [tweet(1)]})
+    ingestor = make_ingestor(search)
+
+    ingestor.ingest(["SEI"])
+    ingestor.ingest(["SEI"])
+    assert len(search.calls) == 1
+    ingestor.ingest(["SEI"], force=True)
+    assert len(search.calls) == 2
+
+
+def test_still_running_keyword_is_not_searched_twice(make_ingestor):
+    release = threading.Event()
+    search = StubSearch({"slow": [tweet(1)], "fast": [tweet(2)]})
+
+    def blocking_search(keyword, since_id, since):
+        if keyword == "slow":
+            release.wait(5)
+        return search(keyword, since_id, since)
+
+    ingestor = make_ingestor(blocking_search, keyword_timeout=0.1, min_interval=0)
+    # The slow keyword is left out of the round but keeps running
+    assert ingestor.ingest(["slow", "fast"]) == 1
+    ingestor.ingest(["slow"])
+    assert [call[0] for call in search.calls] == ["fast"]
+
+    release.set()
+    ingestor.close()
+    ingestor._executor.shutdown(wait=True)
+    assert [call[0] for call in search.calls] == ["fast", "slow"]
+    assert ("slow", 1) in ingestor.new_mentions
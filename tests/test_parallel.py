@@ -0,0 +1,52 @@
+"""
+map_with_timeout tests.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+import pytest
+
+from utils.parallel import map_with_timeout
+
+
+@pytest.fixture
+def executor():
+    executor = ThreadPoolExecutor(max_workers=4)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+def test_collects_every_result(executor):
+    assert map_with_timeout(lambda x: x * 2, [1, 2, 3], executor, timeout=1) == {1: 2, 2: 4, 3: 6}
+
+
+def test_timeout_drops_only_the_slow_item(executor):
+    release = threading.Event()
+    finished = []
+
+    def work(item):
+        if item == "slow":
+            release.wait(5)
+        finished.append(item)
+        return item.upper()
+
+    started = time.monotonic()
+    results = map_with_timeout(work, ["fast", "slow", "other"], executor, timeout=0.1)
+    assert time.monotonic() - started < 1
+    assert results == {"fast": "FAST", "other": "OTHER"}
+
+    # The slow item keeps running in the background
+    release.set()
+    executor.shutdown(wait=True)
+    assert "slow" in finished
+
+
+def test_failing_item_is_left_out(executor):
+    def work(item):
+        if item == 2:
+            raise ValueError("bad item")
+        return item
+
+    assert map_with_timeout(work, [1, 2, 3], executor, timeout=1) == {1: 1, 3: 3}
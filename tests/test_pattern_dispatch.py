@@ -0,0 +1,94 @@
+"""
+PatternDispatcher Tests
+
+The dispatcher must pick the same pattern as trying each one in order.
+"""
+
+import re
+import pytest
+from sei_agent_modules import load_service_module
+
+pattern_dispatch = load_service_module("conversation", "pattern_dispatch")
+PatternDispatcher = pattern_dispatch.PatternDispatcher
+required_literals = pattern_dispatch.required_literals
+
+
+def first_match(patterns, text, flags=0, search=True):
+    for pattern, value in patterns:
+        compiled = re.compile(pattern, flags)
+        if match := (compiled.search(text) if search else compiled.match(text)):
+            return match, value
+    return None
+
+
+PATTERNS = [
+    (r'(?i)what.*(?:chain|l1|blockchain).*to.*(?:try|check)', 'new_chain'),
+    (r'(?i)(price|market|trading|volume)', 'market'),
+    (r'(?i)how (can|do) i (use|trade on|start with) sei', 'how_to'),
+    (r'apy\s*(?P<rate>\d+)%', 'apy'),
+    (r'(?i)\b(\w+)\b', 'fallback'),
+]
+
+MESSAGES = [
+    "what chain should I try next?",
+    "gm, apy 20% on stables and the price is up",
+    "How can I trade on SEI",
+    "APY 20% (uppercase does not match the case-sensitive pattern)",
+    "",
+    "!!!",
+    "ſome KELVIN-sign text: Kelvin price",
+    "the prıce of SEI",
+    "PRİCE CHECK",
+]
+
+
+@pytest.mark.parametrize("text", MESSAGES)
+def test_matches_like_ordered_search(text):
+    dispatcher = PatternDispatcher(PATTERNS)
+    expected = first_match(PATTERNS, text)
+    result = dispatcher.match(text)
+    if expected is None:
+        assert result is None
+    else:
+        assert result is not None
+        assert result[1] == expected[1]
+        assert result[0].span() == expected[0].span()
+        assert result[0].groups() == expected[0].groups()
+
+
+def test_earlier_pattern_wins_over_leftmost_match():
+    dispatcher = PatternDispatcher([(r'world', 'late'), (r'hello', 'early')])
+    match, value = dispatcher.match("hello world")
+    assert value == 'late'
+    assert match.group(0) == 'world'
+
+
+def test_anchored_mode():
+    patterns = [(r'.*\b(stake|staking)\b', 'staking'), (r'(.*)', 'default')]
+    dispatcher = PatternDispatcher(patterns, flags=re.I, search=False)
+    assert dispatcher.match("How do I STAKE?")[1] == 'staking'
+    match, value = dispatcher.match("tell me more")
+    assert value == 'default'
+    assert match.group(1) == "tell me more"
+
+
+def test_required_literals():
+    def literals(pattern):
+        requirement = required_literals(re.compile(pattern))
+        return requirement and sorted(text for text, _ in requirement)
+
+    assert literals(r'(?i)(price|market)') == ['market', 'price']
+    assert literals(r'apy\s*\d+') == ['apy']
+    assert literals(r'(?i)what.*(?:chain|l1)') == ['what']
+    # Optional or unbounded parts contribute nothing
+    assert literals(r'(?:sei)?(\w+)') is None
+    assert literals(r'(.*)') is None
+    # A branch with a free alternative requires nothing
+    assert literals(r'(?:sei|\d+)') is None
+
+
+def test_sre_case_equivalents_of_ascii():
+    # IGNORECASE matches "i" against dotless "ı", which casefold leaves alone
+    for pattern, text in [('(?i)i', 'ı'), ('(?i)in', 'İn'), ('(?i)s', 'ſ'), ('(?i)k', '\u212a')]:
+        assert re.search(pattern, text)
+        assert PatternDispatcher([(pattern, 'x')]).match(text) is not None
@@ -0,0 +1,118 @@
+"""
+ProtocolCache.get_or_load tests: single-flight loading, stale reads with a
+background refresh, and empty loads.
+"""
+
+import asyncio
+
+import pytest
+
+from app.cache import cache_engine
+from app.cache.protocol_cache import ProtocolCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_engine, "time", clock)
+    return clock
+
+
+class StubLoader:
+    """Returns the next queued result after a short delay, counting calls"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.results.pop(0) if len(self.results) > 1 else self.results[0]
+
+
+def test_concurrent_misses_share_one_load(clock):
+    async def run():
+        cache = ProtocolCache()
+        loader = StubLoader({'floor_price': 1.5})
+        results = await asyncio.gather(
+            *(cache.get_or_load('nft_stats', 'pallet', loader) for _ in range(10))
+        )
+        assert loader.calls == 1
+        assert results == [{'floor_price': 1.5}] * 10
+        assert cache.get_cached_data('nft_stats', 'pallet') == {'floor_price': 1.5}
+        assert not cache._inflight
+
+    asyncio.run(run())
+
+
+def test_stale_read_triggers_one_background_refresh(clock):
+    async def run():
+        cache = ProtocolCache()
+        loader = StubLoader({'price': 1.0}, {'price': 2.0})
+        await cache.get_or_load('market_data', 'sei', loader)
+
+        # Expired, but inside the stale period
+        clock.now += cache.cache_durations['market_data'] + 1
+        stale = await asyncio.gather(
+            *(cache.get_or_load('market_data', 'sei', loader) for _ in range(5))
+        )
+        assert stale == [{'price': 1.0}] * 5
+        assert loader.calls == 2
+
+        await asyncio.sleep(0.05)
+        assert await cache.get_or_load('market_data', 'sei', loader) == {'price': 2.0}
+        assert loader.calls == 2
+
+    asyncio.run(run())
+
+
+def test_entry_past_stale_period_is_loaded_inline(clock):
+    async def run():
+        cache = ProtocolCache()
+        loader = StubLoader({'price': 1.0}, {'price': 2.0})
+        await cache.get_or_load('market_data', 'sei', loader)
+
+        clock.now += cache.cache_durations['market_data'] + cache.stale_durations['market_data'] + 1
+        assert await cache.get_or_load('market_data', 'sei', loader) == {'price': 2.0}
+
+    asyncio.run(run())
+
+
+def test_empty_load_is_not_cached(clock):
+    async def run():
+        cache = ProtocolCache()
+        loader = StubLoader(None, {'tvl': 10})
+        assert await cache.get_or_load('protocol_metrics', 'dex', loader) is None
+        assert cache.get_cached_data('protocol_metrics', 'dex') is None
+        assert await cache.get_or_load('protocol_metrics', 'dex', loader) == {'tvl': 10}
+        assert loader.calls == 2
+
+    asyncio.run(run())
+
+
+def test_failed_load_reaches_waiters_and_is_not_cached(clock):
+    async def run():
+        cache = ProtocolCache()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ConnectionError("upstream down")
+
+        results = await asyncio.gather(
+            *(cache.get_or_load('nft_stats', 'pallet', failing) for _ in range(3)),
+            return_exceptions=True
+        )
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert not cache._inflight
+        assert await cache.get_or_load('nft_stats', 'pallet', StubLoader({'ok': True})) == {'ok': True}
+
+    asyncio.run(run())
@@ -0,0 +1,153 @@
+"""
+Redis cache tier tests, run against fakeredis.
+
+Each ProtocolCache stands in for one uvicorn worker; workers share a
+FakeServer the way they would share one Redis.
+"""
+
+import asyncio
+
+import pytest
+
+aioredis = pytest.importorskip("fakeredis.aioredis")
+import fakeredis  # noqa: E402
+
+from app.cache.protocol_cache import ProtocolCache  # noqa: E402
+from app.cache.redis_tier import RedisCacheTier  # noqa: E402
+
+STATS = {'floor_price': 1.5, 'holders': [1, 2, 3]}
+
+
+def make_tier(server) -> RedisCacheTier:
+    return RedisCacheTier(aioredis.FakeRedis(server=server))
+
+
+async def wait_for(condition, timeout: float = 3.0) -> bool:
+    """Poll until ``condition()`` holds; the listener polls once a second"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            return False
+        await asyncio.sleep(0.05)
+    return True
+
+
+def test_set_and_get_round_trip():
+    async def run():
+        tier = make_tier(fakeredis.FakeServer())
+        assert await tier.set('nft_stats', 'pallet', STATS, ttl=60)
+        data, remaining = await tier.get('nft_stats', 'pallet')
+        assert data == STATS
+        assert 59 < remaining <= 60
+
+    asyncio.run(run())
+
+
+def test_missing_key():
+    async def run():
+        tier = make_tier(fakeredis.FakeServer())
+        assert await tier.get('nft_stats', 'missing') == (None, 0.0)
+
+    asyncio.run(run())
+
+
+def test_entries_expire_with_ttl():
+    async def run():
+        tier = make_tier(fakeredis.FakeServer())
+        await tier.set('market_data', 'sei', STATS, ttl=0.05)
+        await asyncio.sleep(0.1)
+        data, _ = await tier.get('market_data', 'sei')
+        assert data is None
+
+    asyncio.run(run())
+
+
+def test_delete():
+    async def run():
+        tier = make_tier(fakeredis.FakeServer())
+        await tier.set('nft_stats', 'pallet', STATS, ttl=60)
+        assert await tier.delete('nft_stats', 'pallet')
+        data, _ = await tier.get('nft_stats', 'pallet')
+        assert data is None
+
+    asyncio.run(run())
+
+
+def test_unserializable_value_is_not_shared():
+    async def run():
+        tier = make_tier(fakeredis.FakeServer())
+        assert not await tier.set('nft_stats', 'pallet', {'value': object()}, ttl=60)
+        data, _ = await tier.get('nft_stats', 'pallet')
+        assert data is None
+
+    asyncio.run(run())
+
+
+def test_redis_errors_degrade_to_misses():
+    class BrokenRedis:
+        def pipeline(self, transaction=True):
+            raise ConnectionError("redis down")
+
+        async def set(self, *args, **kwargs):
+            raise ConnectionError("redis down")
+
+    async def run():
+        tier = RedisCacheTier(BrokenRedis())
+        assert await tier.get('nft_stats', 'pallet') == (None, 0.0)
+        assert not await tier.set('nft_stats', 'pallet', STATS, ttl=60)
+
+    asyncio.run(run())
+
+
+def test_l2_hit_is_copied_into_l1():
+    async def run():
+        server = fakeredis.FakeServer()
+        writer, reader = ProtocolCache(), ProtocolCache()
+        writer.shared_tier = make_tier(server)
+        reader.shared_tier = make_tier(server)
+
+        await writer.store_cached_data('nft_stats', 'pallet', STATS)
+        assert reader.get_cached_data('nft_stats', 'pallet') is None
+        assert await reader.fetch_cached_data('nft_stats', 'pallet') == STATS
+        # Served from L1 from now on
+        assert reader.get_cached_data('nft_stats', 'pallet') == STATS
+
+    asyncio.run(run())
+
+
+def test_l2_key_without_expiry_gets_default_ttl_in_l1():
+    async def run():
+        server = fakeredis.FakeServer()
+        redis = aioredis.FakeRedis(server=server)
+        tier = RedisCacheTier(redis)
+        await redis.set(tier._key('nft_stats', 'pallet'), tier._serialize(STATS))
+        assert await tier.get('nft_stats', 'pallet') == (STATS, None)
+
+        reader = ProtocolCache()
+        reader.shared_tier = tier
+        assert await reader.fetch_cached_data('nft_stats', 'pallet') == STATS
+        entry = reader.nft_cache.get_entry('pallet')
+        assert entry.expires_at - entry.timestamp == reader.cache_durations['nft_stats']
+
+    asyncio.run(run())
+
+
+def test_remote_write_invalidates_l1():
+    async def run():
+        server = fakeredis.FakeServer()
+        first, second = ProtocolCache(), ProtocolCache()
+        await first.attach_shared_tier(make_tier(server))
+        await second.attach_shared_tier(make_tier(server))
+        try:
+            second.set_cached_data('nft_stats', 'pallet', {'floor_price': 1.0})
+
+            await first.store_cached_data('nft_stats', 'pallet', STATS)
+            assert await wait_for(lambda: second.get_cached_data('nft_stats', 'pallet') is None)
+            # The writer ignores its own invalidation
+            assert first.get_cached_data('nft_stats', 'pallet') == STATS
+            assert await second.fetch_cached_data('nft_stats', 'pallet') == STATS
+        finally:
+            await first.detach_shared_tier()
+            await second.detach_shared_tier()
+
+    asyncio.run(run())
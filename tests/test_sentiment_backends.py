@@ -0,0 +1,71 @@
+"""
+Sentiment backend parity tests.
+
+The int8 and onnx backends must label the fixture texts like the
+full-precision reference. Skipped where the model dependencies are not
+installed.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("transformers")
+pytest.importorskip("torch")
+
+from app.agent.sentiment_analyzer import SentimentAnalyzer  # noqa: E402
+from utils.sentiment_cache import SentimentCache  # noqa: E402
+
+FIXTURE_PATH = Path(__file__).parent.parent / "scripts" / "fixtures" / "sentiment_samples.json"
+MIN_AGREEMENT = 0.95
+
+
+@pytest.fixture(scope="module")
+def texts():
+    return json.loads(FIXTURE_PATH.read_text())
+
+
+@pytest.fixture(scope="module")
+def onnx_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("sentiment") / "onnx"
+
+
+def make_analyzer(backend: str, onnx_dir: Path) -> SentimentAnalyzer:
+    # A memory-only cache so every run scores through the model
+    return SentimentAnalyzer(
+        backend=backend,
+        cache=SentimentCache(backend, path=None),
+        onnx_dir=str(onnx_dir)
+    )
+
+
+@pytest.fixture(scope="module")
+def reference(texts, onnx_dir):
+    return make_analyzer("pytorch", onnx_dir).analyze_batch(texts)
+
+
+def label_agreement(reference, results) -> float:
+    return sum(r['label'] == c['label'] for r, c in zip(reference, results)) / len(reference)
+
+
+@pytest.mark.parametrize("backend", ["int8", "onnx"])
+def test_backend_matches_reference(backend, texts, onnx_dir, reference):
+    if backend == "onnx":
+        pytest.importorskip("optimum.onnxruntime")
+    results = make_analyzer(backend, onnx_dir).analyze_batch(texts)
+    assert len(results) == len(texts)
+    assert label_agreement(reference, results) >= MIN_AGREEMENT
+
+
+def test_onnx_export_is_reused(texts, onnx_dir, reference):
+    pytest.importorskip("optimum.onnxruntime")
+    make_analyzer("onnx", onnx_dir)
+    exported = onnx_dir / "model.onnx"
+    assert exported.exists()
+    exported_at = exported.stat().st_mtime_ns
+
+    # A second start loads the saved session instead of exporting again
+    results = make_analyzer("onnx", onnx_dir).analyze_batch(texts)
+    assert exported.stat().st_mtime_ns == exported_at
+    assert label_agreement(reference, results) >= MIN_AGREEMENT
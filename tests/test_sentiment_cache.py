@@ -0,0 +1,130 @@
+"""
+SentimentCache tests: key normalization, batch deduplication, the memory
+LRU, restoring from SQLite and pruning the store.
+"""
+
+from datetime import timedelta
+import sqlite3
+
+import pytest
+
+from utils import sentiment_cache
+from utils.sentiment_cache import SentimentCache, normalize_text
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(sentiment_cache, "time", clock)
+    return clock
+
+
+class StubScorer:
+    """Scores a text by its length and records every batch"""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, texts):
+        self.batches.append(list(texts))
+        return [len(text) for text in texts]
+
+
+def test_retweets_and_whitespace_share_a_key():
+    cache = SentimentCache("model", path=None)
+    assert normalize_text("RT @sei_fan:  SEI\n is   fast ") == "SEI is fast"
+    assert cache.key_for("RT @sei_fan: SEI is fast") == cache.key_for("SEI  is fast")
+    # Composed and decomposed accents are the same text
+    assert cache.key_for("caf\u00e9") == cache.key_for("cafe\u0301")
+    assert cache.key_for("SEI") != cache.key_for("sei")
+    assert cache.key_for("SEI") != SentimentCache("other", path=None).key_for("SEI")
+
+
+def test_score_many_scores_each_distinct_text_once():
+    cache = SentimentCache("model", path=None)
+    scorer = StubScorer()
+    cache.set("cached", 100)
+
+    results = cache.score_many(["a", "cached", "RT @x: a", "bb", "bb "], scorer)
+    assert results == [1, 100, 1, 2, 2]
+    assert scorer.batches == [["a", "bb"]]
+
+    assert cache.score_many(["a", "bb"], scorer) == [1, 2]
+    assert len(scorer.batches) == 1
+
+
+def test_memory_is_bounded_lru():
+    cache = SentimentCache("model", path=None, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.get_stats()['entries'] == 2
+
+
+def test_results_survive_reopening(tmp_path):
+    path = str(tmp_path / "sentiment.db")
+    cache = SentimentCache("model", path=path)
+    cache.set_many(["good", "bad"], [{'label': 'positive'}, {'label': 'negative'}])
+    cache.close()
+
+    reopened = SentimentCache("model", path=path)
+    assert reopened.get_many(["good", "bad", "new"]) == [{'label': 'positive'}, {'label': 'negative'}, None]
+    assert reopened.get_stats()['disk_hits'] == 2
+    # Another model's results are not shared
+    assert SentimentCache("other", path=path).get("good") is None
+
+
+def test_prune_drops_old_results(tmp_path, clock):
+    path = str(tmp_path / "sentiment.db")
+    cache = SentimentCache("model", path=path, max_age=timedelta(days=30))
+    cache.set("old", 1)
+    clock.now += timedelta(days=20).total_seconds()
+    cache.set("recent", 2)
+    clock.now += timedelta(days=15).total_seconds()
+    cache.close()
+
+    # Reopening prunes; the memory LRU starts empty
+    reopened = SentimentCache("model", path=path, max_age=timedelta(days=30))
+    assert reopened.get_many(["old", "recent"]) == [None, 2]
+
+
+def test_prune_keeps_newest_within_size_limit(tmp_path, clock):
+    cache = SentimentCache(
+        "model", path=str(tmp_path / "sentiment.db"), max_disk_entries=3, prune_every=2
+    )
+    for i in range(5):
+        clock.now += 1
+        cache.set(f"text {i}", i)
+    # Pruned after the fourth write, not yet after the fifth
+    assert cache._conn.execute("SELECT COUNT(*) FROM sentiment").fetchone()[0] == 4
+
+    assert cache.prune() == 1
+    stored = {row[0] for row in cache._conn.execute("SELECT result FROM sentiment")}
+    assert stored == {"2", "3", "4"}
+
+
+def test_store_without_stored_at_is_migrated(tmp_path, clock):
+    path = str(tmp_path / "sentiment.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE sentiment (key TEXT PRIMARY KEY, model TEXT NOT NULL, result TEXT NOT NULL)")
+    key = SentimentCache("model", path=None).key_for("kept")
+    conn.execute("INSERT INTO sentiment VALUES (?, 'model', '7')", (key,))
+    conn.commit()
+    conn.close()
+
+    cache = SentimentCache("model", path=path)
+    assert cache.get("kept") == 7
+    cache.set("new", 1)
+    assert cache.get_stats()['disk_hits'] == 1
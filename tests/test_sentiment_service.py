@@ -0,0 +1,130 @@
+"""
+SentimentService micro-batching tests, with a stub analyzer in place of
+the model.
+"""
+
+import asyncio
+from concurrent.futures import BrokenExecutor
+import threading
+
+import pytest
+
+from app.agent.sentiment_service import SentimentService
+
+
+class StubAnalyzer:
+    """Labels every text positive and records the batches it was given"""
+
+    def __init__(self, gate: threading.Event = None, fail: bool = False):
+        self.batches = []
+        self.gate = gate
+        self.fail = fail
+
+    def analyze_batch(self, texts):
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.fail:
+            raise RuntimeError("inference failed")
+        self.batches.append(list(texts))
+        return [{'label': 'positive', 'score': 1.0} for _ in texts]
+
+
+def make_service(analyzer, **kwargs) -> SentimentService:
+    return SentimentService(analyzer_factory=lambda: analyzer, **kwargs)
+
+
+def test_batches_are_capped_at_max_batch_size():
+    async def run():
+        analyzer = StubAnalyzer()
+        service = make_service(analyzer, max_batch_size=2, max_wait_ms=200)
+        await service.warm_up()
+        results = await service.analyze_batch([f"text {i}" for i in range(5)])
+        await service.stop()
+        return analyzer, results
+
+    analyzer, results = asyncio.run(run())
+    assert [len(batch) for batch in analyzer.batches] == [2, 2, 1]
+    assert results == [{'label': 'positive', 'score': 1.0}] * 5
+
+
+def test_partial_batch_runs_after_max_wait():
+    async def run():
+        analyzer = StubAnalyzer()
+        service = make_service(analyzer, max_batch_size=32, max_wait_ms=20)
+        await service.warm_up()
+        first = await service.submit("first")
+        await asyncio.sleep(0.1)
+        assert first.done()
+        await service.analyze("second")
+        await service.stop()
+        return analyzer
+
+    assert asyncio.run(run()).batches == [["first"], ["second"]]
+
+
+def test_cancelled_requests_are_skipped():
+    async def run():
+        analyzer = StubAnalyzer()
+        service = make_service(analyzer, max_wait_ms=50)
+        await service.warm_up()
+        abandoned = await service.submit("abandoned")
+        kept = await service.submit("kept")
+        abandoned.cancel()
+        await kept
+        await service.stop()
+        return analyzer
+
+    assert asyncio.run(run()).batches == [["kept"]]
+
+
+def test_stop_fails_queued_and_in_flight_requests():
+    async def run():
+        gate = threading.Event()
+        service = make_service(StubAnalyzer(gate=gate), max_batch_size=1, max_wait_ms=1)
+        await service.warm_up()
+        in_flight = await service.submit("in flight")
+        await asyncio.sleep(0.05)
+        queued = await service.submit("queued")
+        await service.stop()
+        gate.set()
+        for future in (in_flight, queued):
+            with pytest.raises(RuntimeError, match="stopped"):
+                await future
+
+    asyncio.run(run())
+
+
+def test_batch_errors_reach_callers():
+    async def run():
+        service = make_service(StubAnalyzer(fail=True), max_wait_ms=1)
+        await service.warm_up()
+        with pytest.raises(RuntimeError, match="inference failed"):
+            await service.analyze_batch(["a", "b"])
+        await service.stop()
+
+    asyncio.run(run())
+
+
+def test_failed_model_load_is_reported_and_retried():
+    analyzer = StubAnalyzer()
+    loads = []
+
+    def factory():
+        loads.append(1)
+        if len(loads) == 1:
+            raise OSError("model files missing")
+        return analyzer
+
+    async def run():
+        service = SentimentService(analyzer_factory=factory, max_wait_ms=1)
+        await service.start()
+        with pytest.raises(BrokenExecutor):
+            await service.analyze("first")
+        # A new inference thread loads the model again
+        result = await service.analyze("second")
+        await service.stop()
+        return result
+
+    assert asyncio.run(run()) == {'label': 'positive', 'score': 1.0}
+    assert len(loads) == 2
+    assert analyzer.batches == [["second"]]
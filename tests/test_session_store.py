@@ -0,0 +1,172 @@
+"""
+SessionStore Tests
+
+Covers LRU eviction, idle expiry, snapshots to a backend and restoring
+from it, with the SQLite backend and with Redis (via fakeredis).
+"""
+
+import asyncio
+import pytest
+from fakeredis import aioredis
+from sei_agent_modules import load_service_module
+
+session_store = load_service_module("conversation", "session_store")
+session_records = load_service_module("conversation", "session_records")
+session_backends = load_service_module("conversation", "session_backends")
+educational_scaffold = load_service_module("conversation", "educational_scaffold")
+SessionStore = session_store.SessionStore
+ConversationContext = session_records.ConversationContext
+LearningProgress = session_records.LearningProgress
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(session_store, "time", clock)
+    return clock
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def backend(request, tmp_path):
+    if request.param == "sqlite":
+        backend = session_backends.SQLiteSessionBackend(str(tmp_path / "sessions.db"))
+    else:
+        backend = session_backends.RedisSessionBackend(aioredis.FakeRedis())
+    yield backend
+    asyncio.run(backend.close())
+
+
+def test_evicts_least_recently_used(clock):
+    store = SessionStore(ConversationContext, "chat", max_sessions=2)
+    store.get_or_create("alice")
+    store.get_or_create("bob")
+    # Touching alice makes bob the least recently used
+    assert store.get("alice") is not None
+    store.get_or_create("carol")
+
+    assert "bob" not in store
+    assert "alice" in store and "carol" in store
+    assert store.get_stats()['evictions'] == 1
+
+
+def test_idle_sessions_expire(clock):
+    store = SessionStore(ConversationContext, "chat", idle_ttl=60)
+    store.get_or_create("alice")
+    clock.now += 30
+    store.get_or_create("bob")
+
+    clock.now += 45
+    # alice is 75s idle, bob 45s
+    assert store.sweep() == 1
+    assert "alice" not in store
+
+    clock.now += 61
+    assert store.get("bob") is None
+    assert store.get_stats()['expirations'] == 2
+
+
+def test_flush_writes_only_dirty_sessions(backend):
+    async def run():
+        store = SessionStore(ConversationContext, "chat", backend=backend)
+        context = store.get_or_create("alice")
+        context.topics_discussed.add("defi")
+        store.mark_dirty("alice")
+        store.get_or_create("bob")
+
+        assert await store.flush() == 1
+        # Nothing changed since the last snapshot
+        assert await store.flush() == 0
+        assert (await backend.load("chat", "alice"))['topics_discussed'] == ["defi"]
+        assert await backend.load("chat", "bob") is None
+
+    asyncio.run(run())
+
+
+def test_evicted_dirty_session_is_flushed_and_restored(backend):
+    async def run():
+        store = SessionStore(ConversationContext, "chat", max_sessions=1, backend=backend)
+        store.get_or_create("alice").expertise_level = "advanced"
+        store.mark_dirty("alice")
+        store.get_or_create("bob")
+        assert "alice" not in store
+
+        # Before the snapshot the pending copy is served
+        assert (await store.load("alice")).expertise_level == "advanced"
+        assert await store.flush() == 1
+
+        # A new store (e.g. after a restart) restores it from the backend
+        restarted = SessionStore(ConversationContext, "chat", backend=backend)
+        assert (await restarted.load("alice")).expertise_level == "advanced"
+        assert (await restarted.load("nobody")).expertise_level == "beginner"
+
+    asyncio.run(run())
+
+
+def test_delete_removes_backend_copy(backend):
+    async def run():
+        store = SessionStore(ConversationContext, "chat", backend=backend)
+        store.get_or_create("alice")
+        store.mark_dirty("alice")
+        await store.flush()
+        await store.delete("alice")
+
+        assert "alice" not in store
+        assert await backend.load("chat", "alice") is None
+
+    asyncio.run(run())
+
+
+def test_failed_flush_is_retried():
+    class FlakyBackend:
+        def __init__(self):
+            self.saved = {}
+            self.fail = True
+
+        async def save_many(self, namespace, records):
+            if self.fail:
+                raise ConnectionError("backend down")
+            self.saved.update(records)
+
+        async def load(self, namespace, user_id):
+            return self.saved.get(user_id)
+
+    async def run():
+        backend = FlakyBackend()
+        store = SessionStore(ConversationContext, "chat", backend=backend)
+        store.get_or_create("alice")
+        store.mark_dirty("alice")
+
+        assert await store.flush() == 0
+        backend.fail = False
+        assert await store.flush() == 1
+        assert "alice" in backend.saved
+
+    asyncio.run(run())
+
+
+def test_learning_progress_survives_restart(backend):
+    async def run():
+        store = SessionStore(LearningProgress, "learning_progress", backend=backend)
+        scaffold = educational_scaffold.EducationalScaffold(store)
+        await scaffold.track_progress("alice", "defi", "defi_fundamentals")
+        await store.flush()
+
+        # Progress tracked after a restart extends the saved record
+        restarted = SessionStore(LearningProgress, "learning_progress", backend=backend)
+        scaffold = educational_scaffold.EducationalScaffold(restarted)
+        await scaffold.track_progress("alice", "defi", "protocols")
+        await restarted.flush()
+
+        assert await scaffold.get_next_topic("alice", "defi") == "yield_farming"
+        saved = LearningProgress.from_dict(await backend.load("learning_progress", "alice"))
+        assert saved.paths["defi"].completed_topics == {"defi_fundamentals", "protocols"}
+
+    asyncio.run(run())
@@ -0,0 +1,62 @@
+"""
+Server-Sent Events helper tests.
+"""
+
+from datetime import datetime
+import asyncio
+import json
+
+from utils.sse import format_event, sse_response
+
+
+def parse(frames):
+    """Split SSE frames back into (event, data) pairs"""
+    events = []
+    for frame in frames:
+        assert frame.endswith("\n\n")
+        event_line, data_line = frame[:-2].split("\n")
+        assert event_line.startswith("event: ") and data_line.startswith("data: ")
+        events.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+    return events
+
+
+def stream(events):
+    async def run():
+        response = sse_response(events)
+        return response, [frame async for frame in response.body_iterator]
+    return asyncio.run(run())
+
+
+def test_format_event_frames_json():
+    assert format_event("metrics", {'tps': 1.5}) == 'event: metrics\ndata: {"tps": 1.5}\n\n'
+    # Values JSON cannot encode are sent as strings
+    assert parse([format_event("x", {'at': datetime(2024, 1, 1)})]) == [("x", {'at': "2024-01-01 00:00:00"})]
+
+
+def test_events_are_streamed_in_order_and_end_with_done():
+    async def events():
+        yield 'response', {'response': "hi"}
+        yield 'metrics', {'network': {}}
+
+    response, frames = stream(events())
+    assert response.media_type == "text/event-stream"
+    assert response.headers['cache-control'] == "no-cache"
+    assert response.headers['x-accel-buffering'] == "no"
+    assert parse(frames) == [
+        ('response', {'response': "hi"}),
+        ('metrics', {'network': {}}),
+        ('done', {}),
+    ]
+
+
+def test_failure_is_reported_in_band():
+    async def events():
+        yield 'response', {'response': "hi"}
+        raise ConnectionError("upstream down")
+
+    _, frames = stream(events())
+    assert parse(frames) == [
+        ('response', {'response': "hi"}),
+        ('error', {'detail': "Error processing request"}),
+        ('done', {}),
+    ]
@@ -0,0 +1,78 @@
+"""
+Request-scoped trend analysis tests.
+
+Scraping is replaced by a stub search function, and mentions are kept in
+an in-memory MentionStore.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.agent.trend_analyzer import SEITrendAnalyzer
+from utils.mention_store import MentionStore
+
+
+@pytest.fixture
+def analyzer():
+    analyzer = SEITrendAnalyzer(mention_store=MentionStore(":memory:"))
+    yield analyzer
+    analyzer.mention_ingestor.close()
+    analyzer.mention_store.close()
+
+
+def test_default_keywords_are_the_tracked_set(analyzer):
+    assert analyzer.normalize_keywords() == analyzer.normalize_keywords([])
+    assert set(analyzer.normalize_keywords()) == set(analyzer.tracked_keywords)
+
+
+def test_keywords_are_collapsed_deduplicated_and_sorted(analyzer):
+    assert analyzer.normalize_keywords(["  sei   network ", "Pallet", "pallet", "", "  "]) == (
+        "pallet", "SEI Network"
+    )
+    assert analyzer.normalize_keywords(["b", "A"]) == analyzer.normalize_keywords(["a", "B"])
+
+
+def test_keyword_limits(analyzer):
+    analyzer.normalize_keywords([f"kw{i}" for i in range(analyzer.max_keywords)])
+    with pytest.raises(ValueError):
+        analyzer.normalize_keywords([f"kw{i}" for i in range(analyzer.max_keywords + 1)])
+    with pytest.raises(ValueError):
+        analyzer.normalize_keywords(["x" * (analyzer.max_keyword_length + 1)])
+    # Duplicates do not count against the limit
+    assert analyzer.normalize_keywords(["sei"] * (analyzer.max_keywords + 1)) == ("SEI",)
+
+
+def test_cache_key_is_request_scoped(analyzer):
+    key = analyzer.cache_key(24, analyzer.normalize_keywords(["pallet", "SEI"]))
+    assert key == analyzer.cache_key(24, analyzer.normalize_keywords(["sei", " Pallet"]))
+    assert key != analyzer.cache_key(48, analyzer.normalize_keywords(["pallet", "SEI"]))
+    assert key != analyzer.cache_key(24, analyzer.normalize_keywords(["pallet"]))
+    assert analyzer.cache_key(24, ("a|b",)) != analyzer.cache_key(24, ("a", "b"))
+
+
+def test_evicted_keyword_is_reseeded_from_the_store(analyzer):
+    now = datetime.now(timezone.utc)
+    tweets = {
+        keyword: [
+            {'id': 1000 * n + i, 'text': keyword, 'user': 'u', 'created_at': now - timedelta(minutes=i),
+             'retweets': 0, 'likes': 0}
+            for i in range(3)
+        ]
+        for n, keyword in enumerate(("alpha", "beta", "gamma"), start=1)
+    }
+    analyzer.mention_ingestor.search = lambda keyword, since_id, since: [
+        tweet for tweet in tweets[keyword] if since_id is None or tweet['id'] > since_id
+    ]
+    analyzer.trend_aggregator.max_keywords = 2
+
+    assert analyzer.analyze_social_trends(keywords=["alpha"])['alpha']['mention_count'] == 3
+    analyzer.analyze_social_trends(keywords=["beta", "gamma"])
+    assert len(analyzer.trend_aggregator) == 2
+    assert "alpha" not in analyzer.trend_aggregator
+
+    # A mention ingested while the keyword has no windows is stored, not lost
+    tweets["alpha"].append({'id': 1999, 'text': 'alpha', 'user': 'u', 'created_at': now,
+                            'retweets': 0, 'likes': 0})
+    analyzer.mention_ingestor.ingest(["alpha"], force=True)
+    assert analyzer.analyze_social_trends(keywords=["alpha"])['alpha']['mention_count'] == 4
@@ -0,0 +1,106 @@
+"""
+Bucketed window and TrendAggregator tests, against a fake clock.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from utils import trend_window
+from utils.trend_window import BucketedWindow, TrendAggregator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0 * 60
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(trend_window, "time", clock)
+    return clock
+
+
+def at(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, timezone.utc)
+
+
+def test_single_mention_window(clock):
+    window = BucketedWindow(60, 10)
+    window.add(clock.now - 30, engagement=4, sentiment='positive')
+
+    result = window.query(300)
+    assert result == {
+        'mention_count': 1,
+        'avg_engagement': 4.0,
+        'mentions_per_hour': 1.0,
+        'sentiment_distribution': {'positive': 1, 'neutral': 0, 'negative': 0}
+    }
+    # A window ending before the mention's bucket is empty
+    assert window.query(300, now=clock.now - 120) is None
+
+
+def test_rate_uses_the_covered_span(clock):
+    window = BucketedWindow(60, 120)
+    for minutes_ago in (90, 60, 30):
+        window.add(clock.now - minutes_ago * 60)
+    # Three mentions across one hour
+    assert window.query(7200)['mentions_per_hour'] == 3.0
+
+
+def test_ring_wraps_around(clock):
+    window = BucketedWindow(60, 5)
+    start = clock.now
+    for minute in range(8):
+        clock.now = start + minute * 60
+        window.add(clock.now)
+
+    # Only the last five minutes are still in the ring
+    assert window.query(3600)['mention_count'] == 5
+    # Too old for the ring, so it cannot overwrite a newer bucket
+    window.add(start)
+    assert window.query(3600)['mention_count'] == 5
+
+
+def test_late_event_does_not_clobber_newer_bucket(clock):
+    window = BucketedWindow(60, 5)
+    window.add(clock.now)
+    # Maps to the same slot, one rotation older
+    window.add(clock.now - 5 * 60)
+    assert window.query(60)['mention_count'] == 1
+
+
+def test_query_picks_the_finest_covering_tier(clock):
+    aggregator = TrendAggregator(minute_buckets=60, hour_buckets=48)
+    aggregator.add("sei", at(clock.now - 30 * 60))
+    aggregator.add("sei", at(clock.now - 10 * 3600))
+
+    # The minute tier covers an hour and sees only the recent mention
+    assert aggregator.query("sei", 3600)['mention_count'] == 1
+    # A day needs the hour tier
+    assert aggregator.query("sei", 24 * 3600)['mention_count'] == 2
+    # Longer than every tier falls back to the coarsest
+    assert aggregator.query("sei", 30 * 24 * 3600)['mention_count'] == 2
+
+
+def test_untracked_keywords_and_eviction(clock):
+    aggregator = TrendAggregator(max_keywords=2)
+    aggregator.add("a", at(clock.now))
+    aggregator.add("b", at(clock.now))
+    aggregator.query("a", 3600)
+    aggregator.add("c", at(clock.now))
+
+    assert "b" not in aggregator and "a" in aggregator and "c" in aggregator
+    assert aggregator.query("b", 3600) is None
+
+    aggregator.add("d", at(clock.now), create=False)
+    assert "d" not in aggregator
+
+    seeded = aggregator.track("d", lambda: [{'created_at': at(clock.now), 'likes': 2, 'retweets': 1}])
+    assert seeded
+    assert aggregator.query("d", 3600)['avg_engagement'] == 3.0
+    assert not aggregator.track("d", lambda: pytest.fail("seeded twice"))
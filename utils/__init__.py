@@ -1 +0,0 @@
-ECHO is on.
@@ -1,11 +1,37 @@
-import requests
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from utils.http_client import HTTPClient
 
-def fetch_data(url, headers=None):
+# Blocking libraries (snscrape, TextBlob, tweepy) run here so they never
+# stall the Discord gateway loop. Kept small so a burst of commands
+# queues instead of spawning unbounded threads.
+BLOCKING_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bot-io")
+
+_http_client = None
+
+def get_http_client():
+    """Return the bot's shared pooled HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = HTTPClient()
+    return _http_client
+
+async def close_http_client():
+    """Close the shared HTTP client."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.close()
+        _http_client = None
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking function on the bounded executor and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(BLOCKING_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+async def fetch_data(url, headers=None, params=None):
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return await get_http_client().get_json(url, headers=headers, params=params)
     except Exception as e:
         print(f"Error fetching data: {e}")
         return {}
-
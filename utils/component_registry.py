@@ -0,0 +1,140 @@
+"""
+Lazy Component Registry
+
+Heavy components (ML models, API clients with auth handshakes, pooled
+transports) are registered as factories and only built the first time
+they are asked for. Importing a module that registers them costs nothing;
+the process can report healthy immediately and warm components up in the
+background, or on first use.
+
+Warm-up and shutdown hooks let the owner load models and open
+connections explicitly at startup and release them on shutdown.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+import asyncio
+import inspect
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+Hook = Callable[[Any], Union[None, Awaitable[None]]]
+
+
+class _Registration:
+    __slots__ = ('factory', 'warmup', 'shutdown', 'instance', 'loaded', 'load_seconds', 'lock')
+
+    def __init__(self, factory: Callable[[], Any], warmup: Optional[Hook], shutdown: Optional[Hook]):
+        self.factory = factory
+        self.warmup = warmup
+        self.shutdown = shutdown
+        self.instance = None
+        self.loaded = False
+        self.load_seconds = 0.0
+        self.lock = threading.Lock()
+
+
+class ComponentRegistry:
+    """
+    Registry of lazily constructed components.
+
+    ``get`` builds a component on first access (once, even across threads).
+    ``warm_up`` builds components off the event loop and runs their
+    warm-up hooks; ``shutdown`` runs shutdown hooks for built components in
+    reverse build order.
+    """
+
+    def __init__(self):
+        self._registrations: Dict[str, _Registration] = {}
+        self._build_order: List[str] = []
+
+    def register(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        warmup: Optional[Hook] = None,
+        shutdown: Optional[Hook] = None
+    ):
+        """
+        Register a component factory.
+
+        Args:
+            name: Component name used with ``get``
+            factory: Zero-argument callable building the component
+            warmup: Optional hook (sync or async) run by ``warm_up``
+            shutdown: Optional hook (sync or async) run by ``shutdown``
+        """
+        self._registrations[name] = _Registration(factory, warmup, shutdown)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._registrations
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._registrations and self._registrations[name].loaded
+
+    def get(self, name: str) -> Any:
+        """Return a component, building it on first access."""
+        registration = self._registrations[name]
+        if registration.loaded:
+            return registration.instance
+
+        with registration.lock:
+            if not registration.loaded:
+                started = time.perf_counter()
+                registration.instance = registration.factory()
+                registration.load_seconds = time.perf_counter() - started
+                registration.loaded = True
+                self._build_order.append(name)
+                logger.info(f"Loaded component '{name}' in {registration.load_seconds:.2f}s")
+        return registration.instance
+
+    async def warm_up(self, names: Optional[Iterable[str]] = None):
+        """
+        Build components and run their warm-up hooks.
+
+        Factories run in a worker thread so a slow model load does not
+        block the event loop. Components are warmed in the given order; a
+        failing component does not stop the others from warming up.
+
+        Raises:
+            RuntimeError: If any component failed, after all were attempted
+        """
+        failed = []
+        for name in (names if names is not None else list(self._registrations)):
+            registration = self._registrations[name]
+            try:
+                instance = await asyncio.to_thread(self.get, name)
+                if registration.warmup:
+                    await self._call_hook(registration.warmup, instance)
+            except Exception as e:
+                logger.error(f"Error warming up component '{name}': {str(e)}")
+                failed.append(name)
+        if failed:
+            raise RuntimeError(f"Components failed to warm up: {', '.join(failed)}")
+
+    async def shutdown(self):
+        """Run shutdown hooks of built components, newest first."""
+        for name in reversed(self._build_order):
+            registration = self._registrations[name]
+            try:
+                if registration.shutdown:
+                    await self._call_hook(registration.shutdown, registration.instance)
+            except Exception as e:
+                logger.error(f"Error shutting down component '{name}': {str(e)}")
+            registration.instance = None
+            registration.loaded = False
+        self._build_order.clear()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {'loaded': registration.loaded, 'load_seconds': round(registration.load_seconds, 3)}
+            for name, registration in self._registrations.items()
+        }
+
+    @staticmethod
+    async def _call_hook(hook: Hook, instance: Any):
+        result = hook(instance)
+        if inspect.isawaitable(result):
+            await result
@@ -0,0 +1,295 @@
+"""
+Local Documentation Index
+
+Offline full-text search over a snapshot of the SEI docs. Documents are
+split into passages at Markdown headings, tokenized, and stored as an
+inverted index scored with BM25, so a docs lookup is a handful of
+posting-list reads instead of a remote search call.
+
+On disk an index is a directory:
+    meta.json      corpus statistics, fingerprint and BM25 parameters
+    terms.json     term -> [posting offset, document frequency]
+    postings.bin   uint32 (passage id, term frequency) pairs, by term
+    lengths.bin    uint32 token count per passage
+    passages.json  title, source and text of each passage
+
+The two .bin files are memory-mapped rather than read, so opening an
+index is cheap and its pages are shared between worker processes. They
+use the native byte order of the machine that built them.
+"""
+
+from typing import Dict, Iterable, List, Optional
+from array import array
+from collections import Counter, defaultdict
+from pathlib import Path
+import hashlib
+import heapq
+import json
+import logging
+import math
+import mmap
+import os
+import re
+import sys
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+_TOKEN = re.compile(r"[a-z0-9$]+")
+_HEADING = re.compile(r"^(#{1,3})\s+(.*)$", re.MULTILINE)
+STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from how i if in is it its me my "
+    "of on or so than that the their then there this to was what when where which "
+    "who why will with you your".split()
+)
+
+
+def stem(token: str) -> str:
+    """
+    Light suffix stripping so inflections share a term.
+
+    Not a full stemmer: it only has to map "stake", "staked" and
+    "staking" to the same term, consistently for documents and queries.
+    """
+    for suffix in ('ing', 'ed', 'es', 's'):
+        if token.endswith(suffix) and not token.endswith('ss') and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            break
+    if token.endswith('e') and len(token) > 3:
+        token = token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, stemmed word tokens without stopwords"""
+    return [stem(token) for token in _TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def split_markdown(text: str, source: str) -> List[Dict[str, str]]:
+    """
+    Split a Markdown document into passages, one per heading.
+
+    Returns:
+        Passages with 'title' (document title - section heading), 'source'
+        and 'text'
+    """
+    headings = list(_HEADING.finditer(text))
+    doc_title = next((m.group(2).strip() for m in headings if m.group(1) == '#'), Path(source).stem)
+
+    passages = []
+    bounds = [m.start() for m in headings] + [len(text)]
+    if not headings or bounds[0] > 0:
+        headings.insert(0, None)
+        bounds.insert(0, 0)
+    for heading, start, end in zip(headings, bounds, bounds[1:]):
+        body = text[start:end]
+        if heading is not None:
+            body = body[heading.end() - start:]
+        body = " ".join(body.split())
+        if not body:
+            continue
+        section = heading.group(2).strip() if heading is not None else doc_title
+        title = doc_title if section == doc_title else f"{doc_title} - {section}"
+        passages.append({'title': title, 'source': source, 'text': body})
+    return passages
+
+
+def load_markdown_corpus(path: str) -> List[Dict[str, str]]:
+    """Passages from every .md file under ``path``, in a stable order"""
+    root = Path(path)
+    passages = []
+    for file in sorted(root.rglob("*.md")):
+        passages.extend(split_markdown(file.read_text(encoding="utf-8"), str(file.relative_to(root))))
+    return passages
+
+
+def corpus_fingerprint(path: str) -> Optional[str]:
+    """
+    Digest of the .md files under ``path`` and their sizes and mtimes.
+
+    Cheap enough to check on every start; any added, removed or edited
+    document changes it. Returns None if there are no documents.
+    """
+    root = Path(path)
+    files = sorted(root.rglob("*.md"))
+    if not files:
+        return None
+    digest = hashlib.sha256()
+    for file in files:
+        stat = file.stat()
+        digest.update(f"{file.relative_to(root)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class DocsIndex:
+    """
+    BM25 inverted index over documentation passages.
+
+    Build one with ``build`` and ``save`` it (the ingestion job), then
+    ``open`` it wherever docs are searched.
+    """
+
+    def __init__(
+        self,
+        terms: Dict[str, List[int]],
+        postings,
+        lengths,
+        passages: List[Dict[str, str]],
+        k1: float = 1.2,
+        b: float = 0.75,
+        buffers: Optional[list] = None,
+        corpus_fingerprint: Optional[str] = None
+    ):
+        self.terms = terms
+        self.postings = postings
+        self.lengths = lengths
+        self.passages = passages
+        self.k1 = k1
+        self.b = b
+        self.avg_length = (sum(lengths) / len(lengths)) if len(lengths) else 0.0
+        self._buffers = buffers or []
+        # corpus_fingerprint() of the documents the index was built from
+        self.corpus_fingerprint = corpus_fingerprint
+
+    def __len__(self) -> int:
+        return len(self.passages)
+
+    @classmethod
+    def build(cls, passages: Iterable[Dict[str, str]], k1: float = 1.2, b: float = 0.75) -> 'DocsIndex':
+        """Tokenize passages and build the inverted index in memory."""
+        passages = list(passages)
+        term_postings: Dict[str, List[int]] = defaultdict(list)
+        lengths = array('I')
+        for passage_id, passage in enumerate(passages):
+            # Titles count as part of the passage so headings are searchable
+            tokens = tokenize(f"{passage['title']} {passage['text']}")
+            lengths.append(len(tokens))
+            for term, frequency in Counter(tokens).items():
+                term_postings[term].extend((passage_id, frequency))
+
+        terms = {}
+        postings = array('I')
+        for term in sorted(term_postings):
+            entries = term_postings[term]
+            terms[term] = [len(postings), len(entries) // 2]
+            postings.extend(entries)
+        return cls(terms, postings, lengths, passages, k1, b)
+
+    def save(self, path: str, corpus_fingerprint: Optional[str] = None):
+        """
+        Write the index directory; meta.json is written last.
+
+        Args:
+            corpus_fingerprint: ``corpus_fingerprint()`` of the source
+                documents, so readers can tell when the index is out of date
+        """
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        def write(name: str, data: bytes):
+            tmp = directory / f"{name}.tmp"
+            tmp.write_bytes(data)
+            os.replace(tmp, directory / name)
+
+        write("postings.bin", array('I', self.postings).tobytes())
+        write("lengths.bin", array('I', self.lengths).tobytes())
+        write("terms.json", json.dumps(self.terms).encode("utf-8"))
+        write("passages.json", json.dumps(self.passages).encode("utf-8"))
+        write("meta.json", json.dumps({
+            'version': FORMAT_VERSION,
+            'byteorder': sys.byteorder,
+            'passages': len(self.passages),
+            'terms': len(self.terms),
+            'k1': self.k1,
+            'b': self.b,
+            'corpus_fingerprint': corpus_fingerprint
+        }).encode("utf-8"))
+        self.corpus_fingerprint = corpus_fingerprint
+
+    @classmethod
+    def open(cls, path: str) -> 'DocsIndex':
+        """
+        Open a saved index, memory-mapping its posting lists.
+
+        Raises:
+            FileNotFoundError: If no index exists at ``path``
+            ValueError: If the index was built by another format version
+                or on a machine with a different byte order
+        """
+        directory = Path(path)
+        meta = json.loads((directory / "meta.json").read_text())
+        if meta.get('version') != FORMAT_VERSION or meta.get('byteorder') != sys.byteorder:
+            raise ValueError(f"Docs index at {path} is incompatible; rebuild it")
+
+        buffers = []
+
+        def map_uint32(name: str):
+            with open(directory / name, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return array('I')
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            buffers.append(mapped)
+            return memoryview(mapped).cast('I')
+
+        return cls(
+            json.loads((directory / "terms.json").read_text()),
+            map_uint32("postings.bin"),
+            map_uint32("lengths.bin"),
+            json.loads((directory / "passages.json").read_text(encoding="utf-8")),
+            meta['k1'],
+            meta['b'],
+            buffers,
+            meta.get('corpus_fingerprint')
+        )
+
+    def close(self):
+        for buffer in self._buffers:
+            try:
+                buffer.close()
+            except BufferError:
+                # A memoryview is still exported; the map closes when it is collected
+                pass
+        self._buffers = []
+
+    def search(self, query: str, limit: int = 3) -> List[Dict]:
+        """
+        Passages ranked by BM25 score for the query.
+
+        Returns:
+            Up to ``limit`` dicts with 'title', 'source', 'excerpt' and 'score'
+        """
+        n = len(self.passages)
+        if not n:
+            return []
+
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            entry = self.terms.get(term)
+            if entry is None:
+                continue
+            offset, df = entry
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for i in range(offset, offset + 2 * df, 2):
+                passage_id, tf = self.postings[i], self.postings[i + 1]
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[passage_id] / self.avg_length)
+                scores[passage_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [
+            {
+                'title': self.passages[passage_id]['title'],
+                'source': self.passages[passage_id]['source'],
+                'excerpt': excerpt(self.passages[passage_id]['text']),
+                'score': round(score, 4)
+            }
+            for passage_id, score in best
+        ]
+
+
+def excerpt(text: str, max_chars: int = 300) -> str:
+    """Leading sentences of a passage, cut at a sentence end when possible"""
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind('. ', 0, max_chars)
+    return text[:cut + 1] if cut > 0 else text[:max_chars].rstrip() + "…"
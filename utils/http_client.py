@@ -0,0 +1,215 @@
+"""
+Shared HTTP Transport
+
+One pooled async HTTP client for every outbound integration (SEI REST,
+docs search, Magic Eden, CoinMarketCap, ...). Connections are kept alive
+and reused per host, HTTP/2 is negotiated when the ``h2`` package is
+installed, and every request goes through the same per-host concurrency
+limit, timeout and retry budget.
+
+The client is created and closed by the owning resource manager and
+injected into services instead of each service building its own session.
+"""
+
+from typing import Any, Dict, Optional
+from collections import defaultdict
+from urllib.parse import urlsplit
+import asyncio
+import importlib.util
+import logging
+import time
+import httpx
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of recent traffic.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one,
+    so retries can never exceed roughly ``ratio`` of requests. This keeps a
+    struggling upstream from being hit with a retry storm.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_tokens: float = 10.0, max_tokens: float = 100.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = min_tokens
+
+    def deposit(self):
+        self.tokens = min(self.tokens + self.ratio, self.max_tokens)
+
+    def withdraw(self) -> bool:
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class HTTPClient:
+    """
+    Pooled async HTTP client shared by all services.
+
+    Attributes:
+        timeout (float): Default total timeout per request in seconds
+        per_host_limit (int): Maximum concurrent requests to one host
+        max_retries (int): Maximum retries per request, subject to the budget
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        connect_timeout: float = 5.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        per_host_limit: int = 10,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
+        retry_budget_ratio: float = 0.1,
+        http2: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        if http2 is None:
+            http2 = importlib.util.find_spec("h2") is not None
+
+        self.timeout = timeout
+        self.per_host_limit = per_host_limit
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.retry_budget = RetryBudget(ratio=retry_budget_ratio)
+
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            ),
+            headers=headers,
+            follow_redirects=True
+        )
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, Dict[str, float]] = defaultdict(lambda: {
+            'requests': 0,
+            'errors': 0,
+            'retries': 0,
+            'retries_denied': 0,
+            'connections_opened': 0,
+            'total_latency': 0.0
+        })
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request through the shared pool.
+
+        Idempotent requests are retried on connection errors, timeouts and
+        429/5xx responses while the retry budget allows it.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            **kwargs: Passed to ``httpx.AsyncClient.build_request``
+                (params, headers, json, data, timeout, ...)
+
+        Returns:
+            The final httpx.Response (status is not checked)
+        """
+        method = method.upper()
+        host = urlsplit(url).netloc
+        stats = self._stats[host]
+        can_retry = method in IDEMPOTENT_METHODS
+        attempt = 0
+
+        while True:
+            # Hold a per-host slot only while the request is in flight, not
+            # while backing off before a retry
+            async with self._host_semaphore(host):
+                stats['requests'] += 1
+                self.retry_budget.deposit()
+                started = time.monotonic()
+                request = self._client.build_request(
+                    method, url, extensions={'trace': self._trace_for(host)}, **kwargs
+                )
+                try:
+                    response = await self._client.send(request)
+                    error: Optional[Exception] = None
+                except (httpx.TransportError, httpx.TimeoutException) as e:
+                    response = None
+                    error = e
+                finally:
+                    stats['total_latency'] += time.monotonic() - started
+
+            failed = error is not None or response.status_code in RETRYABLE_STATUS_CODES
+            if not failed:
+                return response
+
+            stats['errors'] += 1
+            if not can_retry or attempt >= self.max_retries:
+                break
+            if not self.retry_budget.withdraw():
+                stats['retries_denied'] += 1
+                break
+
+            attempt += 1
+            stats['retries'] += 1
+            if response is not None:
+                await response.aclose()
+            await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+
+        if error is not None:
+            raise error
+        return response
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def get_json(self, url: str, **kwargs) -> Any:
+        """GET a URL and decode its JSON body, raising on non-2xx responses."""
+        response = await self.get(url, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-host request, retry, error and connection reuse metrics."""
+        hosts = {}
+        for host, stats in self._stats.items():
+            requests = stats['requests']
+            hosts[host] = {
+                **{key: value for key, value in stats.items() if key != 'total_latency'},
+                'avg_latency_ms': round(stats['total_latency'] / requests * 1000, 2) if requests else 0.0,
+                'connection_reuse_rate': (
+                    round(1 - stats['connections_opened'] / requests, 4) if requests else 0.0
+                )
+            }
+        return {
+            'hosts': hosts,
+            'retry_budget_tokens': round(self.retry_budget.tokens, 2)
+        }
+
+    async def close(self):
+        """Close all pooled connections."""
+        await self._client.aclose()
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_semaphores[host]
+
+    def _trace_for(self, host: str):
+        """Build an httpcore trace hook counting new connections for a host."""
+        stats = self._stats[host]
+
+        async def trace(event_name: str, info: Dict):
+            if event_name == "connection.connect_tcp.complete":
+                stats['connections_opened'] += 1
+
+        return trace
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import time
+from utils.api_helpers import get_http_client
+
+COINMARKETCAP_URL = "https://pro-api.coinmarketcap.com/v1/cryptocurrency/listings/latest"
+
+class ListingsSnapshot:
+    """
+    In-memory snapshot of the CoinMarketCap listings.
+
+    The top ``limit`` listings are downloaded at most once per ``interval``
+    seconds and indexed by symbol and by rank, so price lookups and top-N
+    queries are served from memory. Concurrent callers that find the
+    snapshot stale share a single refresh instead of each calling the API.
+    After a failed refresh the API is left alone for ``retry_interval``
+    seconds and the last snapshot (possibly stale or empty) is served.
+    """
+
+    def __init__(self, api_key=None, limit=100, interval=300, convert="USD", retry_interval=60):
+        self.api_key = api_key or os.getenv("COINMARKETCAP_API_KEY")
+        self.limit = limit
+        self.interval = interval
+        self.convert = convert
+        self.retry_interval = retry_interval
+        self.by_symbol = {}
+        self.by_rank = {}
+        self.updated_at = 0.0
+        self.failed_at = None
+        self._refresh_task = None
+
+    def is_fresh(self):
+        return bool(self.by_rank) and time.monotonic() - self.updated_at < self.interval
+
+    def is_backing_off(self):
+        return self.failed_at is not None and time.monotonic() - self.failed_at < self.retry_interval
+
+    async def ensure_fresh(self):
+        """Refresh the snapshot if it is stale, joining any refresh already running."""
+        if self.is_fresh() or self.is_backing_off():
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._refresh())
+        # Shield so a cancelled command does not cancel the shared refresh
+        await asyncio.shield(self._refresh_task)
+
+    async def top(self, n=10):
+        """Top ``n`` listings by market cap rank."""
+        await self.ensure_fresh()
+        return [self.by_rank[rank] for rank in sorted(self.by_rank)[:n]]
+
+    async def get_by_symbol(self, symbol):
+        """Listing for a ticker symbol (case-insensitive), or None."""
+        await self.ensure_fresh()
+        return self.by_symbol.get(symbol.upper())
+
+    async def get_by_rank(self, rank):
+        """Listing at a market cap rank, or None."""
+        await self.ensure_fresh()
+        return self.by_rank.get(rank)
+
+    async def _refresh(self):
+        try:
+            data = await get_http_client().get_json(
+                COINMARKETCAP_URL,
+                headers={"X-CMC_PRO_API_KEY": self.api_key},
+                params={"start": 1, "limit": self.limit, "convert": self.convert}
+            )
+            listings = data.get("data", [])
+            if not listings:
+                raise ValueError("response has no listings")
+        except Exception as e:
+            # Keep serving the previous snapshot until the next attempt
+            print(f"Error refreshing cryptocurrency listings: {e}")
+            self.failed_at = time.monotonic()
+            return
+
+        by_rank = {}
+        by_symbol = {}
+        for position, listing in enumerate(listings, start=1):
+            rank = listing.get("cmc_rank") or position
+            by_rank[rank] = listing
+        # Symbols are not unique on CoinMarketCap; the highest ranked wins
+        for rank in sorted(by_rank, reverse=True):
+            by_symbol[by_rank[rank]["symbol"].upper()] = by_rank[rank]
+
+        self.by_rank = by_rank
+        self.by_symbol = by_symbol
+        self.updated_at = time.monotonic()
+        self.failed_at = None
+
+_listings = None
+
+def get_listings():
+    """Return the shared listings snapshot, creating it on first use."""
+    global _listings
+    if _listings is None:
+        _listings = ListingsSnapshot()
+    return _listings
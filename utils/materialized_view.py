@@ -0,0 +1,130 @@
+"""
+Materialized Views
+
+A materialized view holds the pre-serialized result of an expensive
+computation (a trend scrape, an analytics rollup). A background job
+rebuilds it; requests are served from the last snapshot without doing any
+of the work, and clients polling with ``If-None-Match`` get a bodiless 304
+while nothing has changed.
+
+The ETag is a digest of the served body alone, so it stays stable across
+refreshes that produce the same result and agrees between worker
+processes. Each process also counts its own snapshot versions; that
+counter is only reported in the X-View-Version header.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Optional
+from datetime import datetime, timezone
+from email.utils import format_datetime
+import asyncio
+import hashlib
+import json
+import logging
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+BuildFunction = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class ViewSnapshot:
+    __slots__ = ('version', 'etag', 'generated_at', 'digest', 'body')
+
+    def __init__(self, version: int, generated_at: datetime, digest: str, body: bytes):
+        self.version = version
+        self.generated_at = generated_at
+        self.digest = digest
+        self.etag = f'"{digest[:16]}"'
+        self.body = body
+
+
+class MaterializedView:
+    """
+    Versioned, pre-serialized snapshot of a JSON payload.
+
+    ``build`` is an async callable returning the payload dict. ``refresh``
+    rebuilds the snapshot (concurrent callers share one build), ``start``
+    refreshes on a fixed interval in the background, and ``respond`` serves
+    the current snapshot with ETag handling. A failed build keeps the
+    previous snapshot.
+    """
+
+    def __init__(self, name: str, build: BuildFunction):
+        self.name = name
+        self.build = build
+        self._snapshot: Optional[ViewSnapshot] = None
+        self._refreshing: Optional[asyncio.Task] = None
+        self._loop_task: Optional[asyncio.Task] = None
+
+    @property
+    def snapshot(self) -> Optional[ViewSnapshot]:
+        return self._snapshot
+
+    async def get(self) -> Optional[ViewSnapshot]:
+        """Current snapshot, building the first one if none exists yet."""
+        if self._snapshot is None:
+            await self.refresh()
+        return self._snapshot
+
+    async def refresh(self) -> Optional[ViewSnapshot]:
+        """Rebuild the snapshot; concurrent callers share one build."""
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.ensure_future(self._rebuild())
+        return await asyncio.shield(self._refreshing)
+
+    async def _rebuild(self) -> Optional[ViewSnapshot]:
+        try:
+            payload = await self.build()
+        except Exception as e:
+            logger.error(f"Error rebuilding view '{self.name}': {str(e)}")
+            return self._snapshot
+
+        body = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        digest = hashlib.sha1(body).hexdigest()
+        current = self._snapshot
+        if current is not None and current.digest == digest:
+            return current
+
+        version = current.version + 1 if current else 1
+        self._snapshot = ViewSnapshot(version, datetime.now(timezone.utc), digest, body)
+        logger.info(f"View '{self.name}' updated to version {version}")
+        return self._snapshot
+
+    def start(self, interval: float):
+        """Refresh now and then every ``interval`` seconds until ``stop``."""
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.create_task(self._refresh_loop(interval))
+
+    async def _refresh_loop(self, interval: float):
+        while True:
+            await self.refresh()
+            await asyncio.sleep(interval)
+
+    def stop(self):
+        if self._loop_task:
+            self._loop_task.cancel()
+            self._loop_task = None
+
+    def respond(self, if_none_match: Optional[str] = None) -> Response:
+        """
+        Serve the current snapshot.
+
+        Returns:
+            304 if ``if_none_match`` matches the snapshot's ETag, 200 with
+            the pre-serialized body otherwise, or 503 if no snapshot exists
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return Response(status_code=503, headers={'Retry-After': '5'})
+
+        headers = {
+            'ETag': snapshot.etag,
+            'Cache-Control': 'no-cache',
+            'Last-Modified': format_datetime(snapshot.generated_at, usegmt=True),
+            'X-View-Version': str(snapshot.version)
+        }
+        if if_none_match:
+            tags = {tag.strip() for tag in if_none_match.split(',')}
+            if '*' in tags or snapshot.etag in tags or f'W/{snapshot.etag}' in tags:
+                return Response(status_code=304, headers=headers)
+        return Response(content=snapshot.body, media_type='application/json', headers=headers)
@@ -0,0 +1,365 @@
+"""
+Incremental Mention Ingestion
+
+Keeps a local, deduplicated store of social mentions so windowed queries
+("mentions of X in the last 24h") are answered from disk instead of by
+re-searching the whole window upstream on every call.
+
+MentionIngestor keeps a per-keyword ``since_id`` high-water mark and only
+asks the source for tweets newer than it. Upstream quota therefore scales
+with new activity rather than with window length times poll frequency.
+
+The first ingestion of a keyword backfills the window the caller is about
+to read, and the span covered is recorded, so a later request for a
+longer window backfills again instead of silently reading a shorter one.
+
+Rows are partitioned by UTC day. Windowed reads use the timestamp index,
+and retention drops whole days at once.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import logging
+import sqlite3
+import threading
+import time
+from .parallel import map_with_timeout
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS mentions (
+    id INTEGER PRIMARY KEY,
+    day TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    text TEXT NOT NULL,
+    user TEXT,
+    retweets INTEGER NOT NULL DEFAULT 0,
+    likes INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_mentions_day ON mentions (day);
+CREATE INDEX IF NOT EXISTS idx_mentions_created_at ON mentions (created_at);
+CREATE TABLE IF NOT EXISTS mention_keywords (
+    mention_id INTEGER NOT NULL,
+    keyword TEXT NOT NULL,
+    PRIMARY KEY (keyword, mention_id)
+);
+CREATE TABLE IF NOT EXISTS cursors (
+    name TEXT PRIMARY KEY,
+    since_id INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    name TEXT PRIMARY KEY,
+    covered_since REAL NOT NULL
+);
+"""
+
+# A mention as produced by a source: id, text, user, created_at (datetime),
+# retweets, likes
+SearchFunction = Callable[[str, Optional[int], datetime], Iterable[Dict]]
+NewMentionsHook = Callable[[str, List[Dict]], None]
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+class MentionStore:
+    """
+    SQLite store of mentions, deduplicated by tweet id.
+
+    A tweet matched by several keywords is stored once and linked to each
+    keyword. Counters (retweets, likes) are updated when a tweet is seen
+    again.
+    """
+
+    def __init__(self, path: str = "data/mentions.db"):
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def add_mentions(self, keyword: str, mentions: List[Dict]) -> int:
+        """
+        Store mentions found for a keyword.
+
+        Returns:
+            Number of tweets not seen before
+        """
+        rows = []
+        for mention in mentions:
+            created_at = _as_utc(mention['created_at'])
+            rows.append((
+                int(mention['id']),
+                created_at.strftime('%Y-%m-%d'),
+                created_at.timestamp(),
+                mention['text'],
+                mention.get('user'),
+                mention.get('retweets', 0),
+                mention.get('likes', 0)
+            ))
+        if not rows:
+            return 0
+
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO mentions (id, day, created_at, text, user, retweets, likes) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            inserted = self._conn.total_changes - before
+            self._conn.executemany(
+                "UPDATE mentions SET retweets = ?, likes = ? WHERE id = ?",
+                [(row[5], row[6], row[0]) for row in rows]
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO mention_keywords (mention_id, keyword) VALUES (?, ?)",
+                [(row[0], keyword) for row in rows]
+            )
+            return inserted
+
+    def get_cursor(self, name: str) -> Optional[int]:
+        with self._lock:
+            row = self._conn.execute("SELECT since_id FROM cursors WHERE name = ?", (name,)).fetchone()
+        return row['since_id'] if row else None
+
+    def set_cursor(self, name: str, since_id: int):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO cursors (name, since_id, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET since_id = MAX(since_id, excluded.since_id), "
+                "updated_at = excluded.updated_at",
+                (name, since_id, time.time())
+            )
+
+    def get_coverage(self, name: str) -> Optional[datetime]:
+        """Time from which every mention for a cursor has been fetched, if known"""
+        with self._lock:
+            row = self._conn.execute("SELECT covered_since FROM coverage WHERE name = ?", (name,)).fetchone()
+        return datetime.fromtimestamp(row['covered_since'], tz=timezone.utc) if row else None
+
+    def set_coverage(self, name: str, since: datetime):
+        """Record a backfill from ``since``; coverage only ever extends"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO coverage (name, covered_since) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET covered_since = MIN(covered_since, excluded.covered_since)",
+                (name, _as_utc(since).timestamp())
+            )
+
+    def keyword_mention_ids(self, keyword: str, ids: Iterable[int]) -> set:
+        """The subset of ``ids`` already stored for a keyword"""
+        ids = list(ids)
+        found = set()
+        with self._lock:
+            # Chunked to stay under SQLite's bound-parameter limit
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                found.update(
+                    row['mention_id'] for row in self._conn.execute(
+                        "SELECT mention_id FROM mention_keywords WHERE keyword = ? AND mention_id IN "
+                        f"({','.join('?' * len(chunk))})",
+                        [keyword, *chunk]
+                    )
+                )
+        return found
+
+    def query(
+        self,
+        since: datetime,
+        keywords: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Mentions created after ``since``, newest first.
+
+        Args:
+            since: Start of the window
+            keywords: Only mentions matched by one of these keywords
+            limit: Maximum number of mentions returned
+        """
+        sql = "SELECT m.* FROM mentions m WHERE m.created_at >= ?"
+        params: list = [_as_utc(since).timestamp()]
+        if keywords is not None:
+            sql += (
+                " AND m.id IN (SELECT mention_id FROM mention_keywords WHERE keyword IN "
+                f"({','.join('?' * len(keywords))}))"
+            )
+            params.extend(keywords)
+        sql += " ORDER BY m.created_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {
+                'id': row['id'],
+                'text': row['text'],
+                'user': row['user'],
+                'created_at': datetime.fromtimestamp(row['created_at'], tz=timezone.utc),
+                'retweets': row['retweets'],
+                'likes': row['likes']
+            }
+            for row in rows
+        ]
+
+    def prune(self, retention: timedelta) -> int:
+        """Drop whole day partitions older than the retention period"""
+        cutoff_day = (datetime.now(timezone.utc) - retention).strftime('%Y-%m-%d')
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM mention_keywords WHERE mention_id IN (SELECT id FROM mentions WHERE day < ?)",
+                (cutoff_day,)
+            )
+            return self._conn.execute("DELETE FROM mentions WHERE day < ?", (cutoff_day,)).rowcount
+
+
+class MentionIngestor:
+    """
+    Pulls only new mentions per keyword into a MentionStore.
+
+    ``search(keyword, since_id, since)`` must return every mention newer
+    than ``since_id`` when given one, paging all the way down to it (the
+    cursor then moves to the newest), otherwise mentions created after
+    ``since`` (a backfill). Cursors are namespaced by ``source`` so different
+    upstreams keep independent high-water marks. ``on_new`` is called with
+    each keyword's mentions that were not stored for it before, e.g. to
+    feed streaming aggregates.
+
+    Keywords are searched concurrently on a bounded thread pool. A keyword
+    whose search exceeds ``keyword_timeout`` is left out of that round; it
+    finishes in the background and its mentions are in the store for the
+    next query. Calls are blocking; run ``ingest`` in a worker thread from
+    async code.
+    """
+
+    def __init__(
+        self,
+        store: MentionStore,
+        search: SearchFunction,
+        source: str,
+        backfill: timedelta = timedelta(hours=24),
+        retention: timedelta = timedelta(days=7),
+        min_interval: float = 60.0,
+        on_new: Optional[NewMentionsHook] = None,
+        max_workers: int = 8,
+        keyword_timeout: float = 30.0
+    ):
+        self.store = store
+        self.on_new = on_new
+        self.search = search
+        self.source = source
+        self.backfill = backfill
+        self.retention = retention
+        self.min_interval = min_interval
+        self.keyword_timeout = keyword_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"ingest-{source}")
+        self._last_run: Dict[str, float] = {}
+        self._running: set = set()
+        self._lock = threading.Lock()
+
+    def ingest(self, keywords: List[str], force: bool = False, window: Optional[timedelta] = None) -> int:
+        """
+        Fetch new mentions for each keyword.
+
+        Keywords ingested less than ``min_interval`` seconds ago are skipped
+        unless ``force`` is set or the store does not cover ``window`` for
+        them yet.
+
+        Args:
+            keywords: Keywords to ingest
+            force: Ingest even keywords polled within ``min_interval``
+            window: Span the caller is about to read. A keyword is
+                backfilled over the longer of this and ``backfill`` (at most
+                ``retention``) unless an earlier backfill already covers it
+
+        Returns:
+            Number of new tweets stored
+        """
+        span = max(self.backfill, window) if window else self.backfill
+        since = datetime.now(timezone.utc) - min(span, self.retention)
+        now = time.monotonic()
+        with self._lock:
+            # Keywords past min_interval are due anyway; forget them so ad-hoc
+            # keywords do not accumulate
+            for keyword, last_run in list(self._last_run.items()):
+                if now - last_run >= self.min_interval:
+                    del self._last_run[keyword]
+            # A keyword still running from an earlier timed-out round is not
+            # searched twice, so its cursor cannot race
+            due = [
+                keyword for keyword in dict.fromkeys(keywords)
+                if keyword not in self._running
+                and (
+                    force
+                    or now - self._last_run.get(keyword, float('-inf')) >= self.min_interval
+                    or not self._covers(keyword, since)
+                )
+            ]
+            self._running.update(due)
+
+        results = map_with_timeout(
+            lambda keyword: self._ingest_keyword(keyword, since),
+            due,
+            self._executor,
+            self.keyword_timeout
+        )
+        self.store.prune(self.retention)
+        return sum(results.values())
+
+    def close(self):
+        """Stop accepting work; searches already running finish in the background"""
+        self._executor.shutdown(wait=False)
+
+    def _ingest_keyword(self, keyword: str, since: datetime) -> int:
+        try:
+            stored = self._fetch_keyword(keyword, since)
+            with self._lock:
+                self._last_run[keyword] = time.monotonic()
+            return stored
+        finally:
+            with self._lock:
+                self._running.discard(keyword)
+
+    def _cursor_name(self, keyword: str) -> str:
+        return f"{self.source}:{keyword}"
+
+    def _covers(self, keyword: str, since: datetime) -> bool:
+        covered_since = self.store.get_coverage(self._cursor_name(keyword))
+        return covered_since is not None and covered_since <= since
+
+    def _fetch_keyword(self, keyword: str, since: datetime) -> int:
+        cursor_name = self._cursor_name(keyword)
+        since_id = self.store.get_cursor(cursor_name)
+        # A first run, or a window reaching past earlier backfills, searches
+        # the whole window; otherwise only tweets after the cursor
+        backfill = since_id is None or not self._covers(keyword, since)
+        mentions = list(self.search(keyword, None if backfill else since_id, since))
+
+        # A backfill overlaps what is stored; only the rest is new
+        seen = self.store.keyword_mention_ids(keyword, (int(m['id']) for m in mentions))
+        new_mentions = [m for m in mentions if int(m['id']) not in seen]
+        stored = self.store.add_mentions(keyword, mentions)
+        if mentions:
+            self.store.set_cursor(cursor_name, max(int(m['id']) for m in mentions))
+        if backfill:
+            self.store.set_coverage(cursor_name, since)
+        if self.on_new and new_mentions:
+            self.on_new(keyword, new_mentions)
+        return stored
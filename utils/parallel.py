@@ -0,0 +1,43 @@
+"""
+Parallel helpers for blocking I/O such as scrapers and SDK calls.
+"""
+
+from typing import Callable, Dict, Hashable, Iterable, TypeVar
+from concurrent.futures import Executor, wait
+import logging
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar('K', bound=Hashable)
+R = TypeVar('R')
+
+
+def map_with_timeout(
+    func: Callable[[K], R],
+    items: Iterable[K],
+    executor: Executor,
+    timeout: float
+) -> Dict[K, R]:
+    """
+    Run ``func`` for each item concurrently and collect what finishes in time.
+
+    Items that raise are logged and left out. Items still running after
+    ``timeout`` seconds are left out too; their threads cannot be
+    interrupted and finish in the background.
+
+    Returns:
+        Results keyed by item, for items that completed successfully
+    """
+    futures = {executor.submit(func, item): item for item in items}
+    done, pending = wait(futures, timeout=timeout)
+
+    results = {}
+    for future in done:
+        item = futures[future]
+        try:
+            results[item] = future.result()
+        except Exception as e:
+            logger.error(f"Error processing '{item}': {str(e)}")
+    for future in pending:
+        logger.warning(f"Timed out after {timeout}s processing '{futures[future]}'")
+    return results
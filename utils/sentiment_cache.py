@@ -0,0 +1,278 @@
+"""
+Sentiment Result Cache
+
+Memoizes sentiment scores by model and normalized text. Retweets and
+overlapping keyword searches return the same text over and over, so a
+repeated text costs a dict lookup instead of another model pass.
+
+Results live in a bounded in-memory LRU in front of a SQLite store that
+survives restarts. Keys are SHA-256 hashes of the model id and the
+normalized text, so the store never holds tweet text itself. Stored rows
+older than ``max_age`` or beyond ``max_disk_entries`` are pruned when the
+cache opens and periodically as results are written.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from collections import OrderedDict
+from datetime import timedelta
+from pathlib import Path
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+_RETWEET_PREFIX = re.compile(r'^RT @\w+:\s*')
+_WHITESPACE = re.compile(r'\s+')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sentiment (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    result TEXT NOT NULL,
+    stored_at REAL NOT NULL DEFAULT 0
+);
+"""
+
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_sentiment_stored_at ON sentiment (stored_at);
+"""
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so retweets and whitespace variants share one cache key."""
+    text = unicodedata.normalize('NFC', text)
+    text = _RETWEET_PREFIX.sub('', text.strip())
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+class SentimentCache:
+    """
+    Two-level sentiment memo for one model.
+
+    Attributes:
+        model_id (str): Model identifier; results of different models never mix
+        max_entries (int): Maximum results kept in memory
+        path (str): SQLite file backing the cache, or None for memory only
+        max_age (timedelta): Stored results older than this are pruned
+        max_disk_entries (int): Maximum results kept in the SQLite store
+        prune_every (int): Prune the store after this many written results
+    """
+
+    def __init__(
+        self,
+        model_id: str,
+        path: Optional[str] = "data/sentiment_cache.db",
+        max_entries: int = 10000,
+        max_age: timedelta = timedelta(days=30),
+        max_disk_entries: int = 1_000_000,
+        prune_every: int = 1000
+    ):
+        self.model_id = model_id
+        self.max_entries = max_entries
+        self.path = path
+        self.max_age = max_age
+        self.max_disk_entries = max_disk_entries
+        self.prune_every = prune_every
+        self._writes_since_prune = 0
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if path:
+            try:
+                if path != ":memory:":
+                    Path(path).parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(path, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn.executescript(SCHEMA)
+                self._migrate()
+                self._conn.executescript(INDEXES)
+            except sqlite3.Error as e:
+                logger.error(f"Sentiment cache store unavailable, using memory only: {str(e)}")
+                self._conn = None
+            else:
+                self.prune()
+
+    def key_for(self, text: str) -> str:
+        normalized = normalize_text(text)
+        return hashlib.sha256(f"{self.model_id}\0{normalized}".encode('utf-8')).hexdigest()
+
+    def get(self, text: str) -> Optional[Any]:
+        """Cached result for a text, or None."""
+        return self.get_many([text])[0]
+
+    def set(self, text: str, result: Any):
+        self.set_many([text], [result])
+
+    def get_many(self, texts: List[str]) -> List[Optional[Any]]:
+        """Cached results for several texts, None where not cached."""
+        keys = [self.key_for(text) for text in texts]
+        results: List[Optional[Any]] = [None] * len(keys)
+        missing: Dict[str, List[int]] = {}
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    results[i] = self._memory[key]
+                    self.hits += 1
+                else:
+                    missing.setdefault(key, []).append(i)
+
+            if missing and self._conn is not None:
+                for key, result in self._load(missing):
+                    self._remember(key, result)
+                    for i in missing.pop(key):
+                        results[i] = result
+                        self.disk_hits += 1
+
+            self.misses += sum(len(positions) for positions in missing.values())
+        return results
+
+    def set_many(self, texts: List[str], results: List[Any]):
+        """Store results for several texts."""
+        rows = [(self.key_for(text), result) for text, result in zip(texts, results)]
+        with self._lock:
+            for key, result in rows:
+                self._remember(key, result)
+            if self._conn is not None:
+                now = time.time()
+                try:
+                    with self._conn:
+                        self._conn.executemany(
+                            "INSERT OR REPLACE INTO sentiment (key, model, result, stored_at) VALUES (?, ?, ?, ?)",
+                            [(key, self.model_id, json.dumps(result), now) for key, result in rows]
+                        )
+                except sqlite3.Error as e:
+                    logger.error(f"Error persisting sentiment results: {str(e)}")
+                else:
+                    self._writes_since_prune += len(rows)
+                    if self._writes_since_prune >= self.prune_every:
+                        self._prune()
+
+    def score(self, text: str, scorer: Callable[[str], Any]) -> Any:
+        """Return the cached result for a text, scoring and storing it on a miss."""
+        result = self.get(text)
+        if result is None:
+            result = scorer(text)
+            self.set(text, result)
+        return result
+
+    def score_many(self, texts: List[str], scorer: Callable[[List[str]], List[Any]]) -> List[Any]:
+        """
+        Batch version of ``score``.
+
+        Only texts missing from the cache are passed to ``scorer``, and
+        duplicates within the batch are scored once.
+        """
+        results = self.get_many(texts)
+        pending: Dict[str, List[int]] = {}
+        for i, result in enumerate(results):
+            if result is None:
+                pending.setdefault(normalize_text(texts[i]), []).append(i)
+        if not pending:
+            return results
+
+        to_score = [texts[positions[0]] for positions in pending.values()]
+        scored = scorer(to_score)
+        self.set_many(to_score, scored)
+        for positions, result in zip(pending.values(), scored):
+            for i in positions:
+                results[i] = result
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            'model': self.model_id,
+            'entries': len(self._memory),
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0
+        }
+
+    def prune(self) -> int:
+        """
+        Drop stored results older than ``max_age`` and, beyond
+        ``max_disk_entries``, the least recently written ones.
+
+        Returns:
+            Number of rows removed
+        """
+        with self._lock:
+            if self._conn is None:
+                return 0
+            return self._prune()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _migrate(self):
+        """Add ``stored_at`` to stores created before pruning existed."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(sentiment)")}
+        if 'stored_at' not in columns:
+            with self._conn:
+                self._conn.execute("ALTER TABLE sentiment ADD COLUMN stored_at REAL NOT NULL DEFAULT 0")
+                # Age unknown; give existing results a full max_age
+                self._conn.execute("UPDATE sentiment SET stored_at = ?", (time.time(),))
+
+    def _prune(self) -> int:
+        """Prune the store. Caller must hold the lock."""
+        self._writes_since_prune = 0
+        try:
+            with self._conn:
+                removed = self._conn.execute(
+                    "DELETE FROM sentiment WHERE stored_at < ?",
+                    (time.time() - self.max_age.total_seconds(),)
+                ).rowcount
+                removed += self._conn.execute(
+                    "DELETE FROM sentiment WHERE key IN "
+                    "(SELECT key FROM sentiment ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_entries,)
+                ).rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Error pruning sentiment cache: {str(e)}")
+            return 0
+        if removed:
+            logger.info(f"Pruned {removed} stored sentiment results")
+        return removed
+
+    def _load(self, keys: Iterable[str]):
+        """Read stored results for keys. Caller must hold the lock."""
+        keys = list(keys)
+        found = []
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            try:
+                rows = self._conn.execute(
+                    f"SELECT key, result FROM sentiment WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+            except sqlite3.Error as e:
+                logger.error(f"Error reading sentiment cache: {str(e)}")
+                return found
+            found.extend((key, json.loads(result)) for key, result in rows)
+        return found
+
+    def _remember(self, key: str, result: Any):
+        """Insert into the memory LRU. Caller must hold the lock."""
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
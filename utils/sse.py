@@ -0,0 +1,46 @@
+"""
+Server-Sent Events helpers.
+
+Endpoints produce ``(event, data)`` pairs from an async generator;
+``sse_response`` serializes each one as soon as it is yielded, so the
+client can render a reply piece by piece instead of waiting for the
+slowest part.
+"""
+
+from typing import Any, AsyncIterator, Tuple
+import json
+import logging
+from starlette.responses import StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+Event = Tuple[str, Any]
+
+
+def format_event(event: str, data: Any) -> str:
+    """One SSE frame with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def _encode(events: AsyncIterator[Event]) -> AsyncIterator[str]:
+    try:
+        async for event, data in events:
+            yield format_event(event, data)
+    except Exception as e:
+        # Headers are already sent; report the failure in-band
+        logger.error(f"Error while streaming events: {str(e)}")
+        yield format_event("error", {"detail": "Error processing request"})
+    yield format_event("done", {})
+
+
+def sse_response(events: AsyncIterator[Event]) -> StreamingResponse:
+    """Stream events as text/event-stream, ending with a ``done`` event."""
+    return StreamingResponse(
+        _encode(events),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Stop reverse proxies from buffering the stream
+            "X-Accel-Buffering": "no"
+        }
+    )
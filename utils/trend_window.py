@@ -0,0 +1,222 @@
+"""
+Streaming Trend Aggregates
+
+Bucketed sliding windows for mention metrics. Each event updates one
+bucket in O(1), and a query sums only the buckets inside the window, so
+trend metrics cost O(buckets) no matter how many tweets were seen.
+
+TrendAggregator keeps two resolutions per keyword: minute buckets for the
+last day and hour buckets for the last week. Each query uses the finest
+tier that covers the requested window. Windows are kept for a bounded
+number of keywords, least recently used first out.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional
+from collections import OrderedDict
+from datetime import datetime, timezone
+import threading
+import time
+
+SENTIMENT_LABELS = ('positive', 'neutral', 'negative')
+
+
+class _Bucket:
+    __slots__ = ('index', 'count', 'engagement', 'positive', 'neutral', 'negative', 'first_ts', 'last_ts')
+
+    def __init__(self, index: int):
+        self.index = index
+        self.count = 0
+        self.engagement = 0
+        self.positive = 0
+        self.neutral = 0
+        self.negative = 0
+        self.first_ts = float('inf')
+        self.last_ts = float('-inf')
+
+
+class BucketedWindow:
+    """
+    Ring buffer of fixed-width time buckets.
+
+    Attributes:
+        bucket_seconds (int): Width of one bucket
+        max_buckets (int): Buckets kept; older events fall out of the ring
+    """
+
+    def __init__(self, bucket_seconds: int = 60, max_buckets: int = 1440):
+        self.bucket_seconds = bucket_seconds
+        self.max_buckets = max_buckets
+        self._ring: List[Optional[_Bucket]] = [None] * max_buckets
+
+    @property
+    def span_seconds(self) -> int:
+        return self.bucket_seconds * self.max_buckets
+
+    def add(self, timestamp: float, engagement: int = 0, sentiment: Optional[str] = None):
+        """Record one event. Events older than the ring are ignored."""
+        index = int(timestamp // self.bucket_seconds)
+        if index <= int(time.time() // self.bucket_seconds) - self.max_buckets:
+            return
+        slot = index % self.max_buckets
+        bucket = self._ring[slot]
+        if bucket is None or bucket.index != index:
+            if bucket is not None and bucket.index > index:
+                # Slot already reused by a newer bucket
+                return
+            bucket = self._ring[slot] = _Bucket(index)
+
+        bucket.count += 1
+        bucket.engagement += engagement
+        if sentiment in SENTIMENT_LABELS:
+            setattr(bucket, sentiment, getattr(bucket, sentiment) + 1)
+        bucket.first_ts = min(bucket.first_ts, timestamp)
+        bucket.last_ts = max(bucket.last_ts, timestamp)
+
+    def query(self, window_seconds: float, now: Optional[float] = None) -> Optional[Dict]:
+        """
+        Aggregate the buckets inside the window ending at ``now``.
+
+        Returns:
+            Dict with mention_count, avg_engagement, mentions_per_hour and
+            sentiment_distribution, or None if the window has no events
+        """
+        now = time.time() if now is None else now
+        newest = int(now // self.bucket_seconds)
+        oldest = int((now - window_seconds) // self.bucket_seconds)
+        oldest = max(oldest, newest - self.max_buckets + 1)
+
+        count = engagement = 0
+        sentiments = dict.fromkeys(SENTIMENT_LABELS, 0)
+        first_ts, last_ts = float('inf'), float('-inf')
+        for index in range(oldest, newest + 1):
+            bucket = self._ring[index % self.max_buckets]
+            if bucket is None or bucket.index != index:
+                continue
+            count += bucket.count
+            engagement += bucket.engagement
+            for label in SENTIMENT_LABELS:
+                sentiments[label] += getattr(bucket, label)
+            first_ts = min(first_ts, bucket.first_ts)
+            last_ts = max(last_ts, bucket.last_ts)
+
+        if not count:
+            return None
+        span_hours = (last_ts - first_ts) / 3600
+        return {
+            'mention_count': count,
+            'avg_engagement': engagement / count,
+            # Rate over the span the mentions actually cover
+            'mentions_per_hour': count / span_hours if span_hours > 0 else float(count),
+            'sentiment_distribution': sentiments
+        }
+
+
+class TrendAggregator:
+    """
+    Per-keyword minute and hour windows fed by a stream of mentions.
+
+    At most ``max_keywords`` keywords keep windows; starting windows for
+    another one drops the least recently used keyword's.
+    """
+
+    def __init__(self, minute_buckets: int = 24 * 60, hour_buckets: int = 7 * 24, max_keywords: int = 256):
+        self.minute_buckets = minute_buckets
+        self.hour_buckets = hour_buckets
+        self.max_keywords = max_keywords
+        self._windows: "OrderedDict[str, List[BucketedWindow]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, keyword: str) -> bool:
+        with self._lock:
+            return keyword in self._windows
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def track(self, keyword: str, seed: Callable[[], Iterable[Dict]]) -> bool:
+        """
+        Give a keyword windows if it has none, filled from ``seed()``.
+
+        The seed runs under the aggregator's lock, so no mention can be
+        added to the new windows before it.
+
+        Returns:
+            True if the keyword was seeded (never tracked, or evicted)
+        """
+        with self._lock:
+            if keyword in self._windows:
+                self._windows.move_to_end(keyword)
+                return False
+            self._record_many(self._windows_for(keyword, create=True), seed())
+            return True
+
+    def add(
+        self,
+        keyword: str,
+        created_at: datetime,
+        engagement: int = 0,
+        sentiment: Optional[str] = None,
+        create: bool = True
+    ):
+        """
+        Record one mention of a keyword.
+
+        Args:
+            create: Start windows for an untracked keyword. When False the
+                mention is dropped; use it when ``track`` will seed the
+                keyword from a store that already holds the mention
+        """
+        with self._lock:
+            windows = self._windows_for(keyword, create)
+            if windows is not None:
+                self._record(windows, created_at, engagement, sentiment)
+
+    def add_many(self, keyword: str, mentions: Iterable[Dict], create: bool = True):
+        """Record mentions shaped like MentionStore rows"""
+        with self._lock:
+            windows = self._windows_for(keyword, create)
+            if windows is not None:
+                self._record_many(windows, mentions)
+
+    def query(self, keyword: str, window_seconds: float) -> Optional[Dict]:
+        """Trend metrics for a keyword over the last ``window_seconds``"""
+        with self._lock:
+            windows = self._windows.get(keyword)
+            if not windows:
+                return None
+            self._windows.move_to_end(keyword)
+            window = next((w for w in windows if w.span_seconds >= window_seconds), windows[-1])
+            return window.query(window_seconds)
+
+    def _windows_for(self, keyword: str, create: bool) -> Optional[List[BucketedWindow]]:
+        windows = self._windows.get(keyword)
+        if windows is not None:
+            self._windows.move_to_end(keyword)
+            return windows
+        if not create:
+            return None
+        windows = self._windows[keyword] = [
+            BucketedWindow(60, self.minute_buckets),
+            BucketedWindow(3600, self.hour_buckets)
+        ]
+        while len(self._windows) > self.max_keywords:
+            self._windows.popitem(last=False)
+        return windows
+
+    @staticmethod
+    def _record(windows: List[BucketedWindow], created_at: datetime, engagement: int, sentiment: Optional[str]):
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        timestamp = created_at.timestamp()
+        for window in windows:
+            window.add(timestamp, engagement, sentiment)
+
+    @classmethod
+    def _record_many(cls, windows: List[BucketedWindow], mentions: Iterable[Dict]):
+        for mention in mentions:
+            cls._record(
+                windows,
+                mention['created_at'],
+                mention.get('likes', 0) + mention.get('retweets', 0),
+                mention.get('sentiment')
+            )